@@ -6,14 +6,22 @@ Migration vers architecture Typer
 
 import sys
 import subprocess
-import os
-from pathlib import Path
 from typing import Optional
 
 import typer
 
 # Import des utilitaires logger
 from gitautoflow.utils.logger import info, success, error, warning, header, console
+from gitautoflow.lib.command_runner import run_command
+from gitautoflow.lib.fetch_coordinator import get_fetch_coordinator
+from gitautoflow.lib.pipeline import Pipeline, Step
+from gitautoflow.lib.ref_index import get_ref_index
+from gitautoflow.lib.secret_rules import scan_working_tree_changes
+from gitautoflow.lib.secret_scan import (
+    ScanCache, find_gitleaks, find_gitleaks_config, get_repo_root, list_modified_files, scan_files
+)
+from gitautoflow.lib.tracing import PROFILE_OPTION, profiled
+from gitautoflow.lib.worktree_guard import take_snapshot
 
 app = typer.Typer(help="Commandes de commit automatique avec IA")
 
@@ -37,83 +45,60 @@ def confirm(message: str) -> bool:
     return response in ['y', 'yes', 'o', 'oui']
 
 
-def run_git_command(command: list, debug: bool = False, **kwargs):
-    """Exécute une commande Git et log si debug activé"""
-    if debug:
-        info(f"[DEBUG] Commande: {' '.join(command)}")
+def report_secret_findings(findings: list) -> None:
+    """Affiche les secrets détectés, regroupés par fichier"""
+    for file_path in dict.fromkeys(finding.file for finding in findings):
+        error(f"🚨 SECRETS DÉTECTÉS dans {file_path}:")
+        for finding in findings:
+            if finding.file == file_path:
+                console.print(f"  ligne {finding.line}: [{finding.rule}] {finding.description} {finding.secret}",
+                              markup=False)
 
-    return subprocess.run(command, **kwargs)
 
+def run_gitleaks_scan_all_modified(debug: bool = False, files: Optional[list] = None) -> bool:
+    """
+    Scan sécurité de TOUS les fichiers modifiés (stagés, non-stagés, untracked)
 
-def run_gitleaks_scan_all_modified(debug: bool = False) -> bool:
-    """Scan sécurité de TOUS les fichiers modifiés (stagés, non-stagés, untracked)"""
+    Args:
+        debug: Mode debug
+        files: Fichiers à scanner, relatifs à la racine (défaut: listés via git status)
+    """
     try:
-        # Trouve le chemin vers gitleaks
-        parent_project = Path(__file__).parent.parent.parent.parent.parent
-        local_gitleaks = parent_project / 'bin' / 'gitleaks'
-        if local_gitleaks.exists():
-            gitleaks_cmd = str(local_gitleaks)
-        else:
-            result = subprocess.run(['which', 'gitleaks'], capture_output=True)
-            if result.returncode != 0:
-                warning("gitleaks non trouvé - scan de sécurité ignoré")
-                return True
-            gitleaks_cmd = 'gitleaks'
-
-        # Récupère TOUS les fichiers modifiés
-        all_files = []
-
-        # 1. Fichiers stagés
-        staged_result = run_git_command(['git', 'diff', '--cached', '--name-only'],
-                                        debug=debug, capture_output=True, text=True, check=False)
-        if staged_result.returncode == 0:
-            all_files.extend([f.strip() for f in staged_result.stdout.strip().split('\n') if f.strip()])
-
-        # 2. Fichiers modifiés non-stagés
-        unstaged_result = run_git_command(['git', 'diff', '--name-only'],
-                                          debug=debug, capture_output=True, text=True, check=False)
-        if unstaged_result.returncode == 0:
-            all_files.extend([f.strip() for f in unstaged_result.stdout.strip().split('\n') if f.strip()])
-
-        # 3. Fichiers untracked
-        untracked_result = run_git_command(['git', 'ls-files', '--others', '--exclude-standard'],
-                                           debug=debug, capture_output=True, text=True, check=False)
-        if untracked_result.returncode == 0:
-            all_files.extend([f.strip() for f in untracked_result.stdout.strip().split('\n') if f.strip()])
-
-        # Supprime les doublons
-        unique_files = list(set(all_files))
-
-        if not unique_files:
+        root = get_repo_root()
+
+        gitleaks_cmd = find_gitleaks()
+        if not gitleaks_cmd:
+            warning("gitleaks non trouvé - scan intégré des lignes ajoutées")
+            findings = scan_working_tree_changes(root)
+            if findings:
+                report_secret_findings(findings)
+                return False
+            return True
+
+        if files is None:
+            files = list_modified_files(root)
+
+        if not files:
             info("Aucun fichier modifié à scanner")
             return True
 
-        info(f"🔍 Scan GitLeaks sur {len(unique_files)} fichier(s) modifié(s)...")
-
-        # Scanner chaque fichier
-        for file_path in unique_files:
-            if not os.path.exists(file_path):
-                continue  # Fichier supprimé, ignoré
-
-            gitleaks_command = [
-                gitleaks_cmd, 'detect',
-                '--no-git',
-                '--source', file_path,
-                '--verbose',
-                '--exit-code', '1'
-            ]
-
-            result = subprocess.run(gitleaks_command, capture_output=True, text=True)
-
-            if result.returncode == 1:
-                error(f"🚨 SECRETS DÉTECTÉS dans {file_path}:")
-                console.print(result.stdout)
-                if result.stderr:
-                    console.print("Détails supplémentaires:")
-                    console.print(result.stderr)
-                return False  # Arrêt immédiat si secret détecté
-            elif result.returncode != 0:
-                warning(f"Erreur gitleaks sur {file_path}: {result.stderr}")
+        config = find_gitleaks_config(root)
+        cache = ScanCache(gitleaks_cmd, config, root)
+        to_scan = cache.pending(files, root)
+        if len(to_scan) < len(files):
+            info(f"♻️ {len(files) - len(to_scan)} fichier(s) inchangé(s) déjà vérifié(s) (cache)")
+        if not to_scan:
+            return True
+
+        info(f"🔍 Scan GitLeaks sur {len(to_scan)} fichier(s) modifié(s)...")
+
+        try:
+            findings = scan_files(gitleaks_cmd, to_scan, root, config=config, on_clean=cache.mark_clean)
+        finally:
+            cache.save()
+        if findings:
+            report_secret_findings(findings)
+            return False  # Arrêt immédiat si secret détecté
 
         return True  # Aucun secret détecté
 
@@ -183,16 +168,16 @@ def run_git_commit(commit_data: dict, force: bool = False, debug: bool = False)
         if body:
             full_msg += f"\n\n{body}"
 
-        run_git_command(['git', 'commit', '-m', full_msg], debug=debug, check=True)
+        run_command(['git', 'commit', '-m', full_msg], check=True)
         success("Commit effectué avec succès!")
 
         # Push automatique vers la branche distante
         try:
-            current_branch = run_git_command(['git', 'branch', '--show-current'],
-                                             debug=debug, capture_output=True, text=True, check=True).stdout.strip()
+            current_branch = run_command(['git', 'branch', '--show-current'],
+                                         capture_output=True, text=True, check=True).stdout.strip()
             info(f"📤 Push vers origin/{current_branch}...")
 
-            run_git_command(['git', 'push', 'origin', current_branch], debug=debug, check=True)
+            run_command(['git', 'push', 'origin', current_branch], check=True)
             success("Push effectué avec succès!")
         except subprocess.CalledProcessError as e:
             warning(f"Push échoué: {e}")
@@ -203,10 +188,56 @@ def run_git_commit(commit_data: dict, force: bool = False, debug: bool = False)
         raise typer.Exit(1)
 
 
+def sync_with_base_branch(current_branch: str, base_branch: str, GitUtils, debug: bool = False) -> bool:
+    """
+    Rebase la branche courante sur origin/<base_branch> si elle est en retard
+
+    Returns:
+        True si un rebase a été effectué (le working tree a pu changer)
+    """
+    if current_branch == base_branch:
+        info(f"ℹ️  Déjà sur {base_branch}, pas de rebase nécessaire")
+        return False
+
+    try:
+        # Check si la branche est déjà à jour (origin/<base> vient d'être fetché)
+        behind_check = run_command(['git', 'rev-list', '--count', f'HEAD..origin/{base_branch}'],
+                                   capture_output=True, text=True, check=True)
+        behind_count = int(behind_check.stdout.strip())
+
+        if behind_count == 0:
+            success(f"Branche déjà à jour avec {base_branch}")
+            return False
+
+        info(f"🔄 Branche en retard de {behind_count} commits, rebase nécessaire...")
+
+        # Preflight: estime les conflits sans toucher au working tree (merge à 3 points, pas un rejeu du rebase)
+        conflicts = GitUtils.predict_rebase_conflicts(base_branch)
+        if conflicts:
+            warning(f"Conflits probables avec origin/{base_branch} sur {len(conflicts)} fichier(s):")
+            for file_path in conflicts:
+                console.print(f"  ⚔️  {file_path}", markup=False)
+            warning(f"Résolvez-les avec 'git rebase origin/{base_branch}' puis relancez la commande")
+            raise typer.Exit(1)
+
+        # --autostash met de côté les changements (stagés ou non) le temps du rebase
+        info(f"🔄 Rebase {current_branch} sur {base_branch}...")
+        GitUtils.rebase_on_target(base_branch, autostash=True)
+        success("Rebase réussi")
+        return True
+
+    except subprocess.CalledProcessError as e:
+        error(f"Erreur lors de la vérification de {base_branch}: {e}")
+        info("ℹ️  Continuons sans rebase...")
+        return False
+
+
 @app.command()
+@profiled("auto-commit")
 def auto_commit(
     force: bool = typer.Option(False, "--force", "-f", help="Force le commit sans demander confirmation"),
-    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes Git exécutées")
+    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes Git exécutées"),
+    profile: Optional[str] = PROFILE_OPTION
 ):
     """Commit automatique avec rebase + IA"""
 
@@ -221,105 +252,70 @@ def auto_commit(
         error("Pas dans un repository Git")
         raise typer.Exit(1)
 
-    try:
-        header("🤖 Git Auto-Commit avec IA")
-
-        if force:
-            info("⚡ MODE FORCE ACTIVÉ")
-
-        # 1. Rebase automatique (seulement si pas sur branche de base)
+    # Étapes du pipeline: le fetch, le garde-fou de taille et l'initialisation IA
+    # sont indépendants et tournent en parallèle; le rebase attend le fetch et le
+    # garde-fou, le scan sécurité attend le rebase (il voit le working tree tel
+    # qu'il sera stagé) et le staging attend le scan. La confirmation et
+    # le commit restent sur le thread principal, après le pipeline (saisie
+    # interactive et Ctrl+C hors des workers).
+    def resolve_branches():
         info("🔄 Étape 1: Synchronisation avec develop...")
-        current_branch = run_git_command(['git', 'branch', '--show-current'],
-                                         debug=debug, capture_output=True, text=True, check=True).stdout.strip()
+        # Branche courante et branche de base lues dans l'index des refs (un seul for-each-ref)
+        ref_index = get_ref_index()
+        current_branch = ref_index.current_branch
 
         # Déterminer la branche de base
         base_branch = "develop"
-        try:
-            run_git_command(['git', 'show-ref', '--verify', '--quiet', 'refs/heads/develop'],
-                            debug=debug, check=True, capture_output=True)
-        except subprocess.CalledProcessError:
+        if not ref_index.has_branch('develop'):
             # develop n'existe pas, utiliser main
             base_branch = "main"
             info("ℹ️  Branche develop non trouvée, utilisation de main")
 
-        # Rebase seulement si on n'est PAS sur la branche de base
+        return {'current_branch': current_branch, 'base_branch': base_branch}
+
+    def fetch_base(current_branch, base_branch):
+        # Fetch seulement si origin/<base> a bougé (rebase_on_target réutilisera ce fetch)
         if current_branch != base_branch:
             info(f"📥 Synchronisation avec {base_branch}...")
-
             try:
-                # Fetch pour avoir les dernières infos
-                run_git_command(['git', 'fetch', 'origin', base_branch], debug=debug, capture_output=True, check=True)
-
-                # Check si la branche est déjà à jour
-                behind_check = run_git_command(['git', 'rev-list', '--count', f'HEAD..origin/{base_branch}'],
-                                               debug=debug, capture_output=True, text=True, check=True)
-                behind_count = int(behind_check.stdout.strip())
-
-                if behind_count == 0:
-                    success(f"Branche déjà à jour avec {base_branch}")
-                else:
-                    info(f"🔄 Branche en retard de {behind_count} commits, rebase nécessaire...")
-
-                    # Vérifie s'il y a des changements stagés
-                    has_staged = GitUtils.has_staged_changes()
-
-                    if has_staged:
-                        info("📦 Sauvegarde des changements stagés...")
-                        try:
-                            run_git_command(['git', 'stash', 'push', '--staged', '-m', 'Auto-stash for rebase'],
-                                            debug=debug, check=True, capture_output=True)
-                            success("Changements sauvegardés")
-                        except subprocess.CalledProcessError as e:
-                            error(f"Erreur lors de la sauvegarde: {e}")
-                            raise typer.Exit(1)
-
-                    info(f"🔄 Rebase {current_branch} sur {base_branch}...")
-                    if GitUtils.rebase_on_target(base_branch):
-                        success("Rebase réussi")
-
-                        # Restore les changements stagés si nécessaire
-                        if has_staged:
-                            info("📦 Restauration des changements...")
-                            try:
-                                run_git_command(['git', 'stash', 'pop'], debug=debug, check=True, capture_output=True)
-                                success("Changements restaurés")
-                            except subprocess.CalledProcessError as e:
-                                error(f"Erreur lors de la restauration: {e}")
-                                info("💡 Vérifiez avec 'git stash list' et 'git stash pop' manuellement")
-                                raise typer.Exit(1)
-                    else:
-                        # Si le rebase échoue, on essaie de restaurer les changements
-                        if has_staged:
-                            info("🔄 Tentative de restauration des changements après échec...")
-                            try:
-                                run_git_command(['git', 'stash', 'pop'], debug=debug, check=True, capture_output=True)
-                                success("Changements restaurés")
-                            except subprocess.CalledProcessError:
-                                warning("Changements en stash - utilisez 'git stash pop' après résolution")
-
-                        warning("Conflits détectés ! Résolvez-les puis relancez la commande")
-                        raise typer.Exit(1)
-
+                get_fetch_coordinator().fetch(base_branch, preflight=True)
             except subprocess.CalledProcessError as e:
-                error(f"Erreur lors de la vérification de {base_branch}: {e}")
-                info("ℹ️  Continuons sans rebase...")
-        else:
-            info(f"ℹ️  Déjà sur {base_branch}, pas de rebase nécessaire")
+                warning(f"Fetch de {base_branch} échoué: {e}")
+
+    def rebase(current_branch, base_branch):
+        rebased = sync_with_base_branch(current_branch, base_branch, GitUtils, debug=debug)
+        return {'rebased': rebased}
+
+    def guard():
+        # Budgets vérifiés sur le snapshot avant tout scan ou git add
+        snapshot = take_snapshot(get_repo_root())
+        if not snapshot.ok:
+            error("Working tree trop volumineux - scan et staging annulés")
+            for line in snapshot.summary_lines():
+                console.print(line, markup=False)
+            info("💡 Ajoutez ces répertoires au .gitignore ou ajustez GITAUTOFLOW_MAX_FILES, "
+                 "GITAUTOFLOW_MAX_TOTAL_BYTES, GITAUTOFLOW_MAX_FILE_BYTES (0 = illimité)")
+            raise typer.Exit(1)
+        return {'snapshot': snapshot}
 
-        # 2. Scan sécurité UNIQUE de tous les fichiers modifiés
+    def scan(snapshot, rebased):
+        # Scan sécurité UNIQUE de tous les fichiers modifiés
         info("🔄 Étape 2: Scan sécurité...")
         info("🔒 Scan sécurité des fichiers modifiés...")
-        if not run_gitleaks_scan_all_modified(debug=debug):
+        # Après un rebase (autostash réappliqué) la liste des fichiers modifiés est relue
+        files = None if rebased else snapshot.files
+        if not run_gitleaks_scan_all_modified(debug=debug, files=files):
             error("Secrets détectés - commit bloqué pour votre protection!")
             raise typer.Exit(1)
         success("Aucun secret détecté")
 
-        # 3. Stage automatique (maintenant sécurisé car pré-scanné)
+    def stage():
+        # Stage automatique (maintenant sécurisé car pré-scanné)
         info("🔄 Étape 3: Staging des fichiers...")
         info("📁 git add . automatique...")
 
         try:
-            run_git_command(['git', 'add', '.'], debug=debug, check=True, capture_output=True)
+            run_command(['git', 'add', '.'], check=True, capture_output=True)
             success("Fichiers stagés avec succès")
         except subprocess.CalledProcessError as e:
             error(f"Erreur git add: {e}")
@@ -330,24 +326,47 @@ def auto_commit(
             error("Aucun changement à commiter")
             raise typer.Exit(1)
 
-        # 4. Initialise le gestionnaire multi-IA
+    def init_ai():
+        # Initialise le gestionnaire multi-IA et prépare le client principal
         info("🔄 Étape 4: Initialisation IA...")
         ai = AIProvider()
+        ai.prepare_clients()
         console.print(ai.get_status())
+        return {'ai': ai}
 
-        # 5. Récupère les changements
+    def collect_changes():
         info("🔄 Étape 5: Analyse des changements...")
         info("🔍 Analyse des changements...")
-        diff = GitUtils.get_staged_diff()
-        files = GitUtils.get_staged_files()
+        return {'diff': GitUtils.get_staged_diff(), 'files': GitUtils.get_staged_files()}
 
-        # 6. Analyse avec IA (fallback automatique)
+    def generate(ai, diff, files):
+        # Analyse avec IA (fallback automatique)
         info("🔄 Étape 6: Génération du commit...")
-        commit_data = ai.analyze_for_commit(diff, files)
+        return {'commit_data': ai.analyze_for_commit(diff, files)}
+
+    pipeline = Pipeline([
+        Step('branches', resolve_branches, outputs=('current_branch', 'base_branch')),
+        Step('fetch', fetch_base, inputs=('current_branch', 'base_branch')),
+        Step('guard', guard, outputs=('snapshot',)),
+        Step('ai_init', init_ai, outputs=('ai',)),
+        Step('rebase', rebase, inputs=('current_branch', 'base_branch'), outputs=('rebased',),
+             after=('fetch', 'guard')),
+        Step('scan', scan, inputs=('snapshot', 'rebased')),
+        Step('stage', stage, after=('scan',)),
+        Step('changes', collect_changes, outputs=('diff', 'files'), after=('stage',)),
+        Step('generate', generate, inputs=('ai', 'diff', 'files'), outputs=('commit_data',)),
+    ])
+
+    try:
+        header("🤖 Git Auto-Commit avec IA")
+
+        if force:
+            info("⚡ MODE FORCE ACTIVÉ")
+
+        context = pipeline.run()
 
-        # 7. Execute le commit
         info("🔄 Étape 7: Commit et push...")
-        run_git_commit(commit_data, force=force, debug=debug)
+        run_git_commit(context['commit_data'], force=force, debug=debug)
 
         success("🎉 Processus terminé avec succès!")
 
@@ -360,16 +379,20 @@ def auto_commit(
     except Exception as e:
         error(f"Erreur inattendue: {e}")
         raise typer.Exit(1)
+    finally:
+        if debug:
+            console.print(pipeline.timings_table())
 
 
 # Alias pour la commande courte
 @app.command(name="ac")
 def auto_commit_short(
     force: bool = typer.Option(False, "--force", "-f", help="Force le commit sans demander confirmation"),
-    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes Git exécutées")
+    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes Git exécutées"),
+    profile: Optional[str] = PROFILE_OPTION
 ):
     """Alias court pour auto-commit"""
-    auto_commit(force=force, debug=debug)
+    auto_commit(force=force, debug=debug, profile=profile)
 
 
 if __name__ == "__main__":
@@ -4,49 +4,42 @@ Git Auto-Flow - Gestion des feature branches
 Migration vers architecture Typer
 """
 
-import sys
 import subprocess
-from pathlib import Path
+from typing import Optional
 
 import typer
 
 # Import des utilitaires logger
 from gitautoflow.utils.logger import info, success, error, warning, header
+from gitautoflow.lib import command_runner
+from gitautoflow.lib.debug_logger import set_global_debug_mode
+from gitautoflow.lib.ref_index import get_ref_index
+from gitautoflow.lib.tracing import PROFILE_OPTION, profiled
 
 app = typer.Typer(help="Gestion des feature branches GitFlow")
 
-# Import des modules lib (chemin relatif au projet parent)
+# Import des modules lib depuis le package gitautoflow
 def import_lib_modules():
-    """Import dynamique des modules lib du projet parent"""
+    """Import dynamique des modules lib du package gitautoflow"""
     try:
-        # Chemin vers le projet parent
-        parent_lib = Path(__file__).parent.parent.parent / "lib"
-        if parent_lib.exists():
-            sys.path.insert(0, str(parent_lib))
+        from gitautoflow.lib.ai_provider import AIProvider
+        from gitautoflow.lib.git_utils import GitUtils
+        from gitautoflow.lib.debug_logger import debug_command, set_global_debug_mode
 
-            from ai_provider import AIProvider
-            from git_utils import GitUtils
-            from debug_logger import debug_command, set_global_debug_mode
-
-            return AIProvider, GitUtils, debug_command, set_global_debug_mode
-        else:
-            error(f"Module lib non trouvé dans: {parent_lib}")
-            raise typer.Exit(1)
+        return AIProvider, GitUtils, debug_command, set_global_debug_mode
     except ImportError as e:
         error(f"Impossible d'importer les modules lib: {e}")
         raise typer.Exit(1)
 
 
-def run_command(command: list, description: str = "", debug: bool = False):
+def run_command(command: list, description: str = ""):
     """Exécute une commande Git et gère les erreurs"""
     try:
-        if debug:
-            info(f"[DEBUG] Commande: {' '.join(command)}")
-
         if description:
             info(description)
 
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
+        result = command_runner.run_command(command, description=description,
+                                            capture_output=True, text=True, check=True)
 
         # Log la sortie si elle existe et n'est pas vide
         if result.stdout and result.stdout.strip():
@@ -69,8 +62,8 @@ def run_command(command: list, description: str = "", debug: bool = False):
 def check_git_repository():
     """Vérifie qu'on est dans un repository Git"""
     try:
-        subprocess.run(['git', 'rev-parse', '--git-dir'],
-                      capture_output=True, check=True)
+        command_runner.run_command(['git', 'rev-parse', '--git-dir'],
+                                  capture_output=True, check=True)
         return True
     except subprocess.CalledProcessError:
         error("Pas dans un repository Git")
@@ -80,8 +73,8 @@ def check_git_repository():
 def get_current_branch():
     """Récupère la branche courante"""
     try:
-        result = subprocess.run(['git', 'branch', '--show-current'],
-                              capture_output=True, text=True, check=True)
+        result = command_runner.run_command(['git', 'branch', '--show-current'],
+                                          capture_output=True, text=True, check=True)
         return result.stdout.strip()
     except subprocess.CalledProcessError:
         error("Impossible de déterminer la branche courante")
@@ -89,27 +82,23 @@ def get_current_branch():
 
 
 def branch_exists(branch_name: str, remote: bool = False) -> bool:
-    """Vérifie si une branche existe"""
-    try:
-        if remote:
-            cmd = ['git', 'show-ref', '--verify', '--quiet', f'refs/remotes/origin/{branch_name}']
-        else:
-            cmd = ['git', 'show-ref', '--verify', '--quiet', f'refs/heads/{branch_name}']
-
-        result = subprocess.run(cmd, capture_output=True)
-        return result.returncode == 0
-    except:
-        return False
+    """Vérifie si une branche existe (index des refs chargé une seule fois)"""
+    index = get_ref_index()
+    return index.has_remote_branch(branch_name) if remote else index.has_branch(branch_name)
 
 
 @app.command()
+@profiled("feature-start")
 def start(
     feature_name: str = typer.Argument(..., help="Nom de la feature à créer"),
     base: str = typer.Option("develop", "--base", "-b", help="Branche de base (défaut: develop)"),
     force: bool = typer.Option(False, "--force", "-f", help="Forcer la création même si la branche existe"),
-    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes Git exécutées")
+    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes Git exécutées"),
+    profile: Optional[str] = PROFILE_OPTION
 ):
     """Démarre une nouvelle feature branch selon GitFlow"""
+    # Configuration du mode debug global
+    set_global_debug_mode(debug)
 
     # Vérification prérequis
     check_git_repository()
@@ -143,7 +132,7 @@ def start(
             try:
                 # Supprimer la branche locale si elle existe
                 run_command(['git', 'branch', '-D', feature_branch],
-                           f"Suppression de la branche locale {feature_branch}", debug=debug)
+                           f"Suppression de la branche locale {feature_branch}")
             except:
                 pass  # La branche n'existe peut-être pas localement
 
@@ -153,18 +142,18 @@ def start(
         current_branch = get_current_branch()
         if current_branch != base:
             run_command(['git', 'checkout', base],
-                       f"Basculement sur {base}", debug=debug)
+                       f"Basculement sur {base}")
 
         run_command(['git', 'pull', 'origin', base],
-                   f"Mise à jour de {base} depuis origin", debug=debug)
+                   f"Mise à jour de {base} depuis origin")
 
         # 2. Créer la feature branch
         run_command(['git', 'checkout', '-b', feature_branch],
-                   f"Création de la branche {feature_branch}", debug=debug)
+                   f"Création de la branche {feature_branch}")
 
         # 3. Pousser la branche vers origin
         run_command(['git', 'push', '-u', 'origin', feature_branch],
-                   f"Push initial de {feature_branch}", debug=debug)
+                   f"Push initial de {feature_branch}")
 
         success(f"Feature branch créée: {feature_branch}")
         success(f"Branche trackée sur origin")
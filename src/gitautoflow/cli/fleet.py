@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Git Auto-Flow - Mode fleet: une commande sur plusieurs repositories
+"""
+
+import glob
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional
+
+import typer
+from rich.table import Table
+
+# Import des utilitaires logger
+from gitautoflow.utils.logger import info, success, error, warning, header, console
+from gitautoflow.lib.command_runner import run_command
+from gitautoflow.lib.rate_limit import AI_RATE_ENV, AI_RATE_FILE_ENV
+
+app = typer.Typer(help="Exécution d'une commande sur une flotte de repositories")
+
+# Commandes supportées -> argv de la sous-commande (mode non-interactif)
+FLEET_COMMANDS = {
+    'ac': ['ac', '--force'],
+    'pr': ['pr', '--force'],
+    'next-version': ['release', 'next-version'],
+}
+
+
+def resolve_repositories(manifest: Optional[str], patterns: List[str]) -> List[str]:
+    """
+    Construit la liste des repositories depuis un manifest et/ou des globs
+
+    Args:
+        manifest: Fichier texte (un chemin ou glob par ligne, # pour les commentaires)
+        patterns: Globs passés en ligne de commande
+
+    Returns:
+        list: Chemins absolus des repositories Git trouvés (sans doublons)
+    """
+    entries = list(patterns)
+    if manifest:
+        base_dir = os.path.dirname(os.path.abspath(manifest))
+        with open(manifest, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.split('#', 1)[0].strip()
+                if line:
+                    entries.append(line if os.path.isabs(os.path.expanduser(line))
+                                   else os.path.join(base_dir, line))
+
+    repositories = []
+    for entry in entries:
+        for path in sorted(glob.glob(os.path.expanduser(entry))):
+            if os.path.isdir(path) and os.path.exists(os.path.join(path, '.git')):
+                repositories.append(os.path.abspath(path))
+    return list(dict.fromkeys(repositories))
+
+
+def _self_command() -> List[str]:
+    """Commande pour relancer gitautoflow (binaire compilé ou module Python)"""
+    if getattr(sys, 'frozen', False) or '__compiled__' in globals():
+        return [sys.argv[0]]
+    return [sys.executable, '-m', 'gitautoflow.cli.main']
+
+
+def _github_token() -> Optional[str]:
+    """Token GitHub partagé par tous les processus (évite une résolution d'auth par repo)"""
+    token = os.getenv('GITHUB_TOKEN') or os.getenv('GH_TOKEN')
+    if token:
+        return token
+    try:
+        result = run_command(['gh', 'auth', 'token'], description="token GitHub partagé",
+                             capture_output=True, text=True)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() if result.returncode == 0 and result.stdout.strip() else None
+
+
+def _last_line(output: str) -> str:
+    lines = [line.strip() for line in output.splitlines() if line.strip()]
+    return lines[-1] if lines else ''
+
+
+class FleetResult:
+    """Résultat de la commande sur un repository"""
+
+    def __init__(self, repository: str, returncode: int, duration: float, output: str, errors: str = ''):
+        self.repository = repository
+        self.returncode = returncode
+        self.duration = duration
+        self.output = output
+        self.errors = errors
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0
+
+    @property
+    def summary(self) -> str:
+        # Dernière ligne de stdout (résultat de la commande), sinon de stderr
+        return _last_line(self.output) or _last_line(self.errors)
+
+
+def run_in_repository(repository: str, argv: List[str], env: dict) -> FleetResult:
+    """Lance la commande dans un processus dédié, dans le repository"""
+    start = time.perf_counter()
+    try:
+        result = run_command(argv, description=f"fleet: {os.path.basename(repository)}",
+                             cwd=repository, env=env, capture_output=True, text=True,
+                             stdin=subprocess.DEVNULL)  # Aucune confirmation interactive possible
+        output, errors, returncode = result.stdout, result.stderr, result.returncode
+    except Exception as e:
+        output, errors, returncode = '', str(e), 1
+    return FleetResult(repository, returncode, time.perf_counter() - start, output, errors)
+
+
+@app.command()
+def run(
+    command: str = typer.Argument(..., help=f"Commande à lancer ({', '.join(FLEET_COMMANDS)})"),
+    patterns: Optional[List[str]] = typer.Argument(None, help="Chemins ou globs des repositories (ex: '~/services/*')"),
+    manifest: Optional[str] = typer.Option(None, "--manifest", "-m", help="Fichier listant les repositories (un chemin ou glob par ligne)"),
+    jobs: int = typer.Option(min(8, os.cpu_count() or 4), "--jobs", "-j", help="Nombre de repositories traités en parallèle"),
+    ai_rate: float = typer.Option(30.0, "--ai-rate", help="Quota IA partagé par toute la flotte (requêtes/minute, 0 = illimité)"),
+    debug: bool = typer.Option(False, "--debug", help="Passe --debug aux commandes et affiche la sortie des échecs en entier")
+):
+    """Lance ac, pr ou next-version sur chaque repository de la flotte"""
+    if command not in FLEET_COMMANDS:
+        error(f"Commande non supportée: {command}")
+        info(f"Commandes disponibles: {', '.join(FLEET_COMMANDS)}")
+        raise typer.Exit(1)
+
+    repositories = resolve_repositories(manifest, patterns or [])
+    if not repositories:
+        error("Aucun repository Git trouvé (vérifiez le manifest ou les globs)")
+        raise typer.Exit(1)
+
+    header(f"🚢 Fleet: {command} sur {len(repositories)} repositories ({jobs} en parallèle)")
+
+    argv = _self_command() + FLEET_COMMANDS[command] + (['--debug'] if debug else [])
+    results: List[FleetResult] = []
+
+    with tempfile.TemporaryDirectory(prefix='gitautoflow-fleet-') as state_dir:
+        # Environnement partagé: quota IA commun (fichier verrouillé) et session GitHub unique
+        env = dict(os.environ)
+        if ai_rate > 0:
+            env[AI_RATE_ENV] = str(ai_rate)
+            env[AI_RATE_FILE_ENV] = os.path.join(state_dir, 'ai-quota.json')
+        token = _github_token()
+        if token:
+            env['GITHUB_TOKEN'] = token
+        else:
+            warning("Aucun token GitHub trouvé - chaque repository utilisera sa propre authentification gh")
+
+        with ThreadPoolExecutor(max_workers=max(1, jobs), thread_name_prefix="fleet") as executor:
+            futures = {executor.submit(run_in_repository, repository, argv, env): repository
+                       for repository in repositories}
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                name = os.path.basename(result.repository)
+                progress = f"[{len(results)}/{len(repositories)}]"
+                if result.ok:
+                    console.print(f"✅ {progress} {name} ({result.duration:.1f}s) {result.summary}", markup=False)
+                else:
+                    console.print(f"❌ {progress} {name} ({result.duration:.1f}s) {result.summary}", markup=False)
+                    if debug:
+                        console.print(result.output + result.errors, markup=False)
+
+    table = Table(title=f"🚢 Résultats fleet: {command}")
+    table.add_column("Repository")
+    table.add_column("Statut")
+    table.add_column("Durée", justify="right")
+    table.add_column("Résumé")
+    for result in sorted(results, key=lambda r: (r.ok, r.repository)):
+        table.add_row(
+            os.path.relpath(result.repository),
+            "✅" if result.ok else f"❌ ({result.returncode})",
+            f"{result.duration:.1f} s",
+            result.summary[:80]
+        )
+    console.print(table)
+
+    failures = [result for result in results if not result.ok]
+    if failures:
+        error(f"{len(failures)}/{len(results)} repositories en échec")
+        raise typer.Exit(1)
+    success(f"{len(results)} repositories traités avec succès")
+
+
+if __name__ == "__main__":
+    app()
@@ -4,39 +4,28 @@ Git Auto-Flow - Gestion automatique des issues GitHub
 Migration de git-create-tickets.py vers architecture Typer
 """
 
-import os
-import sys
 import json
-import subprocess
-import time
-import requests
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Optional
 
 import typer
 
 # Import des utilitaires logger
 from gitautoflow.utils.logger import info, success, error, warning, header, console
+from gitautoflow.core.github import GitHubError, check_github_access, get_github_client, map_bounded
+from gitautoflow.lib.tracing import PROFILE_OPTION, profiled
 
 app = typer.Typer(help="Commandes de gestion des issues GitHub")
 
-# Import des modules lib (chemin relatif au projet parent)
+# Import des modules lib depuis le package gitautoflow
 def import_lib_modules():
-    """Import dynamique des modules lib du projet parent"""
+    """Import dynamique des modules lib du package gitautoflow"""
     try:
-        # Chemin vers le projet parent
-        parent_lib = Path(__file__).parent.parent.parent / "lib"
-        if parent_lib.exists():
-            sys.path.insert(0, str(parent_lib))
+        from gitautoflow.lib.ai_provider import AIProvider
+        from gitautoflow.lib.git_utils import GitUtils
+        from gitautoflow.lib.debug_logger import debug_command, set_global_debug_mode
 
-            from ai_provider import AIProvider
-            from git_utils import GitUtils
-            from debug_logger import debug_command, set_global_debug_mode
-
-            return AIProvider, GitUtils, debug_command, set_global_debug_mode
-        else:
-            error(f"Module lib non trouvé dans: {parent_lib}")
-            raise typer.Exit(1)
+        return AIProvider, GitUtils, debug_command, set_global_debug_mode
     except ImportError as e:
         error(f"Impossible d'importer les modules lib: {e}")
         raise typer.Exit(1)
@@ -68,64 +57,61 @@ class GitCreateTickets:
         self.GitUtils = GitUtils
         self.ai = AIProvider()
         self.repo_full_name = repo_full_name
-        self._github_labels_cache = None
+        self._github_labels_cache: Optional[Dict[str, str]] = None
+        self._repository_id: Optional[str] = None
+        self._labels_unavailable = False
+
+        # Client GitHub partagé: token résolu une seule fois, connexions réutilisées
+        self.github = get_github_client()
         self.validate_requirements()
 
-        # Initialisation centralisée du token et des headers
-        self.token = os.getenv("GITHUB_TOKEN")
-        if not self.token:
-            result = subprocess.run(['gh', 'auth', 'token'], capture_output=True, text=True)
-            self.token = result.stdout.strip()
-
-        self.headers = {
-            'Authorization': f'token {self.token}',
-            'Accept': 'application/vnd.github+json',
-            'X-GitHub-Api-Version': '2022-11-28'
-        }
-
-    def _get_github_labels(self) -> List[str]:
-        """Récupère et cache la liste des labels GitHub existants pour le repo cible."""
-        if self._github_labels_cache is None:
+    def _get_repository_id(self) -> Optional[str]:
+        """Récupère et cache l'ID GraphQL du repo cible (None si échec)."""
+        if self._repository_id is None:
             try:
-                repo_arg = ['--repo', self._get_current_repo()] if self._get_current_repo() else []
-                cmd = ['gh', 'label', 'list', *repo_arg, '--json', 'name', '--jq', '.[].name']
-                self.debug_command(cmd, "get github labels")
-                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-                self._github_labels_cache = result.stdout.strip().split('\n') if result.stdout else []
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                self._github_labels_cache = []
+                self._repository_id = self.github.get_repo(self._get_current_repo())['node_id']
+            except GitHubError as e:
+                self.debug_command([], f"Error getting repository id: {e}")
+        return self._repository_id
+
+    def _get_github_labels(self) -> Optional[Dict[str, str]]:
+        """Récupère et cache les labels du repo cible (nom -> ID GraphQL), None s'ils sont indisponibles."""
+        if self._github_labels_cache is None and not self._labels_unavailable:
+            try:
+                self._github_labels_cache = self.github.get_label_ids(self._get_current_repo())
+            except GitHubError as e:
+                warning(f"Impossible de récupérer les labels du repo, issues créées sans labels: {e}")
+                self._labels_unavailable = True
         return self._github_labels_cache
 
-    def _ensure_label_exists(self, label_name: str, color: str = "0969da") -> bool:
-        """Crée le label s'il n'existe pas dans le repo cible. Retourne True si succès."""
-        if self._github_labels_cache is None:
-            self._get_github_labels()
+    def _ensure_label_exists(self, label_name: str, color: str = "0969da") -> Optional[str]:
+        """Crée le label s'il n'existe pas dans le repo cible. Retourne son ID GraphQL (None si échec)."""
+        labels = self._get_github_labels()
+        if labels is None:
+            return None
 
-        if label_name in self._github_labels_cache:
-            return True
+        if label_name in labels:
+            return labels[label_name]
 
         info(f"Label '{label_name}' non trouvé, tentative de création...")
         try:
-            repo_arg = ['--repo', self._get_current_repo()] if self._get_current_repo() else []
-            cmd = ['gh', 'label', 'create', label_name, '--color', color, *repo_arg]
-            self.debug_command(cmd, f"create label {label_name}")
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            if result.returncode == 0:
-                success(f"Label '{label_name}' créé")
-                self._github_labels_cache.append(label_name)
-                return True
-
-            if "already exists" in result.stderr:
-                success(f"Label '{label_name}' existe déjà")
-                self._github_labels_cache.append(label_name)
-                return True
-
-            warning(f"Impossible de créer le label '{label_name}': {result.stderr.strip()}")
-            return False
+            label = self.github.create_label(self._get_current_repo(), label_name, color)
+            success(f"Label '{label_name}' créé")
+            labels[label_name] = label['node_id']
+            return labels[label_name]
+        except GitHubError as e:
+            warning(f"Impossible de créer le label '{label_name}': {e}")
+            return None
         except Exception as e:
             error(f"Erreur lors de la création du label '{label_name}': {e}")
-            return False
+            return None
+
+    def _create_issue_rest(self, repo: str, issue: dict):
+        """Crée une issue via l'API REST. Retourne l'issue ({'number', 'id', 'node_id', 'html_url'}) ou la GitHubError."""
+        try:
+            return self.github.create_issue(repo, issue['title'], issue['body'], issue['labels'])
+        except GitHubError as e:
+            return e
 
     def _get_current_repo(self) -> Optional[str]:
         """Récupère le propriétaire/nom du repo, en priorité l'argument --repo."""
@@ -139,38 +125,35 @@ class GitCreateTickets:
             self.debug_command([], f"Error getting current repo: {e}")
             return None
 
-    def _add_dependency_api(self, issue_number, dependency_number):
-        """Ajoute une dépendance via l'API GitHub (même repo seulement)"""
+    def _add_dependency_api(self, issue_number, dependency_number, dependency_id=None):
+        """Ajoute une dépendance via l'API GitHub (même repo seulement)
+
+        Args:
+            issue_number: Numéro de l'issue bloquée
+            dependency_number: Numéro de l'issue bloquante
+            dependency_id: ID global de l'issue bloquante, connu depuis sa création (sinon lu via l'API)
+        """
         current_repo = self._get_current_repo()
         if not current_repo:
             error("Impossible de déterminer le repo courant. Dépendance ignorée.")
             return False
 
-        # D'abord récupérer l'ID de l'issue dépendante
-        dep_url = f"https://api.github.com/repos/{current_repo}/issues/{dependency_number}"
-        dep_response = requests.get(dep_url, headers=self.headers)
-
-        if dep_response.status_code != 200:
-            error(f"Issue dépendante #{dependency_number} introuvable dans {current_repo} (Status: {dep_response.status_code})")
-            return False
-
-        dep_issue_id = dep_response.json()['id']
-
-        # Utiliser /blocked_by avec issue_id
-        url = f"https://api.github.com/repos/{current_repo}/issues/{issue_number}/dependencies/blocked_by"
-
-        payload = {
-            "issue_id": dep_issue_id  # ID global, pas le numéro de l'issue !
-        }
-
-        response = requests.post(url, json=payload, headers=self.headers)
+        dep_issue_id = dependency_id
+        if dep_issue_id is None:
+            try:
+                dep_issue_id = self.github.get_issue(current_repo, dependency_number)['id']
+            except GitHubError as e:
+                error(f"Issue dépendante #{dependency_number} introuvable dans {current_repo} (Status: {e.status})")
+                return False
 
-        if response.status_code in [200, 201]:
+        # Utiliser /blocked_by avec issue_id (ID global, pas le numéro de l'issue !)
+        try:
+            self.github.add_blocked_by(current_repo, issue_number, dep_issue_id)
             success(f"Dépendance API: #{issue_number} ← #{dependency_number}")
             return True
-        else:
-            error(f"Erreur API dépendance {issue_number} ← {dependency_number}: {response.status_code}")
-            error(f"{response.text}")
+        except GitHubError as e:
+            error(f"Erreur API dépendance {issue_number} ← {dependency_number}: {e.status}")
+            error(f"{e}")
             return False
 
     def validate_requirements(self):
@@ -179,15 +162,8 @@ class GitCreateTickets:
             error("Impossible de déterminer le repo. Utilisez --repo ou lancez depuis un repo Git.")
             raise typer.Exit(1)
 
-        try:
-            cmd = ['gh', 'auth', 'status']
-            self.debug_command(cmd, "check GitHub CLI auth")
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                error("GitHub CLI non authentifié. Lancez: gh auth login")
-                raise typer.Exit(1)
-        except FileNotFoundError:
-            error("GitHub CLI non installé. https://cli.github.com/")
+        # Token GitHub pour l'API, sinon GitHub CLI installé et authentifié
+        if not check_github_access():
             raise typer.Exit(1)
 
         success("Prérequis validés")
@@ -208,57 +184,83 @@ class GitCreateTickets:
         """Crée les issues sur GitHub avec leurs dépendances"""
         created = []
         position_to_github_number = {}
-        repo_arg = ['--repo', self._get_current_repo()] if self._get_current_repo() else []
-
-        # ÉTAPE 1: Créer TOUTES les issues d'abord
-        info("🚀 Création des issues sur GitHub...")
-        for i, ticket in enumerate(tickets, 1):
-            try:
-                issue_title = ticket['title']
-                info(f"🎫 [{i}/{len(tickets)}] {issue_title}")
+        # Numéro -> ID global de chaque issue créée: aucune relecture pour les dépendances
+        github_number_to_id = {}
+        current_repo = self._get_current_repo()
 
-                labels = ticket.get('labels', ['enhancement'])
-                for label in labels:
-                    color = self.PRIORITY_COLORS.get(label, '0969da')
-                    self._ensure_label_exists(label, color)
+        # ÉTAPE 1: Résoudre le repo et les labels (IDs GraphQL) une seule fois pour tous les tickets
+        repository_id = self._get_repository_id()
+        self._get_github_labels()
 
-                description = f"{ticket['description']}\n\n**🎛️ Priorité:** {ticket['priority']}\n**⏱️ Estimation:** {ticket['estimate']} jours\n"
+        # Labels distincts, créés en parallèle (pool borné) s'ils manquent
+        labels_needed = list(dict.fromkeys(label for ticket in tickets for label in ticket.get('labels', ['enhancement'])))
+        label_ids = dict(zip(labels_needed, map_bounded(
+            lambda label: self._ensure_label_exists(label, self.PRIORITY_COLORS.get(label, '0969da')),
+            labels_needed)))
 
-                description += f"\n---\n*🤖 Généré automatiquement par git-auto-flow*"
+        # ÉTAPE 2: Créer TOUTES les issues, par lots de mutations GraphQL aliasées
+        # (lots envoyés l'un après l'autre: GitHub recommande des mutations séquentielles)
+        to_create = []
+        for ticket in tickets:
+            description = f"{ticket['description']}\n\n**🎛️ Priorité:** {ticket['priority']}\n**⏱️ Estimation:** {ticket['estimate']} jours\n"
 
-                cmd = ['gh', 'issue', 'create', *repo_arg, '--title', issue_title, '--body', description]
-                for label in labels:
-                    cmd.extend(['--label', label])
+            description += f"\n---\n*🤖 Généré automatiquement par git-auto-flow*"
 
-                self.debug_command(cmd, f"create issue: {ticket['title']}")
-                result = subprocess.run(cmd, capture_output=True, text=True)
+            labels = ticket.get('labels', ['enhancement'])
+            to_create.append({'title': ticket['title'], 'body': description,
+                              'labels': [label for label in labels if label_ids.get(label)],
+                              'label_ids': [label_ids[label] for label in labels if label_ids.get(label)]})
 
-                if result.returncode == 0:
-                    issue_url = result.stdout.strip()
-                    issue_number = issue_url.split('/')[-1]
-                    if ticket.get('position'):
-                        position_to_github_number[ticket.get('position')] = issue_number
-                    created.append({'title': issue_title, 'url': issue_url, 'priority': ticket['priority'], 'github_number': issue_number, 'dependencies': ticket.get('dependencies', []), 'position': ticket.get('position')})
-                    success(f"{issue_url}")
+        if repository_id:
+            info(f"🚀 Création des {len(tickets)} issues sur GitHub (mutations GraphQL groupées)...")
+            results = self.github.create_issues_batch(repository_id, to_create)
+        else:
+            # Sans ID GraphQL: une requête REST par issue, comme avant les mutations groupées
+            warning(f"ID GraphQL du repo {current_repo} indisponible, création des issues une par une (REST)")
+            results = [self._create_issue_rest(current_repo, issue) for issue in to_create]
+
+        for i, (ticket, issue) in enumerate(zip(tickets, results), 1):
+            issue_title = ticket['title']
+            info(f"🎫 [{i}/{len(tickets)}] {issue_title}")
+            if isinstance(issue, GitHubError):
+                error(f"Erreur: {issue}")
+                continue
+
+            issue_url = issue['html_url']
+            issue_number = issue['number']
+            if ticket.get('position'):
+                position_to_github_number[ticket.get('position')] = issue_number
+            github_number_to_id[issue_number] = issue['id']
+            created.append({'title': issue_title, 'url': issue_url, 'priority': ticket['priority'], 'github_number': issue_number, 'github_id': issue['id'], 'github_node_id': issue['node_id'], 'dependencies': ticket.get('dependencies', []), 'position': ticket.get('position')})
+            success(f"{issue_url}")
+
+        # ÉTAPE 3: Attendre que les issues soient visibles (seulement si des dépendances sont à créer)
+        if any(issue.get('dependencies') for issue in created):
+            info("⏳ Attente de la propagation des issues...")
+            try:
+                visible = self.github.wait_issues_visible([issue['github_node_id'] for issue in created])
+                if visible:
+                    info(f"Issues visibles après {visible.waited:.1f}s")
                 else:
-                    error(f"Erreur: {result.stderr.strip()}")
-            except Exception as e:
-                error(f"Erreur création: {e}")
+                    warning(f"Issues toujours non visibles après {visible.waited:.1f}s, création des dépendances quand même")
+            except GitHubError as e:
+                warning(f"Impossible de vérifier la propagation des issues: {e}")
 
-        # ÉTAPE 2: Attendre pour la propagation des issues
-        info("⏳ Attente de 1 seconde pour la propagation des issues...")
-        time.sleep(1)
-
-        # ÉTAPE 3: Créer les dépendances et labels
+        # ÉTAPE 4: Créer les dépendances et labels
         info("🔗 Création des dépendances et labels...")
+        edges = []
         for issue in created:
             if issue.get('dependencies'):
                 for dep_position in issue['dependencies']:
                     dep_github_number = position_to_github_number.get(dep_position)
                     if dep_github_number:
-                        self._add_dependency_api(issue['github_number'], dep_github_number)
+                        edges.append((issue['github_number'], dep_github_number,
+                                      github_number_to_id.get(dep_github_number)))
                     else:
                         warning(f"Dépendance non trouvée pour la position: {dep_position}")
+
+        # Une seule requête par dépendance (IDs déjà connus), non groupable: pool borné respectant les limites de débit
+        map_bounded(lambda edge: self._add_dependency_api(*edge), edges)
         return created
 
     def run(self, file_path, force=False):
@@ -302,11 +304,13 @@ class GitCreateTickets:
 
 
 @app.command()
+@profiled("issue-create")
 def create(
     file_path: str = typer.Argument(..., help="Fichier de compte-rendu à analyser"),
     repo: Optional[str] = typer.Option(None, "--repo", help="Repo cible au format owner/repo (ex: genix-x/git-auto-flow)"),
     force: bool = typer.Option(False, "--force", "-f", help="Créer les issues sans demander confirmation"),
-    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes exécutées")
+    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes exécutées"),
+    profile: Optional[str] = PROFILE_OPTION
 ):
     """Crée des issues GitHub depuis un fichier de compte-rendu avec IA"""
 
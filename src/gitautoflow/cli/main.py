@@ -10,7 +10,9 @@ from .repos import app as repos_app
 from .features import app as features_app
 from .issues import app as issues_app
 from .releases import app as releases_app
+from .fleet import app as fleet_app
 from gitautoflow.utils.logger import header
+from gitautoflow.lib.tracing import PROFILE_OPTION
 from gitautoflow.__meta__ import CLI_HELP, CLI_VERSION_MSG
 
 # Application principale
@@ -26,10 +28,11 @@ from .releases import auto as _release_auto
 @app.command(name="auto-commit")
 def auto_commit_alias(
     force: bool = typer.Option(False, "--force", "-f", help="Force le commit sans demander confirmation"),
-    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes Git exécutées")
+    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes Git exécutées"),
+    profile: Optional[str] = PROFILE_OPTION
 ):
     """Commit automatique avec rebase + IA (alias: ac)"""
-    _auto_commit(force=force, debug=debug)
+    _auto_commit(force=force, debug=debug, profile=profile)
 
 @app.command(name="auto-pr")
 def auto_pr_alias(
@@ -39,20 +42,22 @@ def auto_pr_alias(
     delete_branch: bool = typer.Option(False, "--delete-branch", "-D", help="Supprimer la branche locale et remote après un merge réussi (nécessite --merge)"),
     closes: Optional[int] = typer.Option(None, "--closes", help="Numéro de l'issue à fermer automatiquement avec la PR"),
     force: bool = typer.Option(False, "--force", "-f", help="Forcer la création de la PR sans confirmation"),
-    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes exécutées")
+    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes exécutées"),
+    profile: Optional[str] = PROFILE_OPTION
 ):
     """Créer automatiquement une PR avec IA (alias: pr)"""
-    _auto_pr(base=base, draft=draft, merge=merge, delete_branch=delete_branch, closes=closes, force=force, debug=debug)
+    _auto_pr(base=base, draft=draft, merge=merge, delete_branch=delete_branch, closes=closes, force=force, debug=debug, profile=profile)
 
 @app.command(name="feature-start")
 def feature_start_alias(
     feature_name: str = typer.Argument(..., help="Nom de la feature à créer"),
     base: str = typer.Option("develop", "--base", "-b", help="Branche de base (défaut: develop)"),
     force: bool = typer.Option(False, "--force", "-f", help="Forcer la création même si la branche existe"),
-    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes Git exécutées")
+    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes Git exécutées"),
+    profile: Optional[str] = PROFILE_OPTION
 ):
     """Démarre une nouvelle feature branch GitFlow (alias: fs)"""
-    _feature_start(feature_name=feature_name, base=base, force=force, debug=debug)
+    _feature_start(feature_name=feature_name, base=base, force=force, debug=debug, profile=profile)
 
 @app.command()
 def version():
@@ -63,20 +68,22 @@ def version():
 @app.command(name="ac", hidden=True)
 def ac_alias(
     force: bool = typer.Option(False, "--force", "-f", help="Force le commit sans demander confirmation"),
-    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes Git exécutées")
+    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes Git exécutées"),
+    profile: Optional[str] = PROFILE_OPTION
 ):
     """Alias ultra-court pour auto-commit"""
-    _auto_commit(force=force, debug=debug)
+    _auto_commit(force=force, debug=debug, profile=profile)
 
 @app.command(name="fs", hidden=True)
 def fs_alias(
     feature_name: str = typer.Argument(..., help="Nom de la feature à créer"),
     base: str = typer.Option("develop", "--base", "-b", help="Branche de base (défaut: develop)"),
     force: bool = typer.Option(False, "--force", "-f", help="Forcer la création même si la branche existe"),
-    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes Git exécutées")
+    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes Git exécutées"),
+    profile: Optional[str] = PROFILE_OPTION
 ):
     """Alias ultra-court pour feature start"""
-    _feature_start(feature_name=feature_name, base=base, force=force, debug=debug)
+    _feature_start(feature_name=feature_name, base=base, force=force, debug=debug, profile=profile)
 
 @app.command(name="pr", hidden=True)
 def pr_alias(
@@ -86,10 +93,11 @@ def pr_alias(
     delete_branch: bool = typer.Option(False, "--delete-branch", "-D", help="Supprimer la branche locale et remote après un merge réussi (nécessite --merge)"),
     closes: Optional[int] = typer.Option(None, "--closes", help="Numéro de l'issue à fermer automatiquement avec la PR"),
     force: bool = typer.Option(False, "--force", "-f", help="Forcer la création de la PR sans confirmation"),
-    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes exécutées")
+    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes exécutées"),
+    profile: Optional[str] = PROFILE_OPTION
 ):
     """Alias ultra-court pour auto-pr"""
-    _auto_pr(base=base, draft=draft, merge=merge, delete_branch=delete_branch, closes=closes, force=force, debug=debug)
+    _auto_pr(base=base, draft=draft, merge=merge, delete_branch=delete_branch, closes=closes, force=force, debug=debug, profile=profile)
 
 @app.command(name="ra", hidden=True)
 def ra_alias(
@@ -97,15 +105,18 @@ def ra_alias(
     no_auto_merge: bool = typer.Option(False, "--no-auto-merge", help="Ne pas auto-merger la PR (merge manuel)"),
     merge_method: str = typer.Option("merge", "--merge-method", help="Méthode de merge (merge, squash, rebase)"),
     force: bool = typer.Option(False, "--force", "-f", help="Mode non-interactif (aucune confirmation)"),
-    debug: bool = typer.Option(False, "--debug", help="Activer le mode debug pour voir les commandes exécutées")
+    sign_tag: bool = typer.Option(False, "--sign-tag", help="Tag signé (git tag -s) créé localement puis poussé, au lieu du tag créé par l'API"),
+    debug: bool = typer.Option(False, "--debug", help="Activer le mode debug pour voir les commandes exécutées"),
+    profile: Optional[str] = PROFILE_OPTION
 ):
     """Alias ultra-court pour release auto"""
-    _release_auto(version=version, no_auto_merge=no_auto_merge, merge_method=merge_method, force=force, debug=debug)
+    _release_auto(version=version, no_auto_merge=no_auto_merge, merge_method=merge_method, force=force, sign_tag=sign_tag, debug=debug, profile=profile)
 
 # Sous-commandes (apparaîtront après les commandes directes)
 app.add_typer(issues_app, name="issue", help="Commandes de gestion des issues GitHub")
 app.add_typer(releases_app, name="release", help="Commandes d'automatisation des releases")
 app.add_typer(repos_app, name="repo", help="Commandes de gestion des repositories GitHub")
+app.add_typer(fleet_app, name="fleet", help="Commandes multi-repositories (flotte)")
 
 
 def main():
@@ -4,36 +4,30 @@ Git Auto-Flow - Création automatique de PR avec IA
 Migration vers architecture Typer
 """
 
-import sys
 import subprocess
 import os
-from pathlib import Path
 from typing import Optional
 
 import typer
 
 # Import des utilitaires logger
 from gitautoflow.utils.logger import info, success, error, warning, header, console
+from gitautoflow.lib.command_runner import run_command
+from gitautoflow.core.github import GitHubError, check_github_access, get_current_repo, get_github_client
+from gitautoflow.lib.ref_index import get_ref_index
+from gitautoflow.lib.tracing import PROFILE_OPTION, profiled
 
 app = typer.Typer(help="Commandes de gestion des Pull Requests avec IA")
 
-# Import des modules lib (chemin relatif au projet parent)
+# Import des modules lib depuis le package gitautoflow
 def import_lib_modules():
-    """Import dynamique des modules lib du projet parent"""
+    """Import dynamique des modules lib du package gitautoflow"""
     try:
-        # Chemin vers le projet parent
-        parent_lib = Path(__file__).parent.parent.parent / "lib"
-        if parent_lib.exists():
-            sys.path.insert(0, str(parent_lib))
+        from gitautoflow.lib.ai_provider import AIProvider
+        from gitautoflow.lib.git_utils import GitUtils
+        from gitautoflow.lib.debug_logger import debug_command, set_global_debug_mode
 
-            from ai_provider import AIProvider
-            from git_utils import GitUtils
-            from debug_logger import debug_command, set_global_debug_mode
-
-            return AIProvider, GitUtils, debug_command, set_global_debug_mode
-        else:
-            error(f"Module lib non trouvé dans: {parent_lib}")
-            raise typer.Exit(1)
+        return AIProvider, GitUtils, debug_command, set_global_debug_mode
     except ImportError as e:
         error(f"Impossible d'importer les modules lib: {e}")
         raise typer.Exit(1)
@@ -45,34 +39,15 @@ def confirm(message: str) -> bool:
     return response in ['y', 'yes', 'o', 'oui']
 
 
-def run_git_command(command: list, debug: bool = False, **kwargs):
-    """Exécute une commande Git et log si debug activé"""
-    if debug:
-        info(f"[DEBUG] Commande: {' '.join(command)}")
-
-    return subprocess.run(command, **kwargs)
-
-
 def check_gh_cli():
-    """Vérifie que GitHub CLI est installé et authentifié"""
-    try:
-        subprocess.run(['gh', '--version'], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        error("GitHub CLI (gh) n'est pas installé")
-        info("💡 Installation: brew install gh")
-        raise typer.Exit(1)
-
-    try:
-        subprocess.run(['gh', 'auth', 'status'], capture_output=True, check=True)
-    except subprocess.CalledProcessError:
-        error("GitHub CLI n'est pas authentifié")
-        info("💡 Connectez-vous: gh auth login")
+    """Vérifie l'accès GitHub authentifié (validation mise en cache, token ou gh)"""
+    if not check_github_access():
         raise typer.Exit(1)
 
 
 def run_gh_pr_create(pr_data: dict, base_branch: str = "develop", force: bool = False,
                      auto_merge: bool = False, delete_branch: bool = False, debug: bool = False) -> str:
-    """Execute gh pr create avec les données automatiques"""
+    """Crée la PR via l'API GitHub (gh en fallback) avec les données automatiques"""
 
     # Affiche la PR proposée
     info("📋 PR proposée:")
@@ -88,75 +63,71 @@ def run_gh_pr_create(pr_data: dict, base_branch: str = "develop", force: bool =
             error("PR annulée")
             return ""
 
-    # Construit la commande gh pr create
-    cmd = [
-        'gh', 'pr', 'create',
-        '--base', base_branch,
-        '--title', pr_data['title'],
-        '--body', pr_data['body']
-    ]
+    # Ne garde que les labels connus
+    valid_labels = ['enhancement', 'bug', 'documentation', 'feature']
+    labels = [label for label in pr_data.get('labels') or [] if label in valid_labels]
 
-    # Ajoute les labels si présents
-    if pr_data.get('labels'):
-        valid_labels = ['enhancement', 'bug', 'documentation', 'feature']
-        for label in pr_data['labels']:
-            if label in valid_labels:
-                cmd.extend(['--label', label])
+    repo = get_current_repo()
+    if not repo:
+        error("Impossible de déterminer le repository GitHub (remote origin)")
+        raise typer.Exit(1)
 
-    # Ajoute le flag draft si nécessaire
-    if pr_data.get('draft', False):
-        cmd.append('--draft')
+    current_branch = run_command(['git', 'branch', '--show-current'],
+                                 capture_output=True, text=True, check=True).stdout.strip()
 
     try:
-        if debug:
-            info(f"[DEBUG] Commande: {' '.join(cmd)}")
-
-        result = run_git_command(cmd, debug=debug, capture_output=True, text=True, check=True)
-        pr_url = result.stdout.strip()
+        client = get_github_client()
+        pull = client.create_pull(repo, head=current_branch, base=base_branch, title=pr_data['title'],
+                                  body=pr_data['body'], draft=pr_data.get('draft', False), labels=labels)
+        pr_url = pull['html_url']
         success(f"PR créée avec succès: {pr_url}")
 
         # Auto-merge si demandé
         if auto_merge:
             info("🔄 Merge automatique de la PR...")
-            current_branch = subprocess.run(['git', 'branch', '--show-current'],
-                                          capture_output=True, text=True, check=True).stdout.strip()
             try:
-                import time
-                time.sleep(2)
+                # Attendre que GitHub ait calculé la mergeabilité de la PR
+                mergeable = client.wait_pull_mergeable(repo, pull['number'])
+                if mergeable:
+                    info(f"PR prête au merge après {mergeable.waited:.1f}s")
+                else:
+                    warning(f"Mergeabilité toujours en calcul après {mergeable.waited:.1f}s, tentative de merge")
+                if mergeable.value and mergeable.value.get('mergeable') is False:
+                    warning("GitHub signale des conflits sur la PR, le merge risque d'échouer")
 
-                merge_cmd = ['gh', 'pr', 'merge', pr_url, '--squash']
-                run_git_command(merge_cmd, debug=debug, capture_output=True, text=True, check=True)
+                client.merge_pull(repo, pull['number'], 'squash')
                 success("PR mergée avec succès")
 
                 # Retourner sur la branche de base et pull
                 info(f"🔄 Retour sur la branche '{base_branch}'...")
-                run_git_command(['git', 'checkout', base_branch], debug=debug, check=True)
-                run_git_command(['git', 'pull'], debug=debug, check=True)
+                run_command(['git', 'checkout', base_branch], check=True)
+                run_command(['git', 'pull'], check=True)
 
                 # Supprimer la branche si demandé
                 if delete_branch:
                     info(f"🗑️ Suppression de la branche '{current_branch}'...")
-                    run_git_command(['git', 'branch', '-D', current_branch], debug=debug, check=True)
-                    run_git_command(['git', 'push', 'origin', '--delete', current_branch], debug=debug, check=True)
+                    run_command(['git', 'branch', '-D', current_branch], check=True)
+                    run_command(['git', 'push', 'origin', '--delete', current_branch], check=True)
                     success(f"Branche '{current_branch}' supprimée (local et remote)")
                 else:
                     success(f"Branche '{base_branch}' mise à jour. La branche '{current_branch}' est conservée.")
 
+            except GitHubError as e:
+                warning(f"Erreur lors du merge de la PR: {e}")
+                info(f"💡 PR créée mais non mergée: {pr_url}")
             except subprocess.CalledProcessError as e:
                 warning(f"Erreur lors du merge ou de la suppression de branche: {e.stderr if e.stderr else e}")
                 info(f"💡 PR créée mais non mergée: {pr_url}")
 
         return pr_url
 
-    except subprocess.CalledProcessError as e:
-        if e.stderr:
-            error(f"Erreur lors de la création de la PR: {e.stderr}")
-        else:
-            error(f"Erreur lors de la création de la PR: {e}")
+    except GitHubError as e:
+        error(f"Erreur lors de la création de la PR: {e}")
         raise typer.Exit(1)
 
 
 @app.command()
+@profiled("auto-pr")
 def auto_pr(
     base: str = typer.Option("develop", "--base", "-b", help="Branche de base pour la PR (défaut: develop)"),
     draft: bool = typer.Option(False, "--draft", "-d", help="Créer la PR en mode draft"),
@@ -164,7 +135,8 @@ def auto_pr(
     delete_branch: bool = typer.Option(False, "--delete-branch", "-D", help="Supprimer la branche locale et remote après un merge réussi (nécessite --merge)"),
     closes: Optional[int] = typer.Option(None, "--closes", help="Numéro de l'issue à fermer automatiquement avec la PR"),
     force: bool = typer.Option(False, "--force", "-f", help="Forcer la création de la PR sans confirmation"),
-    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes exécutées")
+    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes exécutées"),
+    profile: Optional[str] = PROFILE_OPTION
 ):
     """Créer automatiquement une PR avec analyse IA"""
 
@@ -210,12 +182,16 @@ def auto_pr(
                 raise typer.Exit(1)
         else:
             success(f"Branche à jour avec {base}")
-            try:
-                info("📤 Vérification du push...")
-                GitUtils.push_current_branch()
-                success("Push vérifié")
-            except RuntimeError:
-                pass
+            if get_ref_index().is_pushed(current_branch):
+                # La branche distante pointe déjà sur HEAD (ls-remote): pas de push
+                success("Branche déjà poussée")
+            else:
+                try:
+                    info("📤 Vérification du push...")
+                    GitUtils.push_current_branch()
+                    success("Push vérifié")
+                except RuntimeError:
+                    pass
 
         # Initialise le gestionnaire multi-IA
         info("🔄 Initialisation IA...")
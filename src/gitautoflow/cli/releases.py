@@ -4,37 +4,33 @@ Git Auto-Flow - Automatisation des releases
 Migration de git-release-auto.py vers architecture Typer
 """
 
-import sys
 import subprocess
 import time
 import re
-from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 import typer
 
 # Import des utilitaires logger
 from gitautoflow.utils.logger import info, success, error, warning, header, console
+from gitautoflow.lib.command_runner import run_command
+from gitautoflow.core.github import GitHubError, check_github_access, get_current_repo, get_github_client, parse_pull_number
+from gitautoflow.lib.conventional_commits import plan_next_version, build_commit_digest
+from gitautoflow.lib.fetch_coordinator import get_fetch_coordinator
+from gitautoflow.lib.ref_index import get_ref_index
+from gitautoflow.lib.tracing import PROFILE_OPTION, profiled
 
 app = typer.Typer(help="Commandes d'automatisation des releases")
 
-# Import des modules lib (chemin relatif au projet parent)
+# Import des modules lib depuis le package gitautoflow
 def import_lib_modules():
-    """Import dynamique des modules lib du projet parent"""
+    """Import dynamique des modules lib du package gitautoflow"""
     try:
-        # Chemin vers le projet parent
-        parent_lib = Path(__file__).parent.parent.parent / "lib"
-        if parent_lib.exists():
-            sys.path.insert(0, str(parent_lib))
+        from gitautoflow.lib.ai_provider import AIProvider
+        from gitautoflow.lib.git_utils import GitUtils
+        from gitautoflow.lib.debug_logger import debug_command, set_global_debug_mode
 
-            from ai_provider import AIProvider
-            from git_utils import GitUtils
-            from debug_logger import debug_command, set_global_debug_mode
-
-            return AIProvider, GitUtils, debug_command, set_global_debug_mode
-        else:
-            error(f"Module lib non trouvé dans: {parent_lib}")
-            raise typer.Exit(1)
+        return AIProvider, GitUtils, debug_command, set_global_debug_mode
     except ImportError as e:
         error(f"Impossible d'importer les modules lib: {e}")
         raise typer.Exit(1)
@@ -47,54 +43,58 @@ def confirm(message: str) -> bool:
 
 
 def get_repo_name() -> str:
-    """Récupère le nom du repository GitHub"""
-    try:
-        cmd = ['git', 'remote', 'get-url', 'origin']
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        url = result.stdout.strip()
-
-        # Parse GitHub URL (https://github.com/user/repo.git ou git@github.com:user/repo.git)
-        if 'github.com/' in url:
-            repo_part = url.split('github.com/')[-1]
-            if repo_part.endswith('.git'):
-                repo_part = repo_part[:-4]
-            return repo_part
-        return "unknown/unknown"
-    except:
-        return "unknown/unknown"
+    """Récupère le nom du repository GitHub (mis en cache pour l'exécution)"""
+    return get_current_repo() or "unknown/unknown"
 
 
 def get_latest_tag() -> str:
-    """Récupère le dernier tag pour calculer la prochaine version"""
+    """Récupère le dernier tag semver atteignable depuis main pour calculer la prochaine version"""
     try:
-        # On s'assure d'avoir les derniers tags de l'origin
-        subprocess.run(['git', 'fetch', 'origin', '--tags'], capture_output=True, text=True)
+        # On s'assure d'avoir les derniers tags de l'origin (une seule fois par exécution)
+        get_fetch_coordinator().fetch(tags=True, check=False)
 
-        # Liste les tags par version et prend le dernier
-        cmd = ['git', 'tag', '-l', '--sort=-v:refname']
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        tags = result.stdout.strip().split('\n')
+        # Tags lus dans l'index des refs (un seul for-each-ref, tri semver en mémoire)
+        ref_index = get_ref_index()
+        if ref_index.has_remote_branch('main'):
+            main_ref = 'origin/main'
+        else:
+            main_ref = 'main' if ref_index.has_branch('main') else None
+        latest_tag = ref_index.latest_tag(reachable_from=main_ref)
 
-        if tags and tags[0]:
+        if latest_tag:
             # Nettoie le tag pour retirer les "v" en trop
             # Exemple: "vvv1.8.0" devient "v1.8.0"
-            latest_tag = tags[0]
-            # Garde seulement le premier "v" et les chiffres
-            cleaned_tag = re.sub(r'^v+', 'v', latest_tag)
-            return cleaned_tag
+            return re.sub(r'^v+', 'v', latest_tag)
         else:
             return "v0.0.0"
     except Exception:
         return "v0.0.0"  # Première version si aucun tag
 
 
-def create_github_release(release_data: dict, debug_command) -> bool:
+def tag_signing_required(sign_tag: bool = False) -> bool:
+    """Indique si le tag doit être signé (--sign-tag ou git config tag.gpgSign)"""
+    if sign_tag:
+        return True
+    result = run_command(['git', 'config', '--bool', '--get', 'tag.gpgSign'],
+                         description="config tag.gpgSign", capture_output=True, text=True)
+    return result.returncode == 0 and result.stdout.strip() == 'true'
+
+
+def create_github_release(release_data: dict, target_sha: Optional[str],
+                          previous_tag: Optional[str] = None, sign_tag: bool = False) -> bool:
     """
-    Crée une GitHub Release avec tag
+    Crée une GitHub Release avec tag annoté sur le commit de merge
+
+    Le tag annoté (objet tag + ref) et la release sont créés par l'API GitHub,
+    sans fetch, tag local ni push. Le flux local (git tag -s sur le commit de
+    merge puis push) n'est utilisé que pour un tag signé.
 
     Args:
         release_data: Dict contenant version, changes, etc.
-        debug_command: Fonction de debug
+        target_sha: SHA du commit de merge de la PR de release (retourné par le merge);
+                    sans SHA, rien n'est tagué (main n'est peut-être pas mergé)
+        previous_tag: Dernier tag déjà calculé (évite de relire les tags pour les notes)
+        sign_tag: Exiger un tag signé (flux local)
 
     Returns:
         bool: True si succès
@@ -104,43 +104,45 @@ def create_github_release(release_data: dict, debug_command) -> bool:
         version = release_data['version']
         cleaned_version = re.sub(r'^v+', 'v', version)
 
-        # 1. Checkout main pour créer le tag
-        info("📂 Checkout main pour la release...")
-        subprocess.run(['git', 'checkout', 'main'], capture_output=True, check=True)
-
-        # 2. Pull latest main
-        info("📥 Pull main...")
-        subprocess.run(['git', 'pull', 'origin', 'main'], capture_output=True, check=True)
-
-        # 3. Créer le tag local
-        info(f"🏷️  Création du tag {cleaned_version}...")
-        tag_cmd = ['git', 'tag', '-a', cleaned_version, '-m', f'Release {cleaned_version}']
-        debug_command(tag_cmd, f"create tag {cleaned_version}")
-        subprocess.run(tag_cmd, check=True)
+        if not target_sha:
+            error(f"SHA du commit de merge inconnu: tag {cleaned_version} non créé")
+            return False
+
+        # Chemin rapide: tag annoté et release créés côté GitHub sur le commit de merge
+        if not tag_signing_required(sign_tag):
+            release_notes = generate_release_notes(release_data, previous_tag)
+            info(f"🚀 Création du tag annoté {cleaned_version} sur {target_sha[:7]} et de la release (API GitHub)...")
+            client = get_github_client()
+            client.create_annotated_tag(get_repo_name(), cleaned_version, f'Release {cleaned_version}', target_sha)
+            client.create_release(get_repo_name(), cleaned_version, cleaned_version, release_notes)
+            return True
+
+        # 1. Récupère le main mergé (aucun checkout: le working tree de l'utilisateur reste intact)
+        info("📥 Fetch origin/main...")
+        # Le merge vient de déplacer main côté GitHub: FETCH_HEAD récent ne suffit pas
+        get_fetch_coordinator().fetch('main', force=True)
+
+        # 2. Générer les release notes avant le tag (le lien de comparaison part du tag précédent)
+        release_notes = generate_release_notes(release_data, previous_tag)
+
+        # 3. Créer le tag signé directement sur le commit de merge
+        info(f"🏷️  Création du tag signé {cleaned_version} sur {target_sha[:7]}...")
+        tag_cmd = ['git', 'tag', '-s', cleaned_version, target_sha, '-m', f'Release {cleaned_version}']
+        run_command(tag_cmd, description=f"create tag {cleaned_version}", check=True)
+        get_ref_index().invalidate()
 
         # 4. Push le tag
         info(f"📤 Push du tag {cleaned_version}...")
         push_tag_cmd = ['git', 'push', 'origin', cleaned_version]
-        debug_command(push_tag_cmd, f"push tag {cleaned_version}")
-        subprocess.run(push_tag_cmd, check=True)
-
-        # 5. Générer les release notes depuis les données IA
-        release_notes = generate_release_notes(release_data)
+        run_command(push_tag_cmd, description=f"push tag {cleaned_version}", check=True)
 
-        # 6. Créer la GitHub Release
+        # 5. Créer la GitHub Release
         info(f"🚀 Création de la GitHub Release {cleaned_version}...")
-        gh_cmd = [
-            'gh', 'release', 'create', cleaned_version,
-            '--title', f'{cleaned_version}',
-            '--notes', release_notes
-        ]
-
-        debug_command(gh_cmd, f"create GitHub release {cleaned_version}")
-        subprocess.run(gh_cmd, check=True)
+        get_github_client().create_release(get_repo_name(), cleaned_version, cleaned_version, release_notes)
 
         return True
 
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, GitHubError) as e:
         error(f"Erreur lors de la création de la release: {e}")
         return False
     except Exception as e:
@@ -148,8 +150,8 @@ def create_github_release(release_data: dict, debug_command) -> bool:
         return False
 
 
-def generate_release_notes(release_data: dict) -> str:
-    """Génère les release notes formatées pour GitHub"""
+def generate_release_notes(release_data: dict, previous_tag: Optional[str] = None) -> str:
+    """Génère les release notes formatées pour GitHub (previous_tag: tag de départ du changelog)"""
     # Nettoie la version pour éviter les "v" en double
     version = release_data['version']
     cleaned_version = re.sub(r'^v+', 'v', version)
@@ -174,71 +176,49 @@ def generate_release_notes(release_data: dict) -> str:
             notes += f"- {change}\n"
         notes += "\n"
 
-    notes += f"**Full Changelog**: https://github.com/{get_repo_name()}/compare/{get_latest_tag()}...{cleaned_version}\n"
+    notes += f"**Full Changelog**: https://github.com/{get_repo_name()}/compare/{previous_tag or get_latest_tag()}...{cleaned_version}\n"
 
     return notes
 
 
-def check_gh_cli(debug_command):
-    """Vérifie que GitHub CLI est installé et authentifié"""
-    try:
-        version_cmd = ['gh', '--version']
-        debug_command(version_cmd, "check gh version")
-        subprocess.run(version_cmd, capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        error("GitHub CLI (gh) n'est pas installé")
-        info("💡 Installation:")
-        info("   macOS: brew install gh")
-        info("   Ubuntu/Debian: sudo apt install gh")
-        raise typer.Exit(1)
-
-    try:
-        auth_cmd = ['gh', 'auth', 'status']
-        debug_command(auth_cmd, "check gh auth")
-        subprocess.run(auth_cmd, capture_output=True, check=True)
-    except subprocess.CalledProcessError:
-        error("GitHub CLI n'est pas authentifié")
-        info("💡 Connectez-vous: gh auth login")
+def check_gh_cli():
+    """Vérifie l'accès GitHub authentifié (validation mise en cache, token ou gh)"""
+    if not check_github_access():
         raise typer.Exit(1)
 
 
-def merge_pr_immediately(pr_url: str, merge_method: str, debug_command) -> bool:
+def merge_pr_immediately(pr_url: str, merge_method: str) -> Optional[str]:
     """
     Merge immédiatement la PR créée
 
     Args:
         pr_url: URL de la PR
         merge_method: Méthode de merge (merge, squash, rebase)
-        debug_command: Fonction de debug
 
     Returns:
-        bool: True si le merge a réussi
+        str: Le SHA du commit de merge, None si le merge a échoué
     """
     try:
         # Extract PR number from URL
-        pr_number = pr_url.split('/')[-1]
+        pr_number = parse_pull_number(pr_url)
 
         info(f"🔄 Merge immédiat de la PR #{pr_number}...")
 
-        # Merge immediately (no --auto flag)
-        cmd = [
-            'gh', 'pr', 'merge', pr_number,
-            f'--{merge_method}'
-        ]
-
-        debug_command(cmd, "merge PR immediately")
-
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        # Merge dès que GitHub a calculé la mergeabilité (no auto-merge)
+        client = get_github_client()
+        client.wait_pull_mergeable(get_repo_name(), pr_number)
+        merge = client.merge_pull(get_repo_name(), pr_number, merge_method)
         success("PR mergée avec succès!")
-        return True
+        return merge.get('sha') or None
 
-    except subprocess.CalledProcessError as e:
-        error(f"Merge échoué: {e.stderr}")
+    except GitHubError as e:
+        error(f"Merge échoué: {e}")
         info("💡 Vous pouvez merger manuellement depuis GitHub")
-        return False
+        return None
 
 
-def run_gh_pr_create_release(pr_data: dict, immediate_merge: bool, merge_method: str, force_mode: bool, debug_command) -> str:
+def run_gh_pr_create_release(pr_data: dict, immediate_merge: bool, merge_method: str,
+                             force_mode: bool) -> Tuple[str, Optional[str]]:
     """
     Execute gh pr create pour une release avec merge immédiat
 
@@ -247,10 +227,9 @@ def run_gh_pr_create_release(pr_data: dict, immediate_merge: bool, merge_method:
         immediate_merge: Si True, merge immédiatement la PR
         merge_method: Méthode de merge
         force_mode: Si True, bypass la confirmation
-        debug_command: Fonction de debug
 
     Returns:
-        str: L'URL de la PR créée
+        tuple: (URL de la PR créée, SHA du commit de merge ou None)
     """
     # Affiche la PR de release proposée
     info("🚀 PR de Release proposée:")
@@ -267,46 +246,36 @@ def run_gh_pr_create_release(pr_data: dict, immediate_merge: bool, merge_method:
     if not force_mode:
         if not confirm("✅ Créer cette PR de release?"):
             error("Release annulée")
-            return ""
+            return "", None
     else:
         success("Confirmation automatique (mode force)")
 
-    # Construit la commande gh pr create
-    cmd = [
-        'gh', 'pr', 'create',
-        '--base', 'main',
-        '--head', 'develop',
-        '--title', pr_data['title'],
-        '--body', pr_data['body']
-    ]
-
     try:
-        debug_command(cmd, "create release PR")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        pr_url = result.stdout.strip()
+        pull = get_github_client().create_pull(get_repo_name(), head='develop', base='main',
+                                               title=pr_data['title'], body=pr_data['body'])
+        pr_url = pull['html_url']
         success(f"PR de release créée: {pr_url}")
 
         # Merge immédiat si demandé
-        if immediate_merge:
-            merge_pr_immediately(pr_url, merge_method, debug_command)
+        merge_sha = merge_pr_immediately(pr_url, merge_method) if immediate_merge else None
 
-        return pr_url
+        return pr_url, merge_sha
 
-    except subprocess.CalledProcessError as e:
-        if e.stderr:
-            error(f"Erreur lors de la création de la PR: {e.stderr}")
-        else:
-            error(f"Erreur lors de la création de la PR: {e}")
+    except GitHubError as e:
+        error(f"Erreur lors de la création de la PR: {e}")
         raise typer.Exit(1)
 
 
 @app.command()
+@profiled("release-auto")
 def auto(
     version: Optional[str] = typer.Option(None, "--version", help="Forcer un numéro de version spécifique (ex: 1.0.0, 2.1.3)"),
     no_auto_merge: bool = typer.Option(False, "--no-auto-merge", help="Ne pas auto-merger la PR (merge manuel)"),
     merge_method: str = typer.Option("merge", "--merge-method", help="Méthode de merge (merge, squash, rebase)"),
     force: bool = typer.Option(False, "--force", "-f", help="Mode non-interactif (aucune confirmation)"),
-    debug: bool = typer.Option(False, "--debug", help="Activer le mode debug pour voir les commandes exécutées")
+    sign_tag: bool = typer.Option(False, "--sign-tag", help="Tag signé (git tag -s) créé localement puis poussé, au lieu du tag créé par l'API"),
+    debug: bool = typer.Option(False, "--debug", help="Activer le mode debug pour voir les commandes exécutées"),
+    profile: Optional[str] = PROFILE_OPTION
 ):
     """Processus de release automatisé complet : develop → main → tag → release GitHub"""
 
@@ -323,40 +292,35 @@ def auto(
         error("Pas dans un repository Git")
         raise typer.Exit(1)
 
-    check_gh_cli(debug_command)
+    check_gh_cli()
 
     try:
-        # Étape 1: Checkout develop et pull
+        # Étape 1: Synchronisation des refs distantes, sans checkout: toute la release
+        # travaille sur origin/develop et origin/main, la branche courante n'est pas touchée
         info("\n🔄 Étape 1: Synchronisation de develop...")
-        current_branch = GitUtils.get_current_branch()
-        info(f"📋 Branche courante: {current_branch}")
+        info(f"📋 Branche courante: {GitUtils.get_current_branch()} (inchangée)")
 
-        # Checkout develop
-        info("📂 Checkout develop...")
-        result = subprocess.run(['git', 'checkout', 'develop'],
-                              capture_output=True, text=True, check=True)
-        success("Sur develop")
-
-        # Pull origin develop
-        info("📥 Pull origin develop...")
-        result = subprocess.run(['git', 'pull', 'origin', 'develop'],
-                              capture_output=True, text=True, check=True)
-        success("Develop synchronisé")
+        # Un seul fetch groupé pour develop, main et les tags
+        info("📥 Fetch origin develop, main et tags...")
+        get_fetch_coordinator().fetch('develop', 'main', tags=True)
+        success("origin/develop synchronisé")
 
         # Étape 2: Vérifier qu'il y a des changements vs main
         info("\n🔍 Étape 2: Analyse des changements develop -> main...")
 
-        if not GitUtils.has_branch_changes('main'):
+        if not GitUtils.has_branch_changes('origin/main', head='origin/develop'):
             error("Aucun changement entre develop et main")
             info("💡 Rien à releaser!")
             raise typer.Exit(1)
 
         # Récupère les informations pour la PR
-        diff = GitUtils.get_branch_diff('main')
-        files_list = GitUtils.get_branch_files('main')
-        commits = GitUtils.get_commit_messages('main')
+        diff = GitUtils.get_branch_diff('origin/main', head='origin/develop')
+        files_list = GitUtils.get_branch_files('origin/main', head='origin/develop')
+        # Toute la plage est parcourue: le prompt reçoit un digest groupé par type
+        digest = build_commit_digest('origin/main', head='origin/develop')
+        commits = digest.lines()
 
-        info(f"📊 {len(commits)} commits à releaser")
+        info(f"📊 {digest.total} commits à releaser")
         info(f"📁 {len(files_list)} fichiers modifiés")
 
         # Convertit la liste de fichiers en string pour l'IA
@@ -392,6 +356,13 @@ def auto(
             cleaned_ai_version = re.sub(r'^v+', 'v', version_from_ai)
             info(f"🏷️  Version calculée: {cleaned_ai_version} ({release_data['release']['version_type']})")
 
+            # Vérification locale: avec des conventional commits, le calcul semver fait foi
+            plan = plan_next_version(latest_tag, 'origin/main', head='origin/develop')
+            if plan.is_conventional and plan.version != cleaned_ai_version:
+                warning(f"Version IA {cleaned_ai_version} incohérente avec les conventional commits: {plan.version} ({plan.bump}) retenue")
+                release_data['release']['version'] = plan.version
+                release_data['release']['version_type'] = plan.bump
+
         # Affichage final de la version utilisée (nettoyée)
         final_version = version if version else release_data['release']['version']
         cleaned_final_version = re.sub(r'^v+', 'v', final_version)
@@ -402,13 +373,19 @@ def auto(
         info("\n🚀 Étape 4: Création de la PR de release...")
 
         immediate_merge = not no_auto_merge
-        pr_url = run_gh_pr_create_release(release_data['pr'], immediate_merge, merge_method, force, debug_command)
+        pr_url, merge_sha = run_gh_pr_create_release(release_data['pr'], immediate_merge, merge_method, force)
 
-        if pr_url and immediate_merge:
+        if pr_url and immediate_merge and not merge_sha:
+            # Merge échoué: main n'a pas bougé, taguer origin/main taguerait le mauvais commit
+            warning(f"Release {cleaned_final_version} non créée: la PR n'a pas été mergée")
+            info("💡 Mergez la PR puis créez la release depuis GitHub")
+            raise typer.Exit(1)
+        elif pr_url and immediate_merge:
             success(f"\n🎉 PR mergée! Création de la release {cleaned_final_version}...")
 
             # Étape 5: Création automatique de la release
-            if create_github_release(release_data['release'], debug_command):
+            if create_github_release(release_data['release'], target_sha=merge_sha,
+                                     previous_tag=latest_tag, sign_tag=sign_tag):
                 success(f"🏷️  Release {cleaned_final_version} créée avec succès!")
                 success(f"🔗 Voir: https://github.com/{get_repo_name()}/releases/tag/{cleaned_final_version}")
             else:
@@ -417,16 +394,8 @@ def auto(
             success(f"\n🎉 PR créée: {pr_url}")
             info("💡 Mergez manuellement pour déclencher la release")
 
-        # Retour à la branche d'origine si possible
-        if current_branch and current_branch != 'develop':
-            try:
-                info(f"\n🔙 Retour à la branche {current_branch}...")
-                subprocess.run(['git', 'checkout', current_branch],
-                             capture_output=True, check=True)
-                success(f"Retour sur {current_branch}")
-            except subprocess.CalledProcessError:
-                warning(f"Impossible de retourner sur {current_branch}")
-
+    except typer.Exit:
+        raise
     except subprocess.CalledProcessError as e:
         if e.stderr:
             error(f"Erreur Git: {e.stderr}")
@@ -465,14 +434,33 @@ def next_version(
             console.print("v0.0.0")
             return
 
+        # Récupère le dernier tag
+        latest_tag = get_latest_tag()
+        if debug:
+            info(f"Dernier tag: {latest_tag}")
+
+        # Calcul local et déterministe si tous les commits sont conventionnels
+        plan = plan_next_version(latest_tag, 'main')
+        if plan.is_conventional:
+            console.print(plan.version)
+            if debug:
+                info(f"Type de version: {plan.bump} ({len(plan.commits)} conventional commits, sans IA)")
+            return
+
+        if debug:
+            info(f"🤖 {len(plan.unconventional)} commit(s) non conventionnel(s), calcul par IA")
+            for sha, subject in plan.unconventional[:5]:
+                info(f"  {sha[:7]} {subject}")
+
         # Récupère les informations pour l'analyse
         diff = GitUtils.get_branch_diff('main')
         files_list = GitUtils.get_branch_files('main')
-        commits = GitUtils.get_commit_messages('main')
+        digest = build_commit_digest('main')
+        commits = digest.lines()
         files = '\n'.join(files_list)
 
         if debug:
-            info(f"📊 {len(commits)} commits à analyser")
+            info(f"📊 {digest.total} commits à analyser")
             info(f"📁 {len(files_list)} fichiers modifiés")
 
         # Initialise l'IA
@@ -480,11 +468,6 @@ def next_version(
         if debug:
             console.print(ai.get_status())
 
-        # Récupère le dernier tag
-        latest_tag = get_latest_tag()
-        if debug:
-            info(f"Dernier tag: {latest_tag}")
-
         # Génère l'analyse pour calculer la version
         release_data = ai.analyze_for_release(diff, files, commits, latest_tag=latest_tag)
 
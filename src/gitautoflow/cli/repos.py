@@ -6,9 +6,7 @@ Migration vers architecture Typer
 
 import sys
 import subprocess
-import time
 import os
-import json
 from pathlib import Path
 from subprocess import CalledProcessError
 import shutil
@@ -18,6 +16,10 @@ from typing import Optional
 
 # Import des utilitaires logger
 from gitautoflow.utils.logger import info, success, error, warning, header, console
+from gitautoflow.lib import command_runner
+from gitautoflow.core.github import GitHubError, check_github_access, get_github_client
+from gitautoflow.lib.debug_logger import set_global_debug_mode
+from gitautoflow.lib.tracing import PROFILE_OPTION, profiled
 
 app = typer.Typer(help="Commandes de gestion des repositories GitHub")
 
@@ -29,34 +31,19 @@ def confirm(message: str) -> bool:
 
 
 def check_prerequisites() -> bool:
-    """Vérifie que gh CLI est installé et configuré"""
-    try:
-        # Vérifier que gh est installé
-        subprocess.run(['gh', '--version'], capture_output=True, check=True)
-
-        # Vérifier que gh est authentifié
-        result = subprocess.run(['gh', 'auth', 'status'], capture_output=True, text=True)
-        if result.returncode != 0:
-            error("GitHub CLI n'est pas authentifié")
-            info(" Lance: gh auth login")
-            return False
-
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        error("GitHub CLI (gh) n'est pas installé")
-        info(" Installation: https://cli.github.com/")
-        return False
+    """Vérifie l'accès GitHub authentifié (validation mise en cache, token ou gh)"""
+    return check_github_access()
 
 
 def check_git_config() -> bool:
     """Vérifie et configure l'identité Git si nécessaire"""
     try:
         # Vérifier l'email
-        result_email = subprocess.run(['git', 'config', '--global', 'user.email'],
-                                    capture_output=True, text=True)
+        result_email = command_runner.run_command(['git', 'config', '--global', 'user.email'],
+                                                capture_output=True, text=True)
         # Vérifier le nom
-        result_name = subprocess.run(['git', 'config', '--global', 'user.name'],
-                                   capture_output=True, text=True)
+        result_name = command_runner.run_command(['git', 'config', '--global', 'user.name'],
+                                               capture_output=True, text=True)
 
         if result_email.returncode != 0 or not result_email.stdout.strip():
             warning("Email Git non configuré")
@@ -80,10 +67,8 @@ def configure_git_from_github():
         info("Configuration automatique de Git depuis GitHub...")
 
         # Récupérer les infos utilisateur GitHub
-        result = subprocess.run(['gh', 'api', 'user'], capture_output=True, text=True, check=True)
-
-        import json
-        user_info = json.loads(result.stdout)
+        client = get_github_client()
+        user_info = client.get_user()
 
         github_name = user_info.get('name') or user_info.get('login')
         github_email = user_info.get('email')
@@ -91,17 +76,15 @@ def configure_git_from_github():
         # Si pas d'email public, essayer les emails privés
         if not github_email:
             try:
-                email_result = subprocess.run(['gh', 'api', 'user/emails'],
-                                            capture_output=True, text=True, check=True)
-                emails = json.loads(email_result.stdout)
+                emails = client.get_user_emails()
                 primary_email = next((e['email'] for e in emails if e.get('primary')), None)
                 github_email = primary_email or f"{user_info['login']}@users.noreply.github.com"
             except:
                 github_email = f"{user_info['login']}@users.noreply.github.com"
 
         # Configurer Git
-        subprocess.run(['git', 'config', '--global', 'user.name', github_name], check=True)
-        subprocess.run(['git', 'config', '--global', 'user.email', github_email], check=True)
+        command_runner.run_command(['git', 'config', '--global', 'user.name', github_name], check=True)
+        command_runner.run_command(['git', 'config', '--global', 'user.email', github_email], check=True)
 
         success(f"Git configuré: {github_name} <{github_email}>")
         return True
@@ -131,13 +114,12 @@ def load_config():
         return None
 
 
-def run_command(command: list, cwd: Optional[str] = None, check: bool = True, debug: bool = False):
+def run_command(command: list, cwd: Optional[str] = None, check: bool = True):
     """Helper pour exécuter une commande et logger le résultat"""
-    if debug:
-        info(f"[DEBUG] Commande: {' '.join(command)} in directory: {cwd or '.'}")
     try:
-        result = subprocess.run(
+        result = command_runner.run_command(
             command,
+            description=f"dans {cwd or '.'}",
             capture_output=True,
             text=True,
             check=check,
@@ -160,7 +142,7 @@ def run_command(command: list, cwd: Optional[str] = None, check: bool = True, de
         raise
 
 
-def set_github_actions_permissions(repo_full_name: str, force: bool = False, debug: bool = False):
+def set_github_actions_permissions(repo_full_name: str, force: bool = False):
     """Configure le repo pour autoriser les GitHub Actions à créer et approuver des PRs"""
     info("Configuration des permissions pour les GitHub Actions...")
 
@@ -171,19 +153,13 @@ def set_github_actions_permissions(repo_full_name: str, force: bool = False, deb
             return
 
     try:
-        cmd = [
-            'gh', 'api',
-            '--method', 'PUT',
-            f'/repos/{repo_full_name}/actions/permissions/workflow',
-            '-f', 'default_workflow_permissions=write'
-        ]
-        run_command(cmd, check=True, debug=debug)
+        get_github_client().set_workflow_permissions(repo_full_name, 'write')
         success("Permissions pour les GitHub Actions configurées avec succès!")
-    except CalledProcessError:
+    except GitHubError:
         error("Erreur lors de la configuration des permissions pour les GitHub Actions.")
 
 
-def setup_local_repo(project_name: str, repo_url: str, working_dir: str, force: bool = False, debug: bool = False) -> str:
+def setup_local_repo(project_name: str, repo_url: str, working_dir: str, force: bool = False) -> str:
     """Clone le repo dans le working_dir"""
     try:
         info(f"Setup local repository dans {working_dir}")
@@ -202,7 +178,7 @@ def setup_local_repo(project_name: str, repo_url: str, working_dir: str, force:
                 shutil.rmtree(str(project_path))
 
             info(f"Clonage du repository {repo_url}...")
-            run_command(['git', 'clone', repo_url, str(project_path)], debug=debug)
+            run_command(['git', 'clone', repo_url, str(project_path)])
         else:
             warning(f"Le repo git {project_path} existe déjà. On continue dedans.")
 
@@ -216,8 +192,67 @@ def setup_local_repo(project_name: str, repo_url: str, working_dir: str, force:
         raise typer.Exit(1)
 
 
-def create_readme_workflow(project_path: str, project_name: str, debug: bool = False) -> bool:
-    """Workflow complet README avec Git natif"""
+def readme_content(project_name: str) -> str:
+    """Contenu du README initial du projet"""
+    return f"""# {project_name}
+
+Projet {project_name} créé avec Git Auto-Flow.
+
+## Installation
+
+```bash
+git clone https://github.com/[ORG]/{project_name}.git
+cd {project_name}
+```
+## Utilisation
+À documenter...
+"""
+
+
+def bootstrap_repository(project_path: str, project_name: str) -> bool:
+    """
+    Setup rapide: commits initiaux construits localement, un seul push atomique
+
+    main et develop pointent sur le même commit (README inclus), tag v0.1.0
+    posé dessus; branches et tag sont poussés en un `git push --atomic`, sans PR.
+
+    Returns:
+        bool: True si succès
+    """
+    try:
+        info("🚀 Bootstrap du repository (commits locaux + push atomique)")
+
+        # 1. Arbre initial et commits, sans branche intermédiaire
+        (Path(project_path) / ".gitkeep").write_text("# Initial commit\n")
+        (Path(project_path) / "README.md").write_text(readme_content(project_name))
+
+        run_command(['git', 'symbolic-ref', 'HEAD', 'refs/heads/main'], cwd=project_path)
+        run_command(['git', 'add', '.gitkeep'], cwd=project_path)
+        run_command(['git', 'commit', '-m', 'Initial commit'], cwd=project_path)
+        run_command(['git', 'add', 'README.md'], cwd=project_path)
+        run_command(['git', 'commit', '-m', 'feat: Add README.md'], cwd=project_path)
+
+        # 2. develop et tag v0.1.0 sur le même commit
+        run_command(['git', 'branch', 'develop'], cwd=project_path)
+        run_command(['git', 'tag', 'v0.1.0'], cwd=project_path)
+
+        # 3. Un seul push: tout ou rien
+        info("📤 Push atomique de main, develop et v0.1.0")
+        run_command(['git', 'push', '--atomic', '--set-upstream', 'origin',
+                     'main', 'develop', 'refs/tags/v0.1.0'], cwd=project_path)
+        run_command(['git', 'checkout', 'develop'], cwd=project_path)
+
+        success("✅ Bootstrap terminé !")
+        success("✅ Repository prêt avec README, branches GitFlow et release v0.1.0")
+        return True
+
+    except Exception as e:
+        error(f"Erreur bootstrap: {e}")
+        return False
+
+
+def create_readme_workflow(project_path: str, project_name: str, repo_full_name: str) -> bool:
+    """Workflow complet README avec Git natif et PRs d'audit (feature/readme → develop → main)"""
     try:
         info("🚀 Workflow README avec Git natif")
 
@@ -226,70 +261,60 @@ def create_readme_workflow(project_path: str, project_name: str, debug: bool = F
         gitkeep_path = Path(project_path) / ".gitkeep"
         gitkeep_path.write_text("# Initial commit\n")
 
-        run_command(['git', 'add', '.gitkeep'], cwd=project_path, debug=debug)
-        run_command(['git', 'commit', '-m', 'Initial commit'], cwd=project_path, debug=debug)
-        run_command(['git', 'branch', '-M', 'main'], cwd=project_path, debug=debug)
-        run_command(['git', 'push', '-u', 'origin', 'main'], cwd=project_path, debug=debug)
+        run_command(['git', 'add', '.gitkeep'], cwd=project_path)
+        run_command(['git', 'commit', '-m', 'Initial commit'], cwd=project_path)
+        run_command(['git', 'branch', '-M', 'main'], cwd=project_path)
+        run_command(['git', 'push', '-u', 'origin', 'main'], cwd=project_path)
 
         # 2. Créer develop depuis main
         info("Création de la branche develop")
-        run_command(['git', 'checkout', '-b', 'develop'], cwd=project_path, debug=debug)
-        run_command(['git', 'push', '-u', 'origin', 'develop'], cwd=project_path, debug=debug)
+        run_command(['git', 'checkout', '-b', 'develop'], cwd=project_path)
+        run_command(['git', 'push', '-u', 'origin', 'develop'], cwd=project_path)
 
         # 3. Créer feature branch depuis develop
         info("Création de feature/readme")
-        run_command(['git', 'checkout', '-b', 'feature/readme'], cwd=project_path, debug=debug)
+        run_command(['git', 'checkout', '-b', 'feature/readme'], cwd=project_path)
 
         # 4. Créer README avec contenu dynamique
         info("Génération du README.md")
         readme_path = Path(project_path) / "README.md"
-        readme_content = f"""# {project_name}
-
-Projet {project_name} créé avec Git Auto-Flow.
-
-## Installation
-
-```bash
-git clone https://github.com/[ORG]/{project_name}.git
-cd {project_name}
-```
-## Utilisation
-À documenter...
-"""
-        readme_path.write_text(readme_content)
+        readme_path.write_text(readme_content(project_name))
 
         # 5. Commit et push feature
-        run_command(['git', 'add', 'README.md'], cwd=project_path, debug=debug)
-        run_command(['git', 'commit', '-m', 'feat: Add README.md'], cwd=project_path, debug=debug)
-        run_command(['git', 'push', '-u', 'origin', 'feature/readme'], cwd=project_path, debug=debug)
+        run_command(['git', 'add', 'README.md'], cwd=project_path)
+        run_command(['git', 'commit', '-m', 'feat: Add README.md'], cwd=project_path)
+        run_command(['git', 'push', '-u', 'origin', 'feature/readme'], cwd=project_path)
 
         # 6. PR feature → develop + merge automatique
         info("Création PR feature/readme → develop")
-        run_command(['gh', 'pr', 'create', '--base', 'develop', '--head', 'feature/readme',
-                    '--title', 'feat: Add README', '--body', 'Initial README', '--fill'], cwd=project_path, debug=debug)
-        run_command(['gh', 'pr', 'merge', '--squash'], cwd=project_path, debug=debug)
+        client = get_github_client()
+        pull = client.create_pull(repo_full_name, head='feature/readme', base='develop',
+                                  title='feat: Add README', body='Initial README')
+        client.wait_pull_mergeable(repo_full_name, pull['number'])
+        client.merge_pull(repo_full_name, pull['number'], 'squash')
 
         # 7. Retour sur develop et pull des changements
-        run_command(['git', 'checkout', 'develop'], cwd=project_path, debug=debug)
-        run_command(['git', 'pull'], cwd=project_path, debug=debug)
+        run_command(['git', 'checkout', 'develop'], cwd=project_path)
+        run_command(['git', 'pull'], cwd=project_path)
 
         # 8. PR develop → main + merge automatique
         info("Création PR develop → main (Release)")
-        run_command(['gh', 'pr', 'create', '--base', 'main', '--head', 'develop',
-                    '--title', 'Release v0.1.0', '--body', 'First release', '--fill'], cwd=project_path, debug=debug)
-        run_command(['gh', 'pr', 'merge', '--squash'], cwd=project_path, debug=debug)
+        pull = client.create_pull(repo_full_name, head='develop', base='main',
+                                  title='Release v0.1.0', body='First release')
+        client.wait_pull_mergeable(repo_full_name, pull['number'])
+        client.merge_pull(repo_full_name, pull['number'], 'squash')
 
         # 9. Tag de release
         info("Création du tag v0.1.0")
-        run_command(['git', 'checkout', 'main'], cwd=project_path, debug=debug)
-        run_command(['git', 'pull'], cwd=project_path, debug=debug)
-        run_command(['git', 'tag', 'v0.1.0'], cwd=project_path, debug=debug)
-        run_command(['git', 'push', '--tags'], cwd=project_path, debug=debug)
+        run_command(['git', 'checkout', 'main'], cwd=project_path)
+        run_command(['git', 'pull'], cwd=project_path)
+        run_command(['git', 'tag', 'v0.1.0'], cwd=project_path)
+        run_command(['git', 'push', '--tags'], cwd=project_path)
 
         # 10. NETTOYAGE : Supprimer la branche feature/readme
         info("Nettoyage des branches temporaires")
-        run_command(['git', 'push', 'origin', '--delete', 'feature/readme'], cwd=project_path, debug=debug)
-        run_command(['git', 'branch', '-D', 'feature/readme'], cwd=project_path, debug=debug)
+        run_command(['git', 'push', 'origin', '--delete', 'feature/readme'], cwd=project_path)
+        run_command(['git', 'branch', '-D', 'feature/readme'], cwd=project_path)
 
         success("✅ Workflow complet terminé !")
         success("✅ Repository prêt avec README, branches GitFlow et release v0.1.0")
@@ -301,13 +326,17 @@ cd {project_name}
 
 
 @app.command(name="create")
+@profiled("repo-create")
 def create_repo(
     repo_spec: str = typer.Argument(..., help="Repository à créer (format: owner/repo-name ou repo-name)"),
     private: bool = typer.Option(True, "--private/--public", help="Repository privé ou public"),
     force: bool = typer.Option(False, "--force", "-f", help="Mode non-interactif (aucune confirmation)"),
-    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes exécutées")
+    audit_prs: bool = typer.Option(False, "--audit-prs", help="Setup via PRs mergées (feature/readme → develop → main) au lieu du push atomique"),
+    debug: bool = typer.Option(False, "--debug", help="Affiche les commandes exécutées"),
+    profile: Optional[str] = PROFILE_OPTION
 ):
     """Crée un nouveau repository GitHub et setup l'environnement complet"""
+    set_global_debug_mode(debug)
 
     # Parser le format owner/repo-name ou repo-name
     if '/' in repo_spec:
@@ -364,30 +393,26 @@ def create_repo(
         info("🚀 Mode force activé - Création automatique du repository")
 
     try:
-        # Création du repo via gh CLI
+        # Création du repo via l'API GitHub (gh en fallback)
         info("Création du repository GitHub en cours...")
 
-        visibility_flag = '--private' if private else '--public'
-
-        cmd = [
-            'gh', 'repo', 'create',
-            f'{github_org}/{project_name}',
-            visibility_flag,
-            '--description', f'Projet {project_name} créé avec Git Auto-Flow'
-        ]
-
-        run_command(cmd, check=True, debug=debug)
+        get_github_client().create_repo(github_org, project_name, private=private,
+                                        description=f'Projet {project_name} créé avec Git Auto-Flow')
         success(f"Repository GitHub {'privé' if private else 'public'} {github_org}/{project_name} créé avec succès!")
 
-        # Configuration des permissions
-        set_github_actions_permissions(f"{github_org}/{project_name}", force=force, debug=debug)
-
-        # Délai pour laisser GitHub propager le repository
+        # Attendre que GitHub ait propagé le repository
         info("Attente de la propagation du repository GitHub...")
-        time.sleep(3)
+        ready = get_github_client().wait_repo_ready(f"{github_org}/{project_name}")
+        if ready:
+            info(f"Repository accessible après {ready.waited:.1f}s")
+        else:
+            warning(f"Repository toujours inaccessible après {ready.waited:.1f}s, poursuite du setup")
 
-    except CalledProcessError as e:
-        if "already exists" in str(e.stderr):
+        # Configuration des permissions
+        set_github_actions_permissions(f"{github_org}/{project_name}", force=force)
+
+    except GitHubError as e:
+        if "already exists" in str(e) or "already exists" in str(e.data):
             warning(f"Le repository {repo_url} existe déjà.")
             if not force and not confirm("Voulez-vous continuer le setup local avec ce repo existant ?"):
                 warning("Opération annulée.")
@@ -398,7 +423,7 @@ def create_repo(
 
     # WORKFLOW DE SETUP
     if not force:
-        if not confirm("🚀 Lancer le workflow de setup complet (clone, branches, README, PR, release) ?"):
+        if not confirm("🚀 Lancer le workflow de setup complet (clone, branches, README, release) ?"):
             warning("Workflow de setup annulé.")
             info(f"Vous pouvez cloner manuellement le repo: git clone {repo_url}.git")
             raise typer.Exit(0)
@@ -421,9 +446,19 @@ def create_repo(
             info("Lancez `git pc` pour la configurer.")
             raise typer.Exit(1)
 
-        project_path = setup_local_repo(project_name, f"{repo_url}.git", working_dir, force=force, debug=debug)
+        project_path = setup_local_repo(project_name, f"{repo_url}.git", working_dir, force=force)
 
-        if not create_readme_workflow(project_path, project_name, debug=debug):
+        # Repo vide: bootstrap rapide; PRs d'audit sur demande ou si le repo a déjà un historique
+        has_history = run_command(['git', 'rev-parse', '--verify', '--quiet', 'HEAD'],
+                                  cwd=project_path, check=False).returncode == 0
+        if has_history and not audit_prs:
+            info("Le repository contient déjà des commits: setup via PRs")
+        if audit_prs or has_history:
+            setup_ok = create_readme_workflow(project_path, project_name, f"{github_org}/{project_name}")
+        else:
+            setup_ok = bootstrap_repository(project_path, project_name)
+
+        if not setup_ok:
             error("❌ Le workflow de setup a échoué")
             raise typer.Exit(1)
 
@@ -447,6 +482,7 @@ def delete(
     debug: bool = typer.Option(False, "--debug", help="Affiche les commandes exécutées")
 ):
     """Supprime un repository GitHub (ATTENTION: action irréversible!)"""
+    set_global_debug_mode(debug)
 
     if not check_prerequisites():
         raise typer.Exit(1)
@@ -457,9 +493,7 @@ def delete(
     else:
         # Utiliser l'utilisateur GitHub courant
         try:
-            result = subprocess.run(['gh', 'api', 'user'], capture_output=True, text=True, check=True)
-            user_data = json.loads(result.stdout)
-            owner = user_data.get('login', 'unknown')
+            owner = get_github_client().get_user().get('login', 'unknown')
             repo_name = repo_spec
             repo_spec = f"{owner}/{repo_name}"
         except:
@@ -470,11 +504,9 @@ def delete(
 
     # Vérifier que le repository existe
     try:
-        if debug:
-            info(f"[DEBUG] Vérification de l'existence: gh repo view {repo_spec}")
-        result = subprocess.run(['gh', 'repo', 'view', repo_spec], capture_output=True, text=True, check=True)
+        get_github_client().get_repo(repo_spec)
         info(f"✅ Repository trouvé: {repo_spec}")
-    except subprocess.CalledProcessError:
+    except GitHubError:
         error(f"❌ Repository '{repo_spec}' introuvable ou inaccessible")
         raise typer.Exit(1)
 
@@ -500,23 +532,17 @@ def delete(
         warning("🔥 MODE FORCE - Suppression automatique sans confirmation")
 
     try:
-        # Commande de suppression
-        cmd = ['gh', 'repo', 'delete', repo_spec, '--yes']
-
-        if debug:
-            info(f"[DEBUG] Commande: {' '.join(cmd)}")
-
         info(f"🗑️ Suppression en cours de {repo_spec}...")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        get_github_client().delete_repo(repo_spec)
 
         success(f"✅ Repository '{repo_spec}' supprimé avec succès!")
         info("💡 Le repository n'est plus accessible et toutes ses données sont perdues")
 
-    except subprocess.CalledProcessError as e:
-        error(f"❌ Erreur lors de la suppression: {e.stderr if e.stderr else str(e)}")
-        if "403" in str(e.stderr):
-            error("💡 Vérifiez que vous avez les permissions d'administration sur ce repository")
-        elif "404" in str(e.stderr):
+    except GitHubError as e:
+        error(f"❌ Erreur lors de la suppression: {e}")
+        if e.status == 403:
+            error("💡 Vérifiez que vous avez les permissions d'administration sur ce repository (scope delete_repo)")
+        elif e.status == 404:
             error("💡 Le repository n'existe pas ou n'est pas accessible")
         raise typer.Exit(1)
 
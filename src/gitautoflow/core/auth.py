@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+GitAutoFlow - Validation de l'authentification GitHub
+
+Une validation réussie (utilisateur, scopes, expiration du token) est mise en
+cache sur disque par empreinte du token pendant GITAUTOFLOW_AUTH_TTL secondes
+(6h par défaut): les commandes suivantes ne lancent ni `gh --version` ni
+`gh auth status` et ne font aucun appel réseau. Le cache est ignoré quand le
+token change, quand il expire, ou dès qu'un appel GitHub répond 401.
+"""
+
+import hashlib
+import os
+import time
+from datetime import datetime
+from typing import Optional
+
+from ..utils.logger import info, error
+from ..lib.cache import JsonCache
+from .github import GitHubError, get_github_client
+
+
+# Durée de validité par défaut d'une validation réussie (secondes)
+DEFAULT_AUTH_TTL = 6 * 3600
+
+
+def _auth_ttl() -> float:
+    try:
+        return float(os.getenv('GITAUTOFLOW_AUTH_TTL', DEFAULT_AUTH_TTL))
+    except ValueError:
+        return DEFAULT_AUTH_TTL
+
+
+def _parse_expiration(value: Optional[str]) -> Optional[float]:
+    """Timestamp de l'en-tête GitHub-Authentication-Token-Expiration (ex: 2026-11-01 12:00:00 UTC)"""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value.strip().replace(' UTC', ' +0000'), '%Y-%m-%d %H:%M:%S %z').timestamp()
+    except ValueError:
+        return None
+
+
+def _store() -> JsonCache:
+    return JsonCache('github-auth', namespace="v1", max_entries=50, shared=True)
+
+
+def token_fingerprint() -> str:
+    """Empreinte de l'identité GitHub courante (hôte + token, ou gh sans token)"""
+    client = get_github_client()
+    return hashlib.sha256(f"{client.api_url} {client.token or 'gh'}".encode()).hexdigest()[:16]
+
+
+def forget_github_auth() -> None:
+    """Invalide la validation en cache (ex: un appel a répondu 401)"""
+    store = _store()
+    store.set(token_fingerprint(), None)
+    store.save()
+
+
+def validate_github_auth(force: bool = False) -> Optional[dict]:
+    """
+    Valide l'authentification GitHub, depuis le cache si une validation récente existe
+
+    Args:
+        force: Ignorer le cache et revalider auprès de GitHub
+
+    Returns:
+        dict: {'login', 'scopes', 'expires_at', 'validated_at'}, ou None si l'authentification échoue
+
+    Raises:
+        GitHubError: Si GitHub est injoignable ou si gh n'est pas installé (sans token)
+    """
+    store = _store()
+    key = token_fingerprint()
+    now = time.time()
+
+    cached = None if force else store.get(key)
+    if cached and now - cached.get('validated_at', 0) < _auth_ttl() \
+            and (not cached.get('expires_at') or cached['expires_at'] > now):
+        return cached
+
+    client = get_github_client()
+    try:
+        # Relu même si le client l'a déjà en mémoire: ce sont les en-têtes de
+        # cette réponse (scopes, expiration) qui sont validés
+        user = client.get_user(refresh=True)
+    except GitHubError as e:
+        if e.status == 401 or (client.uses_gh and e.status is None and 'auth' in str(e).lower()):
+            return None
+        raise
+
+    headers = client.last_response_headers
+    scopes = headers.get('X-OAuth-Scopes')
+    status = {
+        'login': user.get('login'),
+        # Scopes absents d'une réponse 304 ou d'un token fine-grained: on garde les précédents
+        'scopes': [scope.strip() for scope in scopes.split(',') if scope.strip()] if scopes is not None
+                  else (cached or {}).get('scopes'),
+        'expires_at': _parse_expiration(headers.get('GitHub-Authentication-Token-Expiration')),
+        'validated_at': now,
+    }
+    store.set(key, status)
+    store.save()
+    return status
+
+
+def ensure_github_auth() -> bool:
+    """
+    Vérifie qu'un accès GitHub authentifié est disponible (token ou gh)
+
+    Returns:
+        bool: True si les appels GitHub peuvent être faits
+    """
+    client = get_github_client()
+    try:
+        status = validate_github_auth()
+    except GitHubError as e:
+        if client.uses_gh:
+            error("GitHub CLI (gh) n'est pas installé ou n'est pas authentifié")
+            info("💡 Installation: https://cli.github.com/ puis: gh auth login (ou définissez GITHUB_TOKEN)")
+        else:
+            error(f"Impossible de valider l'accès GitHub: {e}")
+        return False
+
+    if status is None:
+        if client.uses_gh:
+            error("GitHub CLI n'est pas authentifié")
+            info("💡 Connectez-vous: gh auth login (ou définissez GITHUB_TOKEN)")
+        else:
+            error("Token GitHub invalide ou expiré (GITHUB_TOKEN / GH_TOKEN / gh auth token)")
+        return False
+
+    return True
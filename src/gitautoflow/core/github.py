@@ -1,18 +1,603 @@
 #!/usr/bin/env python3
 """
 GitAutoFlow - Module de gestion GitHub
+
+Client de l'API GitHub partagé par toutes les commandes: une session HTTP
+keep-alive (connexions TLS réutilisées) et un token résolu une seule fois
+(GITHUB_TOKEN / GH_TOKEN, sinon `gh auth token`). Sans token ou sans
+`requests`, les mêmes appels REST/GraphQL passent par `gh api` (fallback).
+GITHUB_API_URL permet de cibler GitHub Enterprise.
 """
 
+import atexit
+import hashlib
+import json
+import os
+import threading
+import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, TypeVar, Union
+from urllib.parse import quote, urlencode
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:  # Fallback gh uniquement
+    requests = None
+
 from ..utils.logger import info, success, error, warning, header
+from ..lib.cache import JsonCache
+from ..lib.command_runner import run_command
+from ..lib.debug_logger import debug_command
+from ..lib.rate_limit import GitHubRateLimiter
+from ..lib.readiness import WaitResult, wait_until
+from ..lib.tracing import span
+
+
+DEFAULT_API_URL = "https://api.github.com"
+
+# Timeout (secondes) d'une requête HTTP, surchargeable par GITAUTOFLOW_TIMEOUT_GITHUB
+DEFAULT_HTTP_TIMEOUT = 30.0
+
+# Taille du pool de connexions keep-alive
+POOL_SIZE = 16
+
+# Bornes du cache HTTP (réponses GET avec ETag / Last-Modified)
+HTTP_CACHE_MAX_ENTRIES = 2000
+HTTP_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+# Nombre de requêtes GitHub simultanées pour les opérations non groupables
+# (surchargeable par GITAUTOFLOW_GITHUB_JOBS)
+DEFAULT_GITHUB_JOBS = 4
+
+# Nouvelles tentatives d'une requête refusée par une limite de débit
+MAX_RATE_LIMIT_RETRIES = 5
+
+# Nombre de mutations createIssue regroupées (alias) dans une requête GraphQL
+ISSUE_BATCH_SIZE = 20
+
+
+class GitHubError(RuntimeError):
+    """Erreur d'un appel GitHub (API HTTP ou gh)"""
+
+    def __init__(self, message: str, status: Optional[int] = None, data: Any = None,
+                 headers: Optional[Mapping[str, str]] = None):
+        super().__init__(message)
+        self.status = status
+        self.data = data
+        self.headers = headers
+
+
+def get_api_url() -> str:
+    """URL de l'API GitHub (GITHUB_API_URL pour GitHub Enterprise)"""
+    return os.getenv('GITHUB_API_URL', DEFAULT_API_URL).rstrip('/')
+
+
+def _http_timeout() -> float:
+    try:
+        return float(os.getenv('GITAUTOFLOW_TIMEOUT_GITHUB', DEFAULT_HTTP_TIMEOUT))
+    except ValueError:
+        return DEFAULT_HTTP_TIMEOUT
+
+
+def github_jobs() -> int:
+    """Nombre de workers pour les appels GitHub parallèles (GITAUTOFLOW_GITHUB_JOBS)"""
+    try:
+        return max(1, int(os.getenv('GITAUTOFLOW_GITHUB_JOBS', DEFAULT_GITHUB_JOBS)))
+    except ValueError:
+        return DEFAULT_GITHUB_JOBS
+
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def map_bounded(func: Callable[[T], R], items: Iterable[T], max_workers: Optional[int] = None) -> List[R]:
+    """
+    Applique func à chaque élément sur un pool borné, résultats dans l'ordre des éléments
+
+    Args:
+        func: Fonction appelée pour chaque élément (doit gérer ses propres erreurs)
+        items: Éléments à traiter
+        max_workers: Taille du pool (défaut: github_jobs())
+
+    Returns:
+        list: Les résultats, dans l'ordre des éléments
+    """
+    items = list(items)
+    workers = min(max_workers or github_jobs(), len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="github") as executor:
+        # Copie du contexte pour que les spans des workers s'imbriquent sous le span courant
+        futures = [executor.submit(copy_context().run, func, item) for item in items]
+        return [future.result() for future in futures]
+
+
+def resolve_github_token() -> Optional[str]:
+    """
+    Résout le token GitHub: GITHUB_TOKEN, GH_TOKEN, sinon `gh auth token`
+
+    Returns:
+        str: Le token, ou None si aucun n'est disponible
+    """
+    token = os.getenv('GITHUB_TOKEN') or os.getenv('GH_TOKEN')
+    if token:
+        return token.strip()
+    try:
+        result = run_command(['gh', 'auth', 'token'], description="token GitHub", capture_output=True, text=True)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    token = result.stdout.strip() if result.returncode == 0 else ''
+    return token or None
+
+
+class GitHubClient:
+    """Client REST/GraphQL GitHub avec session keep-alive (ou `gh api` en fallback)"""
+
+    def __init__(self, token: Optional[str] = None, api_url: Optional[str] = None):
+        """
+        Args:
+            token: Token GitHub (None: appels via `gh api`)
+            api_url: URL de l'API (défaut: GITHUB_API_URL ou api.github.com)
+        """
+        self.api_url = (api_url or get_api_url()).rstrip('/')
+        self.token = token
+        self.session = None
+        self.rate_limiter = GitHubRateLimiter()
+        self.http_cache: Optional[JsonCache] = None
+        self._cache_lock = threading.Lock()
+        self._local = threading.local()
+        self._user: Optional[dict] = None
+
+        if token and requests is not None:
+            self.session = requests.Session()
+            self.session.headers.update({
+                'Authorization': f'Bearer {token}',
+                'Accept': 'application/vnd.github+json',
+                'X-GitHub-Api-Version': '2022-11-28',
+                'User-Agent': 'gitautoflow',
+            })
+            # Retries uniquement sur erreurs transitoires des méthodes idempotentes
+            retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504),
+                          allowed_methods=frozenset(['GET', 'HEAD', 'PUT', 'DELETE']))
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE, max_retries=retry)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+
+            # Cache des GET partagé entre commandes, processus et identités: chaque
+            # entrée est préfixée par l'empreinte du token et de l'hôte
+            self._cache_identity = hashlib.sha256(f"{self.api_url} {token}".encode()).hexdigest()[:16]
+            self.http_cache = JsonCache('github-http', namespace="v2",
+                                        max_entries=HTTP_CACHE_MAX_ENTRIES, max_bytes=HTTP_CACHE_MAX_BYTES,
+                                        shared=True)
+            atexit.register(self.save_cache)
+
+    def save_cache(self) -> None:
+        """Persiste le cache HTTP (fusionné sous verrou avec celui des autres processus)"""
+        if self.http_cache is not None:
+            with self._cache_lock:
+                self.http_cache.save()
+
+    @property
+    def last_response_headers(self) -> Mapping[str, str]:
+        """En-têtes de la dernière réponse HTTP reçue par le thread courant (vide via gh)"""
+        return getattr(self._local, 'headers', None) or {}
+
+    @property
+    def uses_gh(self) -> bool:
+        """Vrai si les appels passent par `gh api` (pas de token ou pas de requests)"""
+        return self.session is None
+
+    def request(self, method: str, path: str, payload: Any = None, params: Optional[dict] = None) -> Any:
+        """
+        Appel REST GitHub
+
+        Args:
+            method: Méthode HTTP (GET, POST, PATCH, PUT, DELETE)
+            path: Chemin de l'API (ex: /repos/owner/repo/pulls) ou URL complète
+            payload: Corps JSON de la requête
+            params: Paramètres de query string
+
+        Returns:
+            La réponse JSON décodée (None si vide)
+
+        Raises:
+            GitHubError: Si GitHub répond une erreur
+
+        Les requêtes refusées par une limite de débit (primaire ou secondaire) sont
+        rejouées après l'attente indiquée par GitHub, pour tous les workers à la fois.
+        """
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            with self.rate_limiter.slot():
+                try:
+                    if self.session is None:
+                        return self._gh_api(method, path, payload, params)
+                    return self._http(method, path, payload, params)
+                except GitHubError as e:
+                    if e.status == 401:
+                        # Token révoqué ou expiré: la validation en cache n'est plus fiable
+                        from .auth import forget_github_auth
+                        forget_github_auth()
+                    delay = self.rate_limiter.on_error(e.status, e.headers, str(e))
+                    if delay is None or attempt == MAX_RATE_LIMIT_RETRIES:
+                        raise
+            warning(f"⏳ Limite de débit GitHub atteinte ({method} {path}), nouvelle tentative dans {delay:.0f}s...")
+
+    def _http(self, method: str, path: str, payload: Any = None, params: Optional[dict] = None) -> Any:
+        """
+        Appel REST via la session keep-alive
+
+        Les GET sont conditionnels quand une réponse précédente est en cache
+        (If-None-Match / If-Modified-Since): un 304 renvoie la réponse en cache
+        et ne consomme pas de quota.
+        """
+        url = path if path.startswith('http') else f"{self.api_url}/{path.lstrip('/')}"
+        cache_key = cached = None
+        headers = {}
+        if method == 'GET' and self.http_cache is not None:
+            cache_key = f"{self._cache_identity} {url}?{json.dumps(params or {}, sort_keys=True)}"
+            with self._cache_lock:
+                cached = self.http_cache.get(cache_key)
+            if cached:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
+
+        debug_command([method, url], "API GitHub")
+        with span(f"{method} {path}", "http", url=url) as http_span:
+            try:
+                response = self.session.request(method, url, json=payload, params=params, headers=headers,
+                                                timeout=_http_timeout())
+            except requests.RequestException as e:
+                raise GitHubError(f"Erreur réseau GitHub ({method} {path}): {e}")
+            http_span.set(status=response.status_code, cached=response.status_code == 304)
+        self.rate_limiter.observe(response.headers)
+        self._local.headers = response.headers
+
+        if response.status_code == 304 and cached:
+            return cached['body']
+
+        data = None
+        if response.content:
+            try:
+                data = response.json()
+            except ValueError:
+                data = response.text
+        if response.status_code >= 400:
+            message = data.get('message') if isinstance(data, dict) else str(data or '')
+            raise GitHubError(f"GitHub API {method} {path}: {response.status_code} {message}",
+                              status=response.status_code, data=data, headers=response.headers)
+
+        etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+        if cache_key and (etag or last_modified):
+            with self._cache_lock:
+                self.http_cache.set(cache_key, {'etag': etag, 'last_modified': last_modified, 'body': data})
+        return data
+
+    def _gh_api(self, method: str, path: str, payload: Any = None, params: Optional[dict] = None) -> Any:
+        """Même appel REST via `gh api` (auth et hôte gérés par gh)"""
+        endpoint = path
+        if path.startswith('http'):
+            endpoint = path[len(self.api_url):] if path.startswith(self.api_url) else path
+        if params:
+            query = urlencode(params, doseq=True)
+            endpoint = f"{endpoint}{'&' if '?' in endpoint else '?'}{query}"
+
+        cmd = ['gh', 'api', '--method', method, endpoint.lstrip('/')]
+        if payload is not None:
+            cmd.extend(['--input', '-'])
+        try:
+            result = run_command(cmd, description="API GitHub (gh)", capture_output=True, text=True,
+                                 input=json.dumps(payload) if payload is not None else None)
+        except FileNotFoundError:
+            raise GitHubError("GitHub CLI (gh) non installé et aucun token GitHub (GITHUB_TOKEN)")
+
+        data = None
+        if result.stdout.strip():
+            try:
+                data = json.loads(result.stdout)
+            except ValueError:
+                data = result.stdout
+        if result.returncode != 0:
+            match = re.search(r'HTTP (\d{3})', result.stderr)
+            raise GitHubError(f"GitHub API {method} {path}: {result.stderr.strip()}",
+                              status=int(match.group(1)) if match else None, data=data)
+        return data
+
+    def paginate(self, path: str, params: Optional[dict] = None) -> List[Any]:
+        """GET paginé (100 éléments par page) jusqu'à la dernière page"""
+        params = dict(params or {}, per_page=100)
+        items: List[Any] = []
+        page = 1
+        while True:
+            batch = self.request('GET', path, params=dict(params, page=page)) or []
+            items.extend(batch)
+            if len(batch) < 100:
+                return items
+            page += 1
+
+    def graphql(self, query: str, variables: Optional[dict] = None) -> dict:
+        """
+        Requête GraphQL
+
+        Returns:
+            dict: Le champ `data` de la réponse
+
+        Raises:
+            GitHubError: Si la réponse contient des erreurs
+        """
+        response = self._graphql_response(query, variables)
+        if response.get('errors'):
+            messages = '; '.join(err.get('message', '') for err in response['errors'])
+            raise GitHubError(f"GitHub GraphQL: {messages}", data=response)
+        return response.get('data') or {}
+
+    def _graphql_response(self, query: str, variables: Optional[dict] = None) -> dict:
+        """Réponse GraphQL brute (data + errors), pour les mutations partiellement réussies"""
+        # api.github.com/graphql, ou <hôte>/api/graphql pour GitHub Enterprise (<hôte>/api/v3)
+        base_url = self.api_url[:-len('/v3')] if self.api_url.endswith('/v3') else self.api_url
+        response = self.request('POST', f"{base_url}/graphql" if self.session else 'graphql',
+                                {'query': query, 'variables': variables or {}})
+        return response if isinstance(response, dict) else {}
+
+    # --- Utilisateur -----------------------------------------------------
+
+    def get_user(self, refresh: bool = False) -> dict:
+        """Utilisateur authentifié (mis en cache, relu si refresh)"""
+        if self._user is None or refresh:
+            self._user = self.request('GET', '/user')
+        return self._user
+
+    def get_user_emails(self) -> List[dict]:
+        return self.request('GET', '/user/emails') or []
+
+    # --- Repositories ----------------------------------------------------
+
+    def get_repo(self, full_name: str) -> dict:
+        return self.request('GET', f'/repos/{full_name}')
+
+    def create_repo(self, owner: str, name: str, private: bool = True, description: str = "") -> dict:
+        """Crée un repository pour l'utilisateur authentifié ou pour une organisation"""
+        payload = {'name': name, 'private': private, 'description': description}
+        if owner == self.get_user().get('login'):
+            return self.request('POST', '/user/repos', payload)
+        return self.request('POST', f'/orgs/{owner}/repos', payload)
+
+    def wait_repo_ready(self, full_name: str, timeout: Optional[float] = None) -> WaitResult:
+        """Attend que le repository nouvellement créé soit accessible via l'API"""
+        def check() -> Optional[dict]:
+            try:
+                return self.get_repo(full_name)
+            except GitHubError as e:
+                if e.status == 404:
+                    return None
+                raise
+
+        return wait_until(check, f"repository {full_name} accessible", timeout)
+
+    def delete_repo(self, full_name: str) -> None:
+        self.request('DELETE', f'/repos/{full_name}')
+
+    def set_workflow_permissions(self, full_name: str, permissions: str = 'write') -> None:
+        self.request('PUT', f'/repos/{full_name}/actions/permissions/workflow',
+                     {'default_workflow_permissions': permissions})
+
+    # --- Pull requests ---------------------------------------------------
+
+    def create_pull(self, full_name: str, head: str, base: str, title: str, body: str,
+                    draft: bool = False, labels: Optional[List[str]] = None) -> dict:
+        """Crée une PR (et pose les labels éventuels)"""
+        pull = self.request('POST', f'/repos/{full_name}/pulls',
+                            {'head': head, 'base': base, 'title': title, 'body': body, 'draft': draft})
+        if labels:
+            self.request('POST', f"/repos/{full_name}/issues/{pull['number']}/labels", {'labels': labels})
+        return pull
+
+    def get_pull(self, full_name: str, number: int) -> dict:
+        return self.request('GET', f'/repos/{full_name}/pulls/{number}')
+
+    def wait_pull_mergeable(self, full_name: str, number: int, timeout: Optional[float] = None) -> WaitResult:
+        """
+        Attend que GitHub ait calculé l'état `mergeable` de la PR (null tant que le calcul est en cours)
+
+        Returns:
+            WaitResult: `value` est la PR, `value['mergeable']` indique si elle peut être mergée
+        """
+        last = {}
+
+        def check() -> Optional[dict]:
+            last['pull'] = self.get_pull(full_name, number)
+            return last['pull'] if last['pull'].get('mergeable') is not None else None
+
+        result = wait_until(check, f"PR #{number} mergeable calculé", timeout)
+        result.value = result.value or last.get('pull')
+        return result
+
+    def merge_pull(self, full_name: str, number: int, method: str = 'merge') -> dict:
+        return self.request('PUT', f'/repos/{full_name}/pulls/{number}/merge', {'merge_method': method})
+
+    # --- Labels, issues, releases ----------------------------------------
+
+    def list_labels(self, full_name: str) -> List[str]:
+        return [label['name'] for label in self.paginate(f'/repos/{full_name}/labels')]
+
+    def get_label_ids(self, full_name: str) -> Dict[str, str]:
+        """
+        ID GraphQL des labels du repository
+
+        Lus en REST (GET conditionnels): d'une exécution à l'autre, les réponses
+        inchangées reviennent en 304 depuis le cache HTTP.
+
+        Returns:
+            dict: {nom du label: ID du label}
+        """
+        return {label['name']: label['node_id'] for label in self.paginate(f'/repos/{full_name}/labels')}
+
+    def create_label(self, full_name: str, name: str, color: str = "0969da") -> dict:
+        """Crée un label; retourne le label existant s'il a déjà été créé"""
+        try:
+            return self.request('POST', f'/repos/{full_name}/labels', {'name': name, 'color': color})
+        except GitHubError as e:
+            if e.status == 422 or 'already_exists' in str(e.data) or 'already exists' in str(e):
+                return self.request('GET', f"/repos/{full_name}/labels/{quote(name, safe='')}")
+            raise
+
+    def create_issue(self, full_name: str, title: str, body: str, labels: Optional[List[str]] = None) -> dict:
+        return self.request('POST', f'/repos/{full_name}/issues',
+                            {'title': title, 'body': body, 'labels': labels or []})
+
+    def create_issues_batch(self, repository_id: str,
+                            issues: List[dict]) -> List[Union[dict, GitHubError]]:
+        """
+        Crée des issues avec des mutations createIssue aliasées, ISSUE_BATCH_SIZE par requête
+
+        Args:
+            repository_id: ID GraphQL du repository (node_id de get_repo)
+            issues: Issues à créer: {'title', 'body', 'label_ids'}
+
+        Returns:
+            list: Dans l'ordre des issues, l'issue créée ({'number', 'id', 'node_id', 'html_url'},
+                  `id` étant l'ID numérique attendu par l'API REST) ou la GitHubError associée
+        """
+        results: List[Union[dict, GitHubError]] = []
+        for start in range(0, len(issues), ISSUE_BATCH_SIZE):
+            batch = issues[start:start + ISSUE_BATCH_SIZE]
+            declarations = ', '.join(f"$i{index}: CreateIssueInput!" for index in range(len(batch)))
+            mutations = '\n'.join(
+                f"  i{index}: createIssue(input: $i{index}) {{ issue {{ id number url databaseId }} }}"
+                for index in range(len(batch)))
+            variables = {
+                f"i{index}": {'repositoryId': repository_id, 'title': issue['title'],
+                              'body': issue['body'], 'labelIds': issue.get('label_ids') or []}
+                for index, issue in enumerate(batch)
+            }
+            try:
+                response = self._graphql_response(f"mutation({declarations}) {{\n{mutations}\n}}", variables)
+            except GitHubError as e:
+                results.extend(e for _ in batch)
+                continue
+
+            # Les mutations en échec sont nulles dans `data`, leur erreur porte l'alias dans `path`
+            errors = {}
+            for err in response.get('errors') or []:
+                alias = (err.get('path') or [None])[0]
+                errors[alias] = GitHubError(f"GitHub GraphQL: {err.get('message', '')}", data=err)
+            data = response.get('data') or {}
+            for index in range(len(batch)):
+                issue = (data.get(f"i{index}") or {}).get('issue')
+                if issue:
+                    results.append({'number': issue['number'], 'id': issue['databaseId'],
+                                    'node_id': issue['id'], 'html_url': issue['url']})
+                else:
+                    results.append(errors.get(f"i{index}") or errors.get(None)
+                                   or GitHubError("GitHub GraphQL: issue non créée", data=response))
+        return results
+
+    def wait_issues_visible(self, node_ids: List[str], timeout: Optional[float] = None) -> WaitResult:
+        """Attend que toutes les issues créées soient lisibles (une requête GraphQL `nodes` par vérification)"""
+        def check() -> bool:
+            response = self._graphql_response("query($ids: [ID!]!) { nodes(ids: $ids) { id } }", {'ids': node_ids})
+            nodes = (response.get('data') or {}).get('nodes') or []
+            return len(nodes) == len(node_ids) and all(nodes)
+
+        if not node_ids:
+            return WaitResult(True, True, 0.0, 0)
+        return wait_until(check, f"{len(node_ids)} issue(s) visibles", timeout)
+
+    def get_issue(self, full_name: str, number: int) -> dict:
+        return self.request('GET', f'/repos/{full_name}/issues/{number}')
+
+    def add_blocked_by(self, full_name: str, issue_number: int, blocking_issue_id: int) -> dict:
+        """Déclare que l'issue est bloquée par une autre (ID global de l'issue bloquante)"""
+        return self.request('POST', f'/repos/{full_name}/issues/{issue_number}/dependencies/blocked_by',
+                            {'issue_id': blocking_issue_id})
+
+    def create_annotated_tag(self, full_name: str, tag: str, message: str, sha: str) -> dict:
+        """
+        Crée un tag annoté (objet tag puis ref refs/tags/<tag>) via l'API Git Data
+
+        Args:
+            full_name: owner/repo
+            tag: Nom du tag
+            message: Message du tag
+            sha: Commit tagué
+
+        Returns:
+            dict: La ref créée
+        """
+        tag_object = self.request('POST', f'/repos/{full_name}/git/tags',
+                                  {'tag': tag, 'message': message, 'object': sha, 'type': 'commit'})
+        return self.request('POST', f'/repos/{full_name}/git/refs',
+                            {'ref': f'refs/tags/{tag}', 'sha': tag_object['sha']})
+
+    def create_release(self, full_name: str, tag: str, name: str, body: str,
+                       target: Optional[str] = None) -> dict:
+        payload = {'tag_name': tag, 'name': name, 'body': body}
+        if target:
+            payload['target_commitish'] = target
+        return self.request('POST', f'/repos/{full_name}/releases', payload)
+
+
+# Instance globale partagée pour l'exécution courante
+_github_client: Optional[GitHubClient] = None
+
+
+def get_github_client() -> GitHubClient:
+    """Récupère ou crée le client GitHub global (token résolu une seule fois)"""
+    global _github_client
+
+    if _github_client is None:
+        _github_client = GitHubClient(resolve_github_token())
+
+    return _github_client
+
+
+_current_repo: Optional[str] = None
+
+
+def get_current_repo() -> Optional[str]:
+    """owner/repo du remote origin du repository courant (mis en cache)"""
+    global _current_repo
+
+    if _current_repo is None:
+        from ..lib.git_utils import GitUtils
+        try:
+            owner, repo = GitUtils.get_repo_info()
+            _current_repo = f"{owner}/{repo}"
+        except RuntimeError:
+            return None
+
+    return _current_repo
+
+
+def parse_pull_number(pr_ref: str) -> int:
+    """Numéro de PR depuis une URL (https://github.com/o/r/pull/12) ou un numéro"""
+    return int(str(pr_ref).rstrip('/').split('/')[-1])
+
+
+def check_github_access() -> bool:
+    """
+    Vérifie qu'un accès GitHub authentifié est disponible (validation mise en cache, voir core/auth.py)
+
+    Returns:
+        bool: True si les appels GitHub peuvent être faits
+    """
+    from .auth import ensure_github_auth
+    return ensure_github_auth()
+
 
 def check_gh_cli():
     """Vérifier que gh CLI est installé et configuré"""
     try:
-        result = subprocess.run(['gh', 'auth', 'status'], 
-                              capture_output=True, text=True)
+        result = run_command(['gh', 'auth', 'status'],
+                           capture_output=True, text=True)
         if result.returncode != 0:
             error("GitHub CLI n'est pas authentifié")
             info("Lancez: gh auth login")
@@ -24,46 +609,28 @@ def check_gh_cli():
         return False
 
 def create_github_repo(project_name, org=None, force=False, private=True):
-    """Créer un repository GitHub via gh CLI"""
-    
+    """Créer un repository GitHub via l'API (gh en fallback)"""
+
     header(f"Création du repository GitHub: {project_name}")
-    
+
     # Vérification préalable
-    if not check_gh_cli():
+    if not check_github_access():
         return False
-    
-    # Construction de la commande
-    cmd = ['gh', 'repo', 'create']
-    
-    if org:
-        cmd.append(f"{org}/{project_name}")
-    else:
-        cmd.append(project_name)
-    
-    # Options
-    cmd.extend(['--description', f'Repository {project_name}'])
-    
-    if private:
-        cmd.append('--private')
-    else:
-        cmd.append('--public')
-    
-    if force:
-        cmd.append('--confirm')
-    
+
+    client = get_github_client()
+
     # Exécution
     try:
-        info(f"Commande: {' '.join(cmd)}")
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        
+        owner = org or client.get_user().get('login')
+        repo = client.create_repo(owner, project_name, private=private,
+                                  description=f'Repository {project_name}')
+
         success(f"Repository {project_name} créé avec succès!")
-        if result.stdout:
-            info(result.stdout.strip())
-        
+        if repo and repo.get('html_url'):
+            info(repo['html_url'])
+
         return True
-        
-    except subprocess.CalledProcessError as e:
+
+    except GitHubError as e:
         error(f"Erreur lors de la création: {e}")
-        if e.stderr:
-            error(f"Détails: {e.stderr.strip()}")
         return False
@@ -2,9 +2,21 @@
 Git Auto-Flow - Bibliothèque d'automation Git avec Multi-IA
 """
 
-from .ai_provider import AIProvider
-from .gemini_client import GeminiClient
-from .groq_client import GroqClient
-from .git_utils import GitUtils
+import importlib
 
-__all__ = ['AIProvider', 'GeminiClient', 'GroqClient', 'GitUtils']
\ No newline at end of file
+# Exports chargés à la demande: importer un sous-module (debug_logger, tracing...)
+# ne charge pas les SDK IA
+_EXPORTS = {
+    'AIProvider': '.ai_provider',
+    'GeminiClient': '.gemini_client',
+    'GroqClient': '.groq_client',
+    'GitUtils': '.git_utils',
+}
+
+__all__ = ['AIProvider', 'GeminiClient', 'GroqClient', 'GitUtils']
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
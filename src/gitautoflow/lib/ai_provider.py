@@ -7,6 +7,9 @@ import os
 from typing import Dict, Optional
 from dotenv import load_dotenv
 
+from .rate_limit import acquire_ai_slot
+from .tracing import span
+
 
 class AIProvider:
     """Gestionnaire intelligent multi-IA avec fallback automatique"""
@@ -88,6 +91,16 @@ class AIProvider:
                 return None
         return self.groq_client
     
+    def prepare_clients(self) -> None:
+        """
+        Construit à l'avance le client IA principal (import du SDK et configuration).
+        Aucune requête réseau: la connexion s'ouvre au premier appel d'analyse
+        """
+        if self.gemini_available:
+            self._get_gemini_client()
+        if not self.gemini_available and self.groq_available:
+            self._get_groq_client()
+
     def analyze_for_commit(self, diff: str, files: str) -> Dict:
         """
         Analyse intelligente avec fallback automatique
@@ -97,7 +110,9 @@ class AIProvider:
                 print("🤖 Analyse avec Gemini...")
                 client = self._get_gemini_client()
                 if client:
-                    return client.analyze_for_commit(diff, files)
+                    acquire_ai_slot()
+                    with span("gemini.analyze_for_commit", "ai", provider="gemini"):
+                        return client.analyze_for_commit(diff, files)
             except Exception as e:
                 print(f"❌ Gemini: {e}")
                 print("🔄 Fallback vers Groq...")
@@ -108,7 +123,9 @@ class AIProvider:
                 print("🚀 Analyse avec Groq (fallback)...")
                 client = self._get_groq_client()
                 if client:
-                    return client.analyze_for_commit(diff, files)
+                    acquire_ai_slot()
+                    with span("groq.analyze_for_commit", "ai", provider="groq"):
+                        return client.analyze_for_commit(diff, files)
             except Exception as e:
                 print(f"❌ Groq: {e}")
                 self.groq_available = False
@@ -127,7 +144,9 @@ class AIProvider:
                 print("🤖 Génération PR avec Gemini...")
                 client = self._get_gemini_client()
                 if client:
-                    return client.analyze_for_pr(diff, files, target_branch)
+                    acquire_ai_slot()
+                    with span("gemini.analyze_for_pr", "ai", provider="gemini"):
+                        return client.analyze_for_pr(diff, files, target_branch)
             except Exception as e:
                 print(f"❌ Gemini: {e}")
                 print("🔄 Fallback vers Groq...")
@@ -138,7 +157,9 @@ class AIProvider:
                 print("🚀 Génération PR avec Groq (fallback)...")
                 client = self._get_groq_client()
                 if client:
-                    return client.analyze_for_pr(diff, files, target_branch)
+                    acquire_ai_slot()
+                    with span("groq.analyze_for_pr", "ai", provider="groq"):
+                        return client.analyze_for_pr(diff, files, target_branch)
             except Exception as e:
                 print(f"❌ Groq: {e}")
                 self.groq_available = False
@@ -157,7 +178,9 @@ class AIProvider:
                 print("🤖 Génération Release PR avec Gemini...")
                 client = self._get_gemini_client()
                 if client:
-                    return client.analyze_for_release(diff, files, commits, latest_tag)
+                    acquire_ai_slot()
+                    with span("gemini.analyze_for_release", "ai", provider="gemini"):
+                        return client.analyze_for_release(diff, files, commits, latest_tag)
             except Exception as e:
                 print(f"❌ Gemini: {e}")
                 print("🔄 Fallback vers Groq...")
@@ -168,7 +191,9 @@ class AIProvider:
                 print("🚀 Génération Release PR avec Groq (fallback)...")
                 client = self._get_groq_client()
                 if client:
-                    return client.analyze_for_release(diff, files, commits, latest_tag)
+                    acquire_ai_slot()
+                    with span("groq.analyze_for_release", "ai", provider="groq"):
+                        return client.analyze_for_release(diff, files, commits, latest_tag)
             except Exception as e:
                 print(f"❌ Groq: {e}")
                 self.groq_available = False
@@ -187,7 +212,9 @@ class AIProvider:
                 print("🤖 Analyse avec Gemini...")
                 client = self._get_gemini_client()
                 if client:
-                    return client.generate_json_response(prompt)
+                    acquire_ai_slot()
+                    with span("gemini.generate_json_response", "ai", provider="gemini"):
+                        return client.generate_json_response(prompt)
             except Exception as e:
                 print(f"❌ Gemini: {e}")
                 print("🔄 Fallback vers Groq...")
@@ -198,7 +225,9 @@ class AIProvider:
                 print("🚀 Analyse avec Groq (fallback)...")
                 client = self._get_groq_client()
                 if client:
-                    return client.generate_json_response(prompt)
+                    acquire_ai_slot()
+                    with span("groq.generate_json_response", "ai", provider="groq"):
+                        return client.generate_json_response(prompt)
             except Exception as e:
                 print(f"❌ Groq: {e}")
                 self.groq_available = False
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Cache persistant sur disque (JSON) partagé entre les exécutions
+
+Emplacement: $GITAUTOFLOW_CACHE_DIR, sinon $XDG_CACHE_HOME/gitautoflow,
+sinon ~/.cache/gitautoflow. Le cache est best-effort: toute erreur d'E/S
+revient à un cache vide, jamais à un échec de la commande.
+GITAUTOFLOW_NO_CACHE=1 désactive la lecture et l'écriture du cache.
+"""
+
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: pas de verrou inter-processus
+    fcntl = None
+
+
+# Nombre d'entrées conservées par défaut (les moins récemment utilisées sont évincées)
+DEFAULT_MAX_ENTRIES = 20000
+
+
+def is_cache_disabled() -> bool:
+    """Indique si le cache disque est désactivé (GITAUTOFLOW_NO_CACHE)"""
+    return os.getenv('GITAUTOFLOW_NO_CACHE', '').lower() in ('1', 'true', 'yes')
+
+
+def get_cache_dir() -> str:
+    """Retourne le répertoire de cache de gitautoflow"""
+    explicit = os.getenv('GITAUTOFLOW_CACHE_DIR')
+    if explicit:
+        return os.path.expanduser(explicit)
+    base = os.getenv('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'gitautoflow')
+
+
+@contextmanager
+def locked_file(path: str):
+    """
+    Verrou exclusif inter-processus (flock sur <path>.lock) autour d'une section critique
+
+    Args:
+        path: Fichier protégé par le verrou
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(f"{path}.lock", 'a') as lock:
+        if fcntl:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+
+class JsonCache:
+    """
+    Dictionnaire persistant clé -> valeur JSON avec éviction LRU
+
+    Le `namespace` identifie la version des données (ex: version de l'outil et
+    hash de sa configuration): si celui du fichier diffère, le cache est vidé.
+
+    En mode `shared`, save() relit le fichier sous verrou et n'y applique que
+    les entrées modifiées par ce processus: plusieurs commandes concurrentes
+    enrichissent le même cache sans écraser les entrées des autres.
+    """
+
+    def __init__(self, name: str, namespace: str = "", max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: Optional[int] = None, shared: bool = False):
+        """
+        Args:
+            name: Nom du fichier de cache (sans extension)
+            namespace: Empreinte des données, invalide le cache quand elle change
+            max_entries: Nombre maximum d'entrées conservées
+            max_bytes: Taille maximale (JSON) des entrées conservées, None pour illimitée
+            shared: Fusionner avec le fichier sous verrou à l'écriture (accès multi-processus)
+        """
+        self.path = os.path.join(get_cache_dir(), f"{name}.json")
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.shared = shared
+        self.enabled = not is_cache_disabled()
+        self._entries: Optional[dict] = None
+        self._modified: set = set()
+        self._dirty = False
+
+    def _read_entries(self) -> Optional[dict]:
+        """Entrées du fichier, None s'il est absent, illisible ou d'un autre namespace"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('namespace') == self.namespace and isinstance(data.get('entries'), dict):
+                return data['entries']
+        except (OSError, ValueError, AttributeError):
+            pass
+        return None
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            self._entries = {}
+            if not self.enabled:
+                return self._entries
+            entries = self._read_entries()
+            if entries is not None:
+                self._entries = entries
+            elif os.path.exists(self.path):
+                # Données d'une autre version: on repart de zéro
+                self._dirty = True
+        return self._entries
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Retourne la valeur associée à la clé (et la marque comme récemment utilisée)"""
+        entry = self._load().get(key)
+        if entry is None:
+            return default
+        entry['atime'] = time.time()
+        self._modified.add(key)
+        self._dirty = True
+        return entry.get('value', default)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._load()
+
+    def set(self, key: str, value: Any) -> None:
+        """Enregistre une valeur (persistée au prochain save())"""
+        self._load()[key] = {'value': value, 'atime': time.time()}
+        self._modified.add(key)
+        self._dirty = True
+
+    def save(self) -> None:
+        """Écrit le cache sur disque (écriture atomique) après éviction des entrées les plus anciennes"""
+        if not self.enabled or not self._dirty or self._entries is None:
+            return
+
+        try:
+            if self.shared:
+                with locked_file(self.path):
+                    # Entrées écrites entre-temps par d'autres processus + nos modifications
+                    entries = self._read_entries() or {}
+                    entries.update((key, self._entries[key]) for key in self._modified if key in self._entries)
+                    self._write(entries)
+            else:
+                self._write(self._entries)
+            self._modified.clear()
+            self._dirty = False
+        except OSError:
+            pass
+
+    def _evict(self, entries: dict) -> dict:
+        """Conserve les entrées les plus récemment utilisées dans les limites de nombre et de taille"""
+        if len(entries) <= self.max_entries and self.max_bytes is None:
+            return entries
+        recent = sorted(entries.items(), key=lambda item: item[1].get('atime', 0), reverse=True)
+        recent = recent[:self.max_entries]
+        if self.max_bytes is not None:
+            kept, total = [], 0
+            for key, entry in recent:
+                total += len(json.dumps(entry))
+                if total > self.max_bytes:
+                    break
+                kept.append((key, entry))
+            recent = kept
+        return dict(recent)
+
+    def _write(self, entries: dict) -> None:
+        entries = self._evict(entries)
+        self._entries = entries
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), prefix='.tmp-', suffix='.json')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'namespace': self.namespace, 'entries': entries}, f)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Exécution centralisée des commandes externes (git, gh, gitleaks)
+
+Chaque appel passe par run_command qui:
+- affiche la commande en mode debug
+- applique un timeout par outil aux seules requêtes en lecture (status, diff,
+  log, fetch, ls-remote, gh api GET...), configurable via GITAUTOFLOW_TIMEOUT_<OUTIL>;
+  les commandes qui modifient le repository (commit, push, rebase, clone...)
+  ne sont jamais interrompues
+- enregistre argv, cwd, durée, code retour et taille de stdout/stderr dans le ledger
+- ouvre un span de traçage (--profile)
+"""
+
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Optional
+
+from rich.table import Table
+
+from .debug_logger import debug_command
+from .tracing import span
+
+
+# Timeouts par défaut (secondes) par outil, surchargeables par GITAUTOFLOW_TIMEOUT_GIT, etc.
+# Ils ne s'appliquent qu'aux commandes en lecture (voir is_read_only)
+DEFAULT_TIMEOUTS = {
+    'git': 300.0,
+    'gh': 120.0,
+    'gitleaks': 600.0,
+    'which': 10.0,
+}
+
+# Sous-commandes git qui ne modifient ni le working tree, ni l'index, ni les branches
+# (fetch et ls-remote: requêtes réseau, les refs de suivi sont mises à jour atomiquement)
+GIT_READ_ONLY = {
+    'cat-file', 'describe', 'diff', 'fetch', 'for-each-ref', 'hash-object', 'log', 'ls-files',
+    'ls-remote', 'merge-tree', 'rev-list', 'rev-parse', 'show', 'show-ref', 'status', 'version',
+}
+
+# Sous-commandes gh en lecture (gh api: seulement les GET sans champs)
+GH_READ_ONLY = {
+    ('--version',), ('auth', 'status'), ('auth', 'token'), ('pr', 'list'), ('pr', 'view'),
+    ('release', 'list'), ('release', 'view'), ('repo', 'view'),
+}
+
+# Options globales de git suivies d'une valeur (git -C <dir> -c <clé=valeur> ...)
+_GIT_OPTIONS_WITH_VALUE = {'-C', '-c', '--git-dir', '--work-tree', '--namespace'}
+
+# Code retour d'une commande interrompue par son timeout (comme timeout(1))
+TIMEOUT_RETURNCODE = 124
+
+
+class CommandTimeoutError(subprocess.CalledProcessError):
+    """Commande externe interrompue par son timeout"""
+
+    def __init__(self, command: List[str], timeout: float, output=None, stderr=None):
+        super().__init__(TIMEOUT_RETURNCODE, command, output, stderr)
+        self.timeout = timeout
+
+    def __str__(self) -> str:
+        tool = os.path.basename(self.cmd[0]) if self.cmd else ''
+        return (f"'{' '.join(self.cmd)}' interrompue après {self.timeout:g}s "
+                f"(augmentez GITAUTOFLOW_TIMEOUT_{tool.upper()}, 0 = sans limite)")
+
+
+class CommandRecord:
+    """Trace d'une commande externe exécutée"""
+
+    def __init__(self, argv: List[str], cwd: str):
+        self.argv = argv
+        self.cwd = cwd
+        self.duration = 0.0
+        self.returncode: Optional[int] = None
+        self.stdout_bytes: Optional[int] = None
+        self.stderr_bytes: Optional[int] = None
+        self.timed_out = False
+
+    @property
+    def tool(self) -> str:
+        return os.path.basename(self.argv[0]) if self.argv else ''
+
+
+class CommandLedger:
+    """Registre de toutes les commandes externes d'une exécution"""
+
+    def __init__(self):
+        self.records: List[CommandRecord] = []
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.records = []
+
+    def add(self, record: CommandRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    def slowest_table(self, limit: int = 10) -> Table:
+        """Tableau des commandes externes les plus lentes"""
+        with self._lock:
+            records = sorted(self.records, key=lambda r: r.duration, reverse=True)
+            total = sum(r.duration for r in self.records)
+            count = len(self.records)
+
+        table = Table(title=f"🐢 Commandes externes les plus lentes ({count} appels, {total:.2f} s au total)")
+        table.add_column("Commande")
+        table.add_column("cwd")
+        table.add_column("Durée", justify="right")
+        table.add_column("Code", justify="right")
+        table.add_column("stdout", justify="right")
+        table.add_column("stderr", justify="right")
+
+        for record in records[:limit]:
+            command = ' '.join(record.argv)
+            if len(command) > 60:
+                command = command[:57] + '...'
+            code = 'timeout' if record.timed_out else str(record.returncode)
+            table.add_row(
+                command,
+                record.cwd,
+                f"{record.duration * 1000:.0f} ms",
+                code,
+                _format_bytes(record.stdout_bytes),
+                _format_bytes(record.stderr_bytes)
+            )
+        return table
+
+
+def _format_bytes(size: Optional[int]) -> str:
+    if size is None:
+        return '-'
+    if size < 1024:
+        return f"{size} o"
+    return f"{size / 1024:.1f} Ko"
+
+
+def _output_size(output) -> Optional[int]:
+    if output is None:
+        return None
+    if isinstance(output, str):
+        return len(output.encode('utf-8', errors='replace'))
+    return len(output)
+
+
+def _git_subcommand(command: List[str]) -> str:
+    index = 1
+    while index < len(command) and command[index].startswith('-'):
+        index += 2 if command[index] in _GIT_OPTIONS_WITH_VALUE else 1
+    return command[index] if index < len(command) else ''
+
+
+def is_read_only(command: List[str]) -> bool:
+    """
+    Indique si la commande se contente de lire (et peut donc être interrompue sans risque)
+
+    Args:
+        command: argv de la commande
+
+    Returns:
+        bool: True pour une requête en lecture, False pour une commande qui modifie
+              le repository ou GitHub (commit, push, rebase, gh pr create...)
+    """
+    tool = os.path.basename(command[0]) if command else ''
+    if tool == 'git':
+        return _git_subcommand(command) in GIT_READ_ONLY
+    if tool == 'gh':
+        if tuple(command[1:2]) == ('api',):
+            arguments = command[2:]
+            method = next((arguments[i + 1] for i, arg in enumerate(arguments[:-1])
+                           if arg in ('-X', '--method')), 'GET')
+            writes = any(arg in ('-f', '-F', '--field', '--raw-field', '--input') for arg in arguments)
+            return method.upper() == 'GET' and not writes
+        return tuple(command[1:2]) in GH_READ_ONLY or tuple(command[1:3]) in GH_READ_ONLY
+    return tool in ('gitleaks', 'which')
+
+
+def get_default_timeout(command: List[str]) -> Optional[float]:
+    """Retourne le timeout applicable à la commande: None (sans limite) si elle n'est pas en lecture"""
+    if not is_read_only(command):
+        return None
+    tool = os.path.basename(command[0]) if command else ''
+    env_value = os.getenv(f'GITAUTOFLOW_TIMEOUT_{tool.upper()}')
+    if env_value:
+        try:
+            return float(env_value) or None
+        except ValueError:
+            pass
+    return DEFAULT_TIMEOUTS.get(tool)
+
+
+# Ledger global partagé
+_ledger = CommandLedger()
+
+
+def get_command_ledger() -> CommandLedger:
+    """Récupère le ledger global des commandes externes"""
+    return _ledger
+
+
+def run_command(command: List[str], description: str = "", timeout: Optional[float] = None,
+                **kwargs) -> subprocess.CompletedProcess:
+    """
+    Exécute une commande externe instrumentée
+
+    Args:
+        command: argv de la commande
+        description: Description affichée en mode debug
+        timeout: Timeout en secondes (défaut: selon l'outil pour les commandes en lecture,
+                 aucun pour les autres)
+        kwargs: Arguments transmis à subprocess.run (capture_output, text, check, cwd, ...)
+
+    Returns:
+        subprocess.CompletedProcess: Le résultat de la commande; après un timeout
+        sans check, code retour TIMEOUT_RETURNCODE et le message dans stderr
+
+    Raises:
+        subprocess.CalledProcessError: Si check=True et code retour non nul
+        CommandTimeoutError: Si check=True et la commande dépasse son timeout
+    """
+    debug_command(command, description)
+
+    if timeout is None:
+        timeout = get_default_timeout(command)
+
+    record = CommandRecord(list(command), str(kwargs.get('cwd') or '.'))
+    start = time.perf_counter()
+
+    with span(' '.join(command[:2]), "subprocess", argv=command, cwd=record.cwd) as current:
+        try:
+            result = subprocess.run(command, timeout=timeout, **kwargs)
+            record.returncode = result.returncode
+            record.stdout_bytes = _output_size(result.stdout)
+            record.stderr_bytes = _output_size(result.stderr)
+            current.set(returncode=result.returncode)
+            return result
+        except subprocess.CalledProcessError as e:
+            record.returncode = e.returncode
+            record.stdout_bytes = _output_size(e.stdout)
+            record.stderr_bytes = _output_size(e.stderr)
+            current.set(returncode=e.returncode)
+            raise
+        except subprocess.TimeoutExpired as e:
+            record.timed_out = True
+            record.returncode = TIMEOUT_RETURNCODE
+            current.set(timeout=timeout)
+            timeout_error = CommandTimeoutError(list(command), timeout, e.output, e.stderr)
+            if kwargs.get('check'):
+                raise timeout_error from None
+            stderr = str(timeout_error)
+            if not kwargs.get('text') and not kwargs.get('universal_newlines') \
+                    and not kwargs.get('encoding') and not kwargs.get('errors'):
+                stderr = stderr.encode()
+            stdout = e.output
+            if isinstance(stdout, bytes) and isinstance(stderr, str):
+                stdout = stdout.decode(errors='replace')
+            return subprocess.CompletedProcess(command, TIMEOUT_RETURNCODE, stdout, stderr)
+        finally:
+            record.duration = time.perf_counter() - start
+            _ledger.add(record)
+
+
+@contextmanager
+def stream_command(command: List[str], description: str = "", timeout: Optional[float] = None,
+                   check: bool = False, **kwargs):
+    """
+    Lance une commande externe dont la sortie est lue au fil de l'eau (stdout en pipe)
+
+    Le processus est tué s'il tourne encore à la sortie du bloc, ce qui permet
+    d'arrêter un listing dès qu'on a vu assez de résultats. stderr est conservé
+    (fichier temporaire) pour les erreurs.
+
+    Args:
+        command: argv de la commande
+        description: Description affichée en mode debug
+        timeout: Timeout en secondes (mêmes défauts que run_command)
+        check: Lève CalledProcessError si la commande échoue d'elle-même
+        kwargs: Arguments transmis à subprocess.Popen (cwd, env, ...)
+
+    Yields:
+        subprocess.Popen: Le processus, stdout lisible en binaire
+
+    Raises:
+        subprocess.CalledProcessError: Si check=True et code retour non nul (stderr joint)
+        CommandTimeoutError: Si la commande dépasse son timeout
+    """
+    debug_command(command, description)
+
+    if timeout is None:
+        timeout = get_default_timeout(command)
+
+    record = CommandRecord(list(command), str(kwargs.get('cwd') or '.'))
+    start = time.perf_counter()
+    stopped_early = False
+    stderr = b''
+
+    with span(' '.join(command[:2]), "subprocess", argv=command, cwd=record.cwd) as current, \
+            tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr_file, **kwargs)
+
+        def on_timeout():
+            record.timed_out = True
+            process.kill()
+
+        timer = threading.Timer(timeout, on_timeout) if timeout else None
+        if timer:
+            timer.daemon = True
+            timer.start()
+        try:
+            yield process
+        finally:
+            if timer:
+                timer.cancel()
+            if process.poll() is None:
+                try:
+                    # Sortie lue jusqu'au bout: le processus se termine de lui-même. Le pipe
+                    # reste ouvert pendant l'attente, sinon un processus arrêté en cours
+                    # d'écriture mourrait d'un SIGPIPE compté comme une erreur
+                    process.wait(timeout=0.05)
+                except subprocess.TimeoutExpired:
+                    stopped_early = True
+                    process.kill()
+                    current.set(killed=True)
+            process.stdout.close()
+            record.returncode = process.wait()
+            stderr_file.seek(0)
+            stderr = stderr_file.read()
+            record.stderr_bytes = len(stderr)
+            record.duration = time.perf_counter() - start
+            current.set(returncode=record.returncode)
+            if record.timed_out:
+                current.set(timeout=timeout)
+            _ledger.add(record)
+
+    # Atteint seulement si le bloc s'est terminé sans exception
+    if record.timed_out:
+        raise CommandTimeoutError(list(command), timeout, stderr=stderr)
+    if check and record.returncode != 0 and not stopped_early:
+        raise subprocess.CalledProcessError(record.returncode, list(command), stderr=stderr)
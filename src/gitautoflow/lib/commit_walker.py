@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Parcours en streaming d'une plage de commits
+
+`git log` est lu au fil de l'eau (enregistrements séparés par \\x1e, champs par
+\\x1f, fichiers par NUL): une release de plusieurs milliers de commits est
+parcourue en mémoire constante, sans limite arbitraire sur le nombre de commits.
+"""
+
+import subprocess
+from typing import Dict, Iterator, List, Optional
+
+from .command_runner import stream_command
+
+
+# Format d'un enregistrement: \x1e sha \x1f auteur \x1f sujet \x1f corps \x1f trailers \x1f [\0 fichiers\0...]
+_FORMAT = '%x1e%H%x1f%an <%ae>%x1f%s%x1f%b%x1f%(trailers:only,unfold)%x1f'
+
+
+class CommitRecord:
+    """Commit structuré lu depuis `git log`"""
+
+    def __init__(self, sha: str, author: str, subject: str, body: str,
+                 trailers: Dict[str, List[str]], files: List[str]):
+        self.sha = sha
+        self.author = author
+        self.subject = subject
+        self.body = body
+        self.trailers = trailers
+        self.files = files
+
+    @property
+    def message(self) -> str:
+        return f"{self.subject}\n\n{self.body}" if self.body else self.subject
+
+
+def _parse_trailers(raw: str) -> Dict[str, List[str]]:
+    trailers: Dict[str, List[str]] = {}
+    for line in raw.splitlines():
+        key, separator, value = line.partition(':')
+        if separator and key.strip():
+            trailers.setdefault(key.strip(), []).append(value.strip())
+    return trailers
+
+
+def _parse_record(raw: bytes) -> Optional[CommitRecord]:
+    record = raw.decode('utf-8', errors='replace')
+    fields = record.split('\x1f')
+    if len(fields) < 6:
+        return None
+    sha, author, subject, body, trailers = fields[:5]
+    # Après le dernier séparateur: liste des fichiers (--name-only -z), terminés par NUL
+    files = [path for path in fields[5].lstrip('\0\n').split('\0') if path]
+    return CommitRecord(sha, author, subject, body.strip(), _parse_trailers(trailers), files)
+
+
+def walk_commits(base: str, head: str = "HEAD", with_files: bool = True,
+                 no_merges: bool = True) -> Iterator[CommitRecord]:
+    """
+    Parcourt les commits base..head au fil de l'eau, du plus récent au plus ancien
+
+    Args:
+        base: Ref de référence (ex: origin/main)
+        head: Ref parcourue (par défaut: HEAD)
+        with_files: Inclure la liste des fichiers touchés par chaque commit
+        no_merges: Ignorer les commits de merge
+
+    Yields:
+        CommitRecord: Un enregistrement par commit
+    """
+    command = ['git', 'log', '-z', f'--format={_FORMAT}']
+    if with_files:
+        command.append('--name-only')
+    if no_merges:
+        command.append('--no-merges')
+    command.append(f'{base}..{head}')
+
+    try:
+        with stream_command(command, description=f"commits {base}..{head}", check=True) as process:
+            pending = b''
+            for chunk in iter(lambda: process.stdout.read(64 * 1024), b''):
+                *records, pending = (pending + chunk).split(b'\x1e')
+                for raw in records:
+                    if raw:
+                        commit = _parse_record(raw)
+                        if commit:
+                            yield commit
+            if pending:
+                commit = _parse_record(pending)
+                if commit:
+                    yield commit
+    except subprocess.CalledProcessError as e:
+        detail = e.stderr.decode(errors='replace').strip() if e.stderr else ''
+        raise RuntimeError(f"Erreur lors du parcours des commits {base}..{head}: {detail or e}")
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Calcul local de la prochaine version à partir des conventional commits
+
+Les messages des commits à releaser sont lus en un seul `git log` puis
+analysés localement (`type(scope)!: description`, trailers `BREAKING CHANGE:`).
+Les règles sont celles du prompt de release: breaking -> MAJOR, feat -> MINOR,
+tout autre type -> PATCH. Le résultat est déterministe; l'IA n'est nécessaire
+que si des commits ne respectent pas la convention.
+
+Le digest groupé par type (compteurs et nombre borné d'exemples par groupe)
+résume toute la plage à releaser pour le prompt de release.
+"""
+
+import os
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from .commit_walker import CommitRecord, walk_commits
+
+
+# Types reconnus (identiques à ceux imposés par les prompts de commit)
+CONVENTIONAL_TYPES = ('feat', 'fix', 'docs', 'style', 'refactor', 'perf', 'test', 'chore', 'ci', 'build', 'revert')
+
+BUMP_ORDER = ('patch', 'minor', 'major')
+
+_SUBJECT = re.compile(r'^(?P<type>[a-zA-Z]+)(?:\((?P<scope>[^()\r\n]*)\))?(?P<breaking>!)?: (?P<description>.+)$')
+_BREAKING_TRAILER = re.compile(r'^BREAKING[ -]CHANGE: ', re.MULTILINE)
+_VERSION = re.compile(r'^v*(\d+)\.(\d+)\.(\d+)')
+
+# Commits techniques ignorés: merges de PR/branches et commits de release
+_IGNORED_SUBJECT = re.compile(r'^(Merge (pull request|branch|remote-tracking branch) |Release v?\d)')
+
+# Nombre d'exemples de sujets conservés par groupe dans le digest
+DEFAULT_SAMPLES_PER_GROUP = 15
+
+# Nombre maximum d'issues référencées listées dans le digest
+MAX_REFERENCES = 30
+
+# Libellés des groupes du digest (ordre d'affichage)
+GROUP_LABELS = {
+    'breaking': "BREAKING CHANGES",
+    'feat': "Features",
+    'fix': "Bug fixes",
+    'perf': "Performance",
+    'refactor': "Refactoring",
+    'docs': "Documentation",
+    'test': "Tests",
+    'build': "Build",
+    'ci': "CI",
+    'style': "Style",
+    'chore': "Chores",
+    'revert': "Reverts",
+    'other': "Other (non-conventional)",
+}
+
+
+class ConventionalCommit:
+    """Commit analysé selon la convention `type(scope)!: description`"""
+
+    def __init__(self, sha: str, type: str, scope: Optional[str], description: str, breaking: bool):
+        self.sha = sha
+        self.type = type
+        self.scope = scope
+        self.description = description
+        self.breaking = breaking
+
+    @property
+    def bump(self) -> str:
+        if self.breaking:
+            return 'major'
+        return 'minor' if self.type == 'feat' else 'patch'
+
+
+def parse_commit(sha: str, message: str) -> Optional[ConventionalCommit]:
+    """
+    Analyse un message de commit complet (sujet + corps)
+
+    Args:
+        sha: Hash du commit
+        message: Message complet du commit
+
+    Returns:
+        ConventionalCommit ou None si le sujet ne respecte pas la convention
+    """
+    subject, _, body = message.strip().partition('\n')
+    match = _SUBJECT.match(subject.strip())
+    if not match or match.group('type').lower() not in CONVENTIONAL_TYPES:
+        return None
+    breaking = bool(match.group('breaking')) or bool(_BREAKING_TRAILER.search(body))
+    return ConventionalCommit(sha, match.group('type').lower(), match.group('scope'),
+                              match.group('description').strip(), breaking)
+
+
+def bump_version(latest_tag: str, bump: str) -> str:
+    """
+    Applique un incrément semver au dernier tag
+
+    Args:
+        latest_tag: Dernier tag (ex: v1.4.2, v0.0.0 si aucun)
+        bump: 'major', 'minor' ou 'patch'
+
+    Returns:
+        str: La nouvelle version préfixée par "v"
+    """
+    match = _VERSION.match(latest_tag.strip())
+    major, minor, patch = (int(part) for part in match.groups()) if match else (0, 0, 0)
+    if bump == 'major':
+        return f"v{major + 1}.0.0"
+    if bump == 'minor':
+        return f"v{major}.{minor + 1}.0"
+    return f"v{major}.{minor}.{patch + 1}"
+
+
+class VersionPlan:
+    """Résultat de l'analyse locale des commits à releaser"""
+
+    def __init__(self, latest_tag: str, commits: List[ConventionalCommit], unconventional: List[Tuple[str, str]]):
+        self.latest_tag = latest_tag
+        self.commits = commits
+        self.unconventional = unconventional
+
+    @property
+    def is_conventional(self) -> bool:
+        """Vrai si tous les commits suivent la convention (le calcul local fait foi)"""
+        return bool(self.commits) and not self.unconventional
+
+    @property
+    def bump(self) -> Optional[str]:
+        if not self.commits:
+            return None
+        return max((commit.bump for commit in self.commits), key=BUMP_ORDER.index)
+
+    @property
+    def version(self) -> Optional[str]:
+        return bump_version(self.latest_tag, self.bump) if self.bump else None
+
+
+def is_ignored_subject(subject: str) -> bool:
+    """Indique si un commit est technique (merge, release) et n'entre pas dans le calcul"""
+    return bool(_IGNORED_SUBJECT.match(subject))
+
+
+def plan_next_version(latest_tag: str, base: str, head: str = "HEAD") -> VersionPlan:
+    """
+    Calcule localement la prochaine version à partir des commits base..head
+
+    Args:
+        latest_tag: Dernier tag de version
+        base: Ref de référence (ex: main, origin/main)
+        head: Ref à releaser (par défaut: HEAD)
+
+    Returns:
+        VersionPlan: Commits conventionnels, commits non conformes et version calculée
+    """
+    commits, unconventional = [], []
+    for record in walk_commits(base, head, with_files=False):
+        if is_ignored_subject(record.subject):
+            continue
+        commit = parse_commit(record.sha, record.message)
+        if commit:
+            commits.append(commit)
+        else:
+            unconventional.append((record.sha, record.subject))
+    return VersionPlan(latest_tag, commits, unconventional)
+
+
+class CommitDigest:
+    """Résumé borné d'une plage de commits, groupé par type conventionnel"""
+
+    def __init__(self, samples_per_group: int = DEFAULT_SAMPLES_PER_GROUP):
+        """
+        Args:
+            samples_per_group: Nombre maximum de sujets conservés par groupe
+        """
+        self.samples_per_group = samples_per_group
+        self.total = 0
+        self.counts: Counter = Counter()
+        self.samples: Dict[str, List[str]] = {}
+        self.authors: Counter = Counter()
+        self.directories: Counter = Counter()
+        self.references: Counter = Counter()
+
+    def add(self, commit: CommitRecord) -> None:
+        """Ajoute un commit au digest"""
+        if is_ignored_subject(commit.subject):
+            return
+        self.total += 1
+        self.authors[commit.author] += 1
+
+        parsed = parse_commit(commit.sha, commit.message)
+        if parsed is None:
+            group, sample = 'other', commit.subject
+        else:
+            group = 'breaking' if parsed.breaking else parsed.type
+            scope = f"({parsed.scope}) " if parsed.scope else ""
+            sample = f"{scope}{parsed.description}"
+        self.counts[group] += 1
+        samples = self.samples.setdefault(group, [])
+        if len(samples) < self.samples_per_group:
+            samples.append(sample)
+
+        for path in commit.files:
+            self.directories[path.split('/', 1)[0] + '/' if '/' in path else os.path.basename(path)] += 1
+        for key in ('Closes', 'Fixes', 'Refs'):
+            for value in commit.trailers.get(key, []):
+                self.references[value] += 1
+
+    def lines(self) -> List[str]:
+        """Lignes du digest, destinées à la section commits du prompt de release"""
+        lines = [f"{self.total} commits, {len(self.authors)} author(s)"]
+        for group, label in GROUP_LABELS.items():
+            count = self.counts.get(group)
+            if not count:
+                continue
+            samples = self.samples.get(group, [])
+            more = f" (+{count - len(samples)} more)" if count > len(samples) else ""
+            lines.append(f"{label} ({count}): {'; '.join(samples)}{more}")
+        if self.directories:
+            top = ', '.join(f"{path} ({count})" for path, count in self.directories.most_common(8))
+            lines.append(f"Most touched areas: {top}")
+        if self.references:
+            references = [reference for reference, _ in self.references.most_common(MAX_REFERENCES)]
+            more = f" (+{len(self.references) - len(references)} more)" if len(self.references) > len(references) else ""
+            lines.append(f"Referenced issues: {', '.join(references)}{more}")
+        return lines
+
+
+def build_commit_digest(base: str, head: str = "HEAD",
+                        samples_per_group: int = DEFAULT_SAMPLES_PER_GROUP) -> CommitDigest:
+    """
+    Construit le digest de toute la plage base..head en un seul parcours
+
+    Args:
+        base: Ref de référence (ex: origin/main)
+        head: Ref parcourue (par défaut: HEAD)
+        samples_per_group: Nombre maximum de sujets conservés par groupe
+
+    Returns:
+        CommitDigest: Le digest de la plage
+    """
+    digest = CommitDigest(samples_per_group)
+    for commit in walk_commits(base, head):
+        digest.add(commit)
+    return digest
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Coordinateur de fetch pour éviter les `git fetch` redondants pendant une exécution
+"""
+
+import os
+import subprocess
+import time
+from typing import List, Optional, Set
+
+from .debug_logger import debug_command
+from .command_runner import run_command
+from .ref_index import get_ref_index
+
+
+# Fenêtre de fraîcheur par défaut (secondes) basée sur le mtime de FETCH_HEAD
+DEFAULT_FRESHNESS = 15.0
+
+
+class FetchCoordinator:
+    """Mémorise ce qui a déjà été fetché et regroupe les refspecs en un seul fetch"""
+
+    def __init__(self, remote: str = "origin", freshness: Optional[float] = None):
+        """
+        Args:
+            remote: Le remote à fetcher (par défaut: origin)
+            freshness: Fenêtre de fraîcheur en secondes (défaut: GITAUTOFLOW_FETCH_FRESHNESS ou 15s)
+        """
+        if freshness is None:
+            try:
+                freshness = float(os.getenv('GITAUTOFLOW_FETCH_FRESHNESS', DEFAULT_FRESHNESS))
+            except ValueError:
+                freshness = DEFAULT_FRESHNESS
+
+        self.remote = remote
+        self.freshness = freshness
+        self._fetched_branches: Set[str] = set()
+        self._tags_fetched = False
+        self._pending_branches: list = []
+        self._pending_tags = False
+        self._fetch_head_path: Optional[str] = None
+
+    def request(self, *branches: str, tags: bool = False) -> None:
+        """
+        Ajoute des branches (et éventuellement les tags) au prochain fetch groupé
+
+        Args:
+            branches: Noms des branches distantes à fetcher
+            tags: True pour inclure --tags
+        """
+        for branch in branches:
+            if branch not in self._fetched_branches and branch not in self._pending_branches:
+                self._pending_branches.append(branch)
+        if tags and not self._tags_fetched:
+            self._pending_tags = True
+
+    def flush(self, check: bool = True, force: bool = False) -> bool:
+        """
+        Exécute un unique `git fetch` pour tout ce qui est en attente
+
+        Args:
+            check: Lève CalledProcessError si le fetch échoue
+            force: Fetch même si FETCH_HEAD est récent
+
+        Returns:
+            bool: True si tout ce qui était demandé est à jour
+        """
+        branches = list(self._pending_branches)
+        tags = self._pending_tags
+        self._pending_branches = []
+        self._pending_tags = False
+
+        if not branches and not tags:
+            return True
+
+        if not force and self._is_fresh_from_fetch_head(branches, tags):
+            debug_command(['git', 'fetch', self.remote, *branches], "fetch ignoré (FETCH_HEAD récent)")
+            self._mark_fetched(branches, tags)
+            return True
+
+        cmd = ['git', 'fetch', self.remote]
+        if tags:
+            cmd.append('--tags')
+        cmd.extend(branches)
+        result = run_command(cmd, description="fetch groupé", capture_output=True, text=True)
+        if result.returncode != 0:
+            if check:
+                raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
+            return False
+
+        self._mark_fetched(branches, tags)
+        return True
+
+    def fetch(self, *branches: str, tags: bool = False, check: bool = True, preflight: bool = False,
+              force: bool = False) -> bool:
+        """
+        Fetch les branches demandées si ce n'est pas déjà fait pendant cette exécution
+
+        Args:
+            branches: Noms des branches distantes à fetcher
+            tags: True pour inclure --tags
+            check: Lève CalledProcessError si le fetch échoue
+            preflight: Compare d'abord les SHA distants (ls-remote) et ne fetch
+                       que les branches qui ont bougé
+            force: Ignore ce qui a déjà été fetché et la fraîcheur de FETCH_HEAD
+                   (ex: le remote vient de bouger après un merge côté GitHub)
+
+        Returns:
+            bool: True si tout ce qui était demandé est à jour
+        """
+        if force:
+            self._fetched_branches.difference_update(branches)
+            if tags:
+                self._tags_fetched = False
+        self.request(*branches, tags=tags)
+
+        pending = self._pending_branches
+        if preflight and pending and not self._pending_tags \
+                and (force or not self._is_fresh_from_fetch_head(pending, False)):
+            unchanged = self.unchanged_branches(pending)
+            if unchanged:
+                debug_command(['git', 'fetch', self.remote, *unchanged], "fetch ignoré (remote inchangé)")
+                self._mark_fetched(unchanged, False)
+                self._pending_branches = [branch for branch in pending if branch not in unchanged]
+
+        return self.flush(check=check, force=force)
+
+    def unchanged_branches(self, branches: List[str]) -> List[str]:
+        """
+        Preflight léger: compare les SHA annoncés par le remote (git ls-remote)
+        avec les refs locales origin/<branche>, sans télécharger d'objets
+
+        Args:
+            branches: Noms des branches à vérifier
+
+        Returns:
+            list: Les branches dont origin/<branche> est déjà à jour
+        """
+        ls_remote_cmd = ['git', 'ls-remote', self.remote, *[f'refs/heads/{branch}' for branch in branches]]
+        remote_result = run_command(ls_remote_cmd, description="preflight ls-remote", capture_output=True, text=True)
+        if remote_result.returncode != 0:
+            # Remote injoignable: on laisse le fetch normal signaler l'erreur
+            return []
+
+        remote_shas = {}
+        for line in remote_result.stdout.splitlines():
+            parts = line.split('\t')
+            if len(parts) == 2:
+                remote_shas[parts[1][len('refs/heads/'):]] = parts[0]
+
+        # SHA locaux des refs origin/<branche> lus dans l'index des refs
+        ref_index = get_ref_index()
+        if ref_index.remote != self.remote:
+            return []
+
+        return [branch for branch in branches
+                if branch in remote_shas and remote_shas[branch] == ref_index.branch_sha(branch, remote=True)]
+
+    def is_fetched(self, branch: str) -> bool:
+        """Indique si la branche a déjà été fetchée pendant cette exécution"""
+        return branch in self._fetched_branches
+
+    def invalidate(self) -> None:
+        """Oublie tout ce qui a été fetché (ex: après un push)"""
+        self._fetched_branches.clear()
+        self._tags_fetched = False
+
+    def _mark_fetched(self, branches: list, tags: bool) -> None:
+        # Les refs de suivi ont pu bouger: l'index sera rechargé au prochain accès
+        get_ref_index().invalidate()
+        self._fetched_branches.update(branches)
+        if tags:
+            self._tags_fetched = True
+
+    def _get_fetch_head_path(self) -> Optional[str]:
+        """Retourne le chemin absolu de FETCH_HEAD (mis en cache)"""
+        if self._fetch_head_path is None:
+            result = run_command(['git', 'rev-parse', '--git-path', 'FETCH_HEAD'],
+                                 capture_output=True, text=True)
+            if result.returncode != 0:
+                return None
+            self._fetch_head_path = os.path.abspath(result.stdout.strip())
+        return self._fetch_head_path
+
+    def _is_fresh_from_fetch_head(self, branches: list, tags: bool) -> bool:
+        """
+        Vérifie si un fetch récent (mtime de FETCH_HEAD dans la fenêtre de fraîcheur)
+        couvre déjà les branches et tags demandés
+        """
+        if self.freshness <= 0:
+            return False
+
+        path = self._get_fetch_head_path()
+        if not path:
+            return False
+
+        try:
+            if time.time() - os.stat(path).st_mtime > self.freshness:
+                return False
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                content = f.read()
+        except OSError:
+            return False
+
+        fetched_branches = set()
+        has_tags = False
+        for line in content.splitlines():
+            # Format: <sha>\t[not-for-merge]\tbranch 'develop' of <url>
+            parts = line.split('\t')
+            if len(parts) < 3:
+                continue
+            description = parts[2]
+            if description.startswith("branch '"):
+                fetched_branches.add(description[len("branch '"):].split("'", 1)[0])
+            elif description.startswith("tag '"):
+                has_tags = True
+
+        if tags and not has_tags:
+            return False
+        return all(branch in fetched_branches for branch in branches)
+
+
+# Instance globale partagée pour l'exécution courante
+_fetch_coordinator: Optional[FetchCoordinator] = None
+
+
+def get_fetch_coordinator() -> FetchCoordinator:
+    """Récupère ou crée le coordinateur de fetch global"""
+    global _fetch_coordinator
+
+    if _fetch_coordinator is None:
+        _fetch_coordinator = FetchCoordinator()
+
+    return _fetch_coordinator
@@ -3,19 +3,14 @@
 Utilitaires Git réutilisables pour l'automation
 """
 
+import re
 import subprocess
 import sys
-from typing import Tuple
+from typing import List, Optional, Tuple
 
-# Import du système de debug centralisé
-try:
-    from .debug_logger import debug_command, get_debug_logger
-except ImportError:
-    # Fallback si debug_logger n'est pas disponible
-    def debug_command(cmd, description=""):
-        pass
-    def get_debug_logger():
-        return None
+from .fetch_coordinator import get_fetch_coordinator
+from .command_runner import run_command
+from .ref_index import get_ref_index
 
 
 class GitUtils:
@@ -31,9 +26,7 @@ class GitUtils:
         """
         try:
             cmd = ['git', 'diff', '--cached']
-            debug_command(cmd, "get staged diff")
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            result = run_command(cmd, description="get staged diff", capture_output=True, text=True, check=True)
             return result.stdout
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Erreur lors de la récupération du diff stagé: {e}")
@@ -48,49 +41,45 @@ class GitUtils:
         """
         try:
             cmd = ['git', 'diff', '--cached', '--name-only']
-            debug_command(cmd, "get staged files")
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            result = run_command(cmd, description="get staged files", capture_output=True, text=True, check=True)
             return result.stdout
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Erreur lors de la récupération des fichiers stagés: {e}")
     
     @staticmethod
-    def get_branch_diff(base_branch: str = "develop") -> str:
+    def get_branch_diff(base_branch: str = "develop", head: str = "HEAD") -> str:
         """
         Récupère le git diff de la branche courante vs base_branch
         
         Args:
             base_branch: La branche de référence (par défaut: develop)
+            head: La ref comparée (par défaut: HEAD, ex: origin/develop sans checkout)
             
         Returns:
-            str: Le contenu du git diff base_branch...HEAD
+            str: Le contenu du git diff base_branch...head
         """
         try:
-            cmd = ['git', 'diff', f'{base_branch}...HEAD']
-            debug_command(cmd, f"get branch diff vs {base_branch}")
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            cmd = ['git', 'diff', f'{base_branch}...{head}']
+            result = run_command(cmd, description=f"get branch diff vs {base_branch}", capture_output=True, text=True, check=True)
             return result.stdout
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Erreur lors de la récupération du diff de branche: {e}")
     
     @staticmethod
-    def get_branch_files(base_branch: str = "develop") -> list:
+    def get_branch_files(base_branch: str = "develop", head: str = "HEAD") -> list:
         """
         Récupère la liste des fichiers modifiés dans la branche courante vs base_branch
         
         Args:
             base_branch: La branche de référence (par défaut: develop)
+            head: La ref comparée (par défaut: HEAD)
             
         Returns:
             list: Liste des noms de fichiers modifiés
         """
         try:
-            cmd = ['git', 'diff', '--name-only', f'{base_branch}...HEAD']
-            debug_command(cmd, f"get branch files vs {base_branch}")
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            cmd = ['git', 'diff', '--name-only', f'{base_branch}...{head}']
+            result = run_command(cmd, description=f"get branch files vs {base_branch}", capture_output=True, text=True, check=True)
             # Retourner une liste de fichiers, pas une string
             files = result.stdout.strip().split('\n') if result.stdout.strip() else []
             return [file for file in files if file.strip()]
@@ -107,28 +96,27 @@ class GitUtils:
         """
         try:
             cmd = ['git', 'branch', '--show-current']
-            debug_command(cmd, "get current branch")
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            result = run_command(cmd, description="get current branch", capture_output=True, text=True, check=True)
             return result.stdout.strip()
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Erreur lors de la récupération de la branche courante: {e}")
     
     @staticmethod
-    def get_commit_messages(base_branch: str = "develop", limit: int = 10) -> list:
+    def get_commit_messages(base_branch: str = "develop", limit: int = 10, head: str = "HEAD") -> list:
         """
         Récupère les messages de commit de la branche courante vs base_branch
         
         Args:
             base_branch: La branche de référence (par défaut: develop)
             limit: Nombre maximum de commits à récupérer
+            head: La ref comparée (par défaut: HEAD)
             
         Returns:
             list: Liste des messages de commit
         """
         try:
-            result = subprocess.run(
-                ['git', 'log', '--oneline', f'-{limit}', f'{base_branch}..HEAD'],
+            result = run_command(
+                ['git', 'log', '--oneline', f'-{limit}', f'{base_branch}..{head}'],
                 capture_output=True,
                 text=True,
                 check=True
@@ -148,7 +136,7 @@ class GitUtils:
             bool: True s'il y a des changements stagés
         """
         try:
-            result = subprocess.run(
+            result = run_command(
                 ['git', 'diff', '--cached', '--name-only'],
                 capture_output=True,
                 text=True,
@@ -159,19 +147,20 @@ class GitUtils:
             return False
     
     @staticmethod
-    def has_branch_changes(base_branch: str = "develop") -> bool:
+    def has_branch_changes(base_branch: str = "develop", head: str = "HEAD") -> bool:
         """
         Vérifie s'il y a des changements dans la branche courante vs base_branch
         
         Args:
             base_branch: La branche de référence (par défaut: develop)
+            head: La ref comparée (par défaut: HEAD)
             
         Returns:
             bool: True s'il y a des changements dans la branche
         """
         try:
-            result = subprocess.run(
-                ['git', 'diff', '--name-only', f'{base_branch}...HEAD'],
+            result = run_command(
+                ['git', 'diff', '--name-only', f'{base_branch}...{head}'],
                 capture_output=True,
                 text=True,
                 check=True
@@ -189,39 +178,80 @@ class GitUtils:
             bool: True si on est dans un repo Git
         """
         try:
-            subprocess.run(['git', 'status'], capture_output=True, check=True)
+            run_command(['git', 'status'], capture_output=True, check=True)
             return True
         except subprocess.CalledProcessError:
             return False
     
     @staticmethod
-    def rebase_on_target(target_branch: str = "develop") -> bool:
+    def rebase_on_target(target_branch: str = "develop", autostash: bool = False) -> bool:
         """
         Effectue un rebase sur la branche cible
         
         Args:
             target_branch: La branche sur laquelle rebaser (par défaut: develop)
+            autostash: Met de côté les changements non commités pendant le rebase (--autostash)
             
         Returns:
             bool: True si le rebase s'est bien passé
         """
         try:
-            # Fetch les derniers changements
-            subprocess.run(['git', 'fetch', 'origin', target_branch], 
-                         capture_output=True, check=True)
+            # Fetch les derniers changements (ignoré si déjà fait pendant cette exécution)
+            get_fetch_coordinator().fetch(target_branch)
             
             # Effectue le rebase
-            subprocess.run(['git', 'rebase', f'origin/{target_branch}'], 
-                         capture_output=True, check=True)
-            return True
-        except subprocess.CalledProcessError as e:
-            # En cas de conflit, on arrête le rebase
+            cmd = ['git', 'rebase', f'origin/{target_branch}']
+            if autostash:
+                cmd.insert(2, '--autostash')
+            result = run_command(cmd, capture_output=True, text=True, check=True)
+        except subprocess.CalledProcessError:
+            # En cas de conflit, on arrête le rebase (--abort restaure aussi l'autostash)
             try:
-                subprocess.run(['git', 'rebase', '--abort'], 
-                             capture_output=True, check=False)
+                run_command(['git', 'rebase', '--abort'], 
+                          capture_output=True, check=False)
             except:
                 pass
             raise RuntimeError(f"Conflit lors du rebase sur {target_branch}. Résolvez manuellement avec 'git rebase origin/{target_branch}'")
+
+        get_ref_index().invalidate()
+        if autostash and 'autostash resulted in conflicts' in (result.stdout + result.stderr):
+            raise RuntimeError("Rebase effectué mais vos changements non commités entrent en conflit: "
+                               "ils ont été conservés dans le stash ('git stash pop' pour les résoudre)")
+        return True
+    
+    @staticmethod
+    def predict_rebase_conflicts(target_branch: str = "develop") -> Optional[List[str]]:
+        """
+        Estime les conflits avec origin/<target_branch> sans toucher au working tree
+        (git merge-tree --write-tree, git >= 2.38)
+
+        Approximation: c'est un unique merge à 3 points (HEAD contre origin/<target_branch>),
+        pas le rejeu commit par commit d'un rebase. Faux positifs possibles (conflit
+        résolu par un commit ultérieur de la branche) comme faux négatifs (commit
+        intermédiaire en conflit puis annulé): le rebase reste protégé par son --abort.
+        
+        Args:
+            target_branch: La branche sur laquelle rebaser
+            
+        Returns:
+            list: Les fichiers probablement en conflit (vide si le merge est propre),
+                  None si la prédiction est impossible (git trop ancien, refs absentes)
+        """
+        cmd = ['git', 'merge-tree', '--write-tree', '--name-only', '--no-messages',
+               f'origin/{target_branch}', 'HEAD']
+        result = run_command(cmd, description=f"preflight conflits avec {target_branch}",
+                             capture_output=True, text=True)
+        if result.returncode == 0:
+            return []
+        if result.returncode != 1:
+            return None
+
+        # Première ligne: OID de l'arbre résultant, puis les fichiers en conflit. Sans OID,
+        # le code 1 vient d'une ref inconnue ("not something we can merge"), pas d'un conflit
+        lines = result.stdout.strip().split('\n')
+        if not re.fullmatch(r'[0-9a-f]{40}|[0-9a-f]{64}', lines[0]):
+            return None
+        return list(dict.fromkeys(line for line in lines[1:] if line))
     
     @staticmethod
     def is_branch_up_to_date(base_branch: str = "develop") -> bool:
@@ -235,16 +265,12 @@ class GitUtils:
             bool: True si la branche est à jour
         """
         try:
-            # Fetch pour avoir les dernières infos
-            fetch_cmd = ['git', 'fetch', 'origin', base_branch]
-            debug_command(fetch_cmd, f"fetch {base_branch} for up-to-date check")
-            subprocess.run(fetch_cmd, capture_output=True, check=True)
+            # Fetch seulement si le remote a bougé (partagé avec rebase_on_target)
+            get_fetch_coordinator().fetch(base_branch, preflight=True)
             
             # Compare les refs
             rev_list_cmd = ['git', 'rev-list', '--count', f'HEAD..origin/{base_branch}']
-            debug_command(rev_list_cmd, f"check if behind {base_branch}")
-            
-            result = subprocess.run(rev_list_cmd, capture_output=True, text=True, check=True)
+            result = run_command(rev_list_cmd, description=f"check if behind {base_branch}", capture_output=True, text=True, check=True)
             
             behind_count = int(result.stdout.strip())
             return behind_count == 0
@@ -265,9 +291,8 @@ class GitUtils:
             
             if force_with_lease:
                 cmd.append('--force-with-lease')
-            
-            debug_command(cmd, f"push current branch ({current_branch})")
-            subprocess.run(cmd, check=True)
+            run_command(cmd, description=f"push current branch ({current_branch})", check=True)
+            get_ref_index().invalidate()
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Erreur lors du push: {e}")
         
@@ -277,7 +302,7 @@ class GitUtils:
     def is_git_repo() -> bool:
         """Vérifie si on est dans un repo Git"""
         try:
-            subprocess.run(['git', 'rev-parse', '--git-dir'], 
+            run_command(['git', 'rev-parse', '--git-dir'], 
                         capture_output=True, check=True)
             return True
         except subprocess.CalledProcessError:
@@ -287,8 +312,8 @@ class GitUtils:
     def has_unstaged_changes() -> bool:
         """Vérifie s'il y a des changements non stagés"""
         try:
-            result = subprocess.run(['git', 'diff', '--quiet'], 
-                                   capture_output=True)
+            result = run_command(['git', 'diff', '--quiet'], 
+                                capture_output=True)
             return result.returncode != 0
         except subprocess.CalledProcessError:
             return False
@@ -303,9 +328,7 @@ class GitUtils:
         """
         try:
             cmd = ['git', 'remote', 'get-url', 'origin']
-            debug_command(cmd, "get remote origin URL")
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            result = run_command(cmd, description="get remote origin URL", capture_output=True, text=True, check=True)
             url = result.stdout.strip()
             
             # Parse SSH URL: git@github.com:owner/repo.git
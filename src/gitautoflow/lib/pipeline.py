@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Exécuteur de pipeline: étapes avec entrées/sorties déclarées, exécutées en parallèle
+dès que leurs dépendances sont satisfaites
+"""
+
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, Iterable, List, Optional
+
+from rich.table import Table
+
+from gitautoflow.utils.logger import buffered_output
+from .tracing import span
+
+
+class Step:
+    """Une étape du pipeline"""
+
+    def __init__(self, name: str, func: Callable[..., Optional[dict]],
+                 inputs: Iterable[str] = (), outputs: Iterable[str] = (), after: Iterable[str] = ()):
+        """
+        Args:
+            name: Nom unique de l'étape
+            func: Fonction appelée avec les entrées en kwargs, retourne un dict des sorties
+            inputs: Noms des valeurs consommées (produites par d'autres étapes ou passées à run())
+            outputs: Noms des valeurs produites
+            after: Étapes qui doivent être terminées avant celle-ci (ordre sans échange de données)
+        """
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.after = tuple(after)
+
+
+class StepTiming:
+    """Mesure d'exécution d'une étape"""
+
+    def __init__(self, name: str, start: float, end: float, thread: str, ok: bool):
+        self.name = name
+        self.start = start
+        self.end = end
+        self.thread = thread
+        self.ok = ok
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class Pipeline:
+    """DAG d'étapes: les étapes indépendantes tournent en parallèle, la première erreur arrête le pipeline"""
+
+    def __init__(self, steps: List[Step], max_workers: int = 4):
+        self.steps = steps
+        self.max_workers = max_workers
+        self.timings: List[StepTiming] = []
+        self._timings_lock = threading.Lock()
+        self._started_at = 0.0
+        self._dependencies = self._resolve_dependencies()
+
+    def _resolve_dependencies(self) -> Dict[str, set]:
+        """Calcule les dépendances de chaque étape à partir des entrées/sorties déclarées"""
+        names = {step.name for step in self.steps}
+        if len(names) != len(self.steps):
+            raise ValueError("Noms d'étapes dupliqués dans le pipeline")
+
+        producers = {}
+        for step in self.steps:
+            for output in step.outputs:
+                if output in producers:
+                    raise ValueError(f"Sortie '{output}' produite par plusieurs étapes")
+                producers[output] = step.name
+
+        dependencies = {}
+        for step in self.steps:
+            deps = set()
+            for name in step.after:
+                if name not in names:
+                    raise ValueError(f"Étape inconnue '{name}' dans after de '{step.name}'")
+                deps.add(name)
+            for value in step.inputs:
+                if value in producers:
+                    deps.add(producers[value])
+            deps.discard(step.name)
+            dependencies[step.name] = deps
+        return dependencies
+
+    def run(self, **initial) -> dict:
+        """
+        Exécute le pipeline
+
+        Args:
+            initial: Valeurs initiales disponibles pour les entrées des étapes
+
+        Returns:
+            dict: Le contexte final (valeurs initiales + sorties de toutes les étapes)
+        """
+        context = dict(initial)
+        done = set()
+        running = {}
+        failure: Optional[BaseException] = None
+        self.timings = []
+        self._started_at = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="step") as executor:
+            while True:
+                # Pas de nouvelle étape après une erreur: on laisse finir celles en cours
+                if failure is None:
+                    for step in self.steps:
+                        if step.name in done or step.name in running:
+                            continue
+                        if not self._dependencies[step.name] <= done:
+                            continue
+                        missing = [value for value in step.inputs if value not in context]
+                        if missing:
+                            raise ValueError(f"Entrées manquantes pour '{step.name}': {', '.join(missing)}")
+                        kwargs = {value: context[value] for value in step.inputs}
+                        # Copie du contexte pour que les spans de l'étape s'imbriquent sous le span courant
+                        context_copy = contextvars.copy_context()
+                        running[step.name] = executor.submit(context_copy.run, self._run_step, step, kwargs)
+
+                if not running:
+                    break
+
+                finished, _ = wait(list(running.values()), return_when=FIRST_COMPLETED)
+                for name, future in list(running.items()):
+                    if future not in finished:
+                        continue
+                    del running[name]
+                    try:
+                        context.update(future.result())
+                        done.add(name)
+                    except BaseException as e:
+                        if failure is None:
+                            failure = e
+
+        if failure is not None:
+            raise failure
+
+        if len(done) != len(self.steps):
+            blocked = [step.name for step in self.steps if step.name not in done]
+            raise ValueError(f"Dépendances circulaires entre les étapes: {', '.join(blocked)}")
+
+        return context
+
+    def _run_step(self, step: Step, kwargs: dict) -> dict:
+        start = time.perf_counter()
+        ok = False
+        try:
+            # Messages de l'étape affichés d'un bloc quand elle se termine
+            with span(step.name, "step"), buffered_output():
+                outputs = step.func(**kwargs) or {}
+            unknown = set(outputs) - set(step.outputs)
+            if unknown:
+                raise ValueError(f"Sorties non déclarées pour '{step.name}': {', '.join(sorted(unknown))}")
+            missing = set(step.outputs) - set(outputs)
+            if missing:
+                raise ValueError(f"Sorties manquantes pour '{step.name}': {', '.join(sorted(missing))}")
+            ok = True
+            return outputs
+        finally:
+            end = time.perf_counter()
+            with self._timings_lock:
+                self.timings.append(StepTiming(step.name, start - self._started_at, end - self._started_at,
+                                               threading.current_thread().name, ok))
+
+    def timings_table(self) -> Table:
+        """Retourne le détail des temps par étape sous forme de tableau Rich"""
+        table = Table(title="⏱️  Temps par étape")
+        table.add_column("Étape")
+        table.add_column("Début", justify="right")
+        table.add_column("Durée", justify="right")
+        table.add_column("Thread")
+        table.add_column("Statut")
+
+        for timing in sorted(self.timings, key=lambda t: t.start):
+            table.add_row(
+                timing.name,
+                f"{timing.start * 1000:.0f} ms",
+                f"{timing.duration * 1000:.0f} ms",
+                timing.thread,
+                "✅" if timing.ok else "❌"
+            )
+
+        if self.timings:
+            total = max(t.end for t in self.timings)
+            table.add_row("[bold]total[/bold]", "", f"[bold]{total * 1000:.0f} ms[/bold]", "", "")
+        return table
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Limitation de débit: quota IA partagé et limites de l'API GitHub
+
+Quota IA (mode fleet): un token bucket est stocké dans un fichier JSON protégé
+par un verrou; tous les processus qui pointent sur le même fichier
+(GITAUTOFLOW_AI_RATE_FILE) se partagent le même débit (GITAUTOFLOW_AI_RATE, en
+requêtes par minute). Sans ces variables, acquire_ai_slot() ne fait rien.
+
+API GitHub: GitHubRateLimiter lit X-RateLimit-Remaining / Retry-After, espace
+les requêtes quand le quota s'épuise, met tous les workers en pause après un
+refus et sérialise les appels dès qu'une limite secondaire (abus) est détectée.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Mapping, Optional
+
+from .cache import locked_file
+from .tracing import span
+
+
+AI_RATE_ENV = 'GITAUTOFLOW_AI_RATE'
+AI_RATE_FILE_ENV = 'GITAUTOFLOW_AI_RATE_FILE'
+
+
+class SharedTokenBucket:
+    """Token bucket persistant dans un fichier, partagé entre processus"""
+
+    def __init__(self, path: str, rate_per_minute: float, burst: Optional[float] = None):
+        """
+        Args:
+            path: Fichier d'état partagé
+            rate_per_minute: Débit moyen autorisé
+            burst: Nombre de requêtes autorisées d'affilée (défaut: 1/6 du débit, au moins 1)
+        """
+        self.path = path
+        self.rate = rate_per_minute / 60.0
+        self.burst = burst if burst is not None else max(1.0, rate_per_minute / 6)
+
+    def _read(self, now: float) -> dict:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'tokens': self.burst, 'updated': now}
+
+    def try_acquire(self) -> float:
+        """
+        Prend un jeton si possible
+
+        Returns:
+            float: 0 si un jeton a été pris, sinon le temps d'attente estimé (secondes)
+        """
+        with locked_file(self.path):
+            now = time.time()
+            state = self._read(now)
+            tokens = min(self.burst, state.get('tokens', self.burst) + (now - state.get('updated', now)) * self.rate)
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / self.rate
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump({'tokens': tokens, 'updated': now}, f)
+            return wait
+
+    def acquire(self) -> None:
+        """Attend qu'un jeton soit disponible puis le prend"""
+        with span("ai.quota", "ai"):
+            while True:
+                wait = self.try_acquire()
+                if wait <= 0:
+                    return
+                time.sleep(wait)
+
+
+def acquire_ai_slot() -> None:
+    """Attend un créneau du quota IA partagé (no-op hors mode fleet)"""
+    path = os.getenv(AI_RATE_FILE_ENV)
+    rate = os.getenv(AI_RATE_ENV)
+    if not path or not rate:
+        return
+    try:
+        rate_per_minute = float(rate)
+    except ValueError:
+        return
+    if rate_per_minute > 0:
+        SharedTokenBucket(path, rate_per_minute).acquire()
+
+
+# Quota primaire restant en dessous duquel les requêtes GitHub sont espacées
+LOW_REMAINING = 50
+
+# Attente initiale après une limite secondaire sans Retry-After (doublée à chaque refus)
+SECONDARY_BACKOFF = 60.0
+
+# Attente maximale acceptée avant d'abandonner une requête limitée
+MAX_RATE_LIMIT_WAIT = 900.0
+
+
+def _parse_float(value: Optional[str]) -> Optional[float]:
+    """Valeur numérique d'un en-tête, None s'il est absent ou mal formé"""
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class GitHubRateLimiter:
+    """État des limites de débit GitHub, partagé par tous les workers d'un client"""
+
+    def __init__(self, low_remaining: int = LOW_REMAINING, backoff: float = SECONDARY_BACKOFF):
+        """
+        Args:
+            low_remaining: Quota restant à partir duquel les requêtes sont espacées
+            backoff: Attente initiale après une limite secondaire sans Retry-After
+        """
+        self.low_remaining = low_remaining
+        self.backoff = backoff
+        self.serialized = False
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+        self._serial = threading.Lock()
+
+    def _pause(self, delay: float) -> None:
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.time() + delay)
+
+    def _wait(self) -> None:
+        while True:
+            with self._lock:
+                delay = self._resume_at - time.time()
+            if delay <= 0:
+                return
+            with span("github.rate_limit", "http", wait=round(delay, 1)):
+                time.sleep(delay)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Attend la fin d'une pause éventuelle; une requête à la fois en mode sérialisé"""
+        self._wait()
+        if not self.serialized:
+            yield
+            return
+        with self._serial:
+            self._wait()
+            yield
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Espace les requêtes suivantes quand le quota primaire devient bas"""
+        remaining, reset = headers.get('X-RateLimit-Remaining'), headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining, reset = int(remaining), float(reset)
+        except ValueError:
+            return
+        if remaining < self.low_remaining:
+            # Répartit les requêtes restantes jusqu'au renouvellement du quota
+            self._pause(max(0.0, reset - time.time()) / max(remaining, 1))
+
+    def on_error(self, status: Optional[int], headers: Optional[Mapping[str, str]], message: str) -> Optional[float]:
+        """
+        Analyse une réponse en erreur
+
+        Args:
+            status: Code HTTP (None si inconnu, ex: erreur gh)
+            headers: En-têtes de la réponse (None si indisponibles)
+            message: Message d'erreur
+
+        Returns:
+            float: Attente avant nouvelle tentative si la requête a été limitée, sinon None
+        """
+        headers = headers or {}
+        lowered = message.lower()
+        secondary = 'secondary rate limit' in lowered or 'abuse' in lowered
+        retry_after = headers.get('Retry-After')
+        exhausted = headers.get('X-RateLimit-Remaining') == '0'
+
+        delay = _parse_float(retry_after) if retry_after else None
+        if delay is None and exhausted:
+            reset = _parse_float(headers.get('X-RateLimit-Reset'))
+            if reset is not None:
+                delay = max(0.0, reset - time.time()) + 1
+        if delay is None:
+            if not (retry_after or exhausted or status == 429 or secondary or 'rate limit' in lowered):
+                return None  # 403 de permission, 404, 422...
+            # Backoff exponentiel partagé par les workers: lu et doublé sous verrou
+            with self._lock:
+                delay = self.backoff
+                self.backoff *= 2
+
+        if delay > MAX_RATE_LIMIT_WAIT:
+            return None
+        if secondary or status == 429:
+            # Détection d'abus: le reste de l'exécution se fait une requête à la fois
+            self.serialized = True
+        self._pause(delay)
+        return delay
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Attente d'un état distant (issue visible, PR mergeable, repo accessible)
+
+Remplace les `time.sleep` fixes: l'état est interrogé avec un backoff
+exponentiel jusqu'à une échéance globale, et l'attente s'arrête dès qu'il est
+prêt. La durée réellement attendue est retournée pour être affichée.
+"""
+
+import os
+import time
+from typing import Any, Callable, Optional
+
+from .debug_logger import debug_command
+from .tracing import span
+
+
+# Échéance globale par défaut (secondes), surchargeable par GITAUTOFLOW_READY_TIMEOUT
+DEFAULT_READY_TIMEOUT = 30.0
+
+# Premier intervalle entre deux vérifications, puis doublé jusqu'à MAX_POLL_INTERVAL
+INITIAL_POLL_INTERVAL = 0.25
+MAX_POLL_INTERVAL = 4.0
+
+
+def _ready_timeout() -> float:
+    try:
+        return float(os.getenv('GITAUTOFLOW_READY_TIMEOUT', DEFAULT_READY_TIMEOUT))
+    except ValueError:
+        return DEFAULT_READY_TIMEOUT
+
+
+class WaitResult:
+    """Résultat d'une attente"""
+
+    def __init__(self, ready: bool, value: Any, waited: float, attempts: int):
+        self.ready = ready
+        self.value = value
+        self.waited = waited
+        self.attempts = attempts
+
+    def __bool__(self) -> bool:
+        return self.ready
+
+
+def wait_until(check: Callable[[], Any], description: str, timeout: Optional[float] = None,
+               initial_interval: float = INITIAL_POLL_INTERVAL,
+               max_interval: float = MAX_POLL_INTERVAL) -> WaitResult:
+    """
+    Interroge check() jusqu'à ce qu'il retourne une valeur vraie ou que l'échéance soit atteinte
+
+    Args:
+        check: Fonction de vérification, retourne une valeur vraie quand l'état est prêt
+        description: Ce qui est attendu (debug et trace)
+        timeout: Échéance globale en secondes (défaut: GITAUTOFLOW_READY_TIMEOUT ou 30s)
+        initial_interval: Premier intervalle entre deux vérifications
+        max_interval: Intervalle maximum entre deux vérifications
+
+    Returns:
+        WaitResult: ready, dernière valeur de check(), durée attendue et nombre de vérifications
+    """
+    timeout = _ready_timeout() if timeout is None else timeout
+    start = time.monotonic()
+    deadline = start + timeout
+    interval = initial_interval
+    attempts = 0
+
+    with span(f"wait {description}", "wait") as wait_span:
+        while True:
+            attempts += 1
+            value = check()
+            now = time.monotonic()
+            if value or now >= deadline:
+                result = WaitResult(bool(value), value, now - start, attempts)
+                wait_span.set(ready=result.ready, attempts=attempts)
+                debug_command([], f"{description}: {'prêt' if result.ready else 'échéance atteinte'} "
+                                  f"après {result.waited:.2f}s ({attempts} vérification(s))")
+                return result
+            time.sleep(min(interval, deadline - now))
+            interval = min(interval * 2, max_interval)
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Index en mémoire des refs (branches, remote-tracking, tags) pour l'exécution courante
+
+Toutes les refs sont chargées avec un seul `git for-each-ref`: existence de
+branche, SHA des branches distantes, état de suivi et dernier tag semver sont
+ensuite résolus sans relancer git. L'index est invalidé quand les refs changent
+(fetch, création de tag ou de branche) et rechargé à la demande.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from .command_runner import run_command
+
+
+_SEMVER_TAG = re.compile(r'^v*(\d+)\.(\d+)\.(\d+)(.*)$')
+
+# Champs lus pour chaque ref: nom, objet, HEAD, upstream, avance/retard. %(*objectname)
+# est volontairement absent: il obligerait git à lire chaque objet tag
+_FORMAT = '%(refname)%00%(objectname)%00%(HEAD)%00%(upstream:short)%00%(upstream:track,nobracket)'
+
+
+def _semver_key(tag: str) -> Optional[Tuple[int, int, int, int, str]]:
+    match = _SEMVER_TAG.match(tag)
+    if not match:
+        return None
+    major, minor, patch, suffix = match.groups()
+    # Une pré-release (v1.2.0-rc1) passe avant la version finale (v1.2.0)
+    return int(major), int(minor), int(patch), 0 if suffix else 1, suffix
+
+
+class RefIndex:
+    """Refs locales, distantes et tags du repository, chargées une seule fois"""
+
+    def __init__(self, remote: str = "origin"):
+        """
+        Args:
+            remote: Le remote dont on indexe les branches de suivi (par défaut: origin)
+        """
+        self.remote = remote
+        self._loaded = False
+        self._branches: Dict[str, str] = {}
+        self._remote_branches: Dict[str, str] = {}
+        self._tags: Dict[str, str] = {}
+        self._tracking: Dict[str, Tuple[str, str]] = {}
+        self._current_branch = ""
+        self._semver_tags: Optional[List[str]] = None
+        self._latest_tags: Dict[Optional[str], Optional[str]] = {}
+
+    def load(self) -> None:
+        """Charge toutes les refs avec un unique `git for-each-ref`"""
+        self._branches.clear()
+        self._remote_branches.clear()
+        self._tags.clear()
+        self._tracking.clear()
+        self._current_branch = ""
+        self._semver_tags = None
+        self._latest_tags.clear()
+        self._loaded = True
+
+        result = run_command(['git', 'for-each-ref', f'--format={_FORMAT}',
+                              'refs/heads', f'refs/remotes/{self.remote}', 'refs/tags'],
+                             description="index des refs", capture_output=True, text=True)
+        if result.returncode != 0:
+            return
+
+        remote_prefix = f'refs/remotes/{self.remote}/'
+        for line in result.stdout.splitlines():
+            fields = line.split('\0')
+            if len(fields) != 5:
+                continue
+            refname, objectname, is_head, upstream, track = fields
+            if refname.startswith('refs/heads/'):
+                branch = refname[len('refs/heads/'):]
+                self._branches[branch] = objectname
+                if is_head == '*':
+                    self._current_branch = branch
+                if upstream:
+                    self._tracking[branch] = (upstream, track)
+            elif refname.startswith(remote_prefix):
+                self._remote_branches[refname[len(remote_prefix):]] = objectname
+            elif refname.startswith('refs/tags/'):
+                self._tags[refname[len('refs/tags/'):]] = objectname
+
+    def invalidate(self) -> None:
+        """Oublie l'index (les refs ont changé), il sera rechargé au prochain accès"""
+        self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+
+    @property
+    def current_branch(self) -> str:
+        """Branche courante ("" en HEAD détaché)"""
+        self._ensure_loaded()
+        return self._current_branch
+
+    def has_branch(self, branch: str) -> bool:
+        """Indique si la branche locale existe"""
+        self._ensure_loaded()
+        return branch in self._branches
+
+    def has_remote_branch(self, branch: str) -> bool:
+        """Indique si la branche de suivi <remote>/<branche> existe"""
+        self._ensure_loaded()
+        return branch in self._remote_branches
+
+    def branch_sha(self, branch: str, remote: bool = False) -> Optional[str]:
+        """SHA de la branche locale (ou de <remote>/<branche> si remote=True)"""
+        self._ensure_loaded()
+        return (self._remote_branches if remote else self._branches).get(branch)
+
+    def tracking(self, branch: str) -> Optional[Tuple[str, str]]:
+        """
+        État de suivi d'une branche locale
+
+        Returns:
+            tuple: (upstream, état) ex: ("origin/feature/x", "ahead 2"), ou None sans upstream
+        """
+        self._ensure_loaded()
+        return self._tracking.get(branch)
+
+    def is_pushed(self, branch: str) -> bool:
+        """
+        Indique si la branche du remote pointe sur le même commit que la branche locale
+
+        La ref de suivi <remote>/<branche> peut être périmée (branche supprimée sur
+        le remote, jamais fetchée): le SHA distant est lu avec `git ls-remote`.
+        """
+        sha = self.branch_sha(branch)
+        if sha is None:
+            return False
+        result = run_command(['git', 'ls-remote', self.remote, f'refs/heads/{branch}'],
+                             description=f"vérification du push de {branch}", capture_output=True, text=True)
+        if result.returncode != 0:
+            return False
+        return result.stdout.split('\t', 1)[0].strip() == sha
+
+    def semver_tags(self) -> List[str]:
+        """Tags de version (vX.Y.Z), du plus récent au plus ancien"""
+        self._ensure_loaded()
+        if self._semver_tags is None:
+            keyed = [(key, tag) for tag, key in ((tag, _semver_key(tag)) for tag in self._tags) if key]
+            self._semver_tags = [tag for _, tag in sorted(keyed, reverse=True)]
+        return self._semver_tags
+
+    def latest_tag(self, reachable_from: Optional[str] = None) -> Optional[str]:
+        """
+        Dernier tag semver, éventuellement limité aux tags atteignables depuis une ref
+
+        Args:
+            reachable_from: Ref depuis laquelle le tag doit être atteignable (ex: origin/main)
+
+        Returns:
+            str: Le tag, ou None si aucun tag de version
+        """
+        tags = self.semver_tags()
+        if reachable_from not in self._latest_tags:
+            self._latest_tags[reachable_from] = self._find_latest_tag(tags, reachable_from)
+        return self._latest_tags[reachable_from]
+
+    def _find_latest_tag(self, tags: List[str], reachable_from: Optional[str]) -> Optional[str]:
+        if not tags or reachable_from is None:
+            return tags[0] if tags else None
+
+        # Cas courant: le tag le plus élevé est atteignable, une seule vérification d'ascendance
+        result = run_command(['git', 'merge-base', '--is-ancestor', f'refs/tags/{tags[0]}', reachable_from],
+                             description=f"tag {tags[0]} atteignable depuis {reachable_from}", capture_output=True)
+        if result.returncode == 0:
+            return tags[0]
+        if result.returncode != 1:
+            return None  # Ref inconnue
+
+        # Sinon (tag posé hors de la branche), une seule liste des tags fusionnés
+        merged = run_command(['git', 'for-each-ref', f'--merged={reachable_from}', '--format=%(refname:short)', 'refs/tags'],
+                             description=f"tags atteignables depuis {reachable_from}", capture_output=True, text=True)
+        if merged.returncode != 0:
+            return None
+        reachable = set(merged.stdout.split())
+        return next((tag for tag in tags if tag in reachable), None)
+
+
+# Instance globale partagée pour l'exécution courante
+_ref_index: Optional[RefIndex] = None
+
+
+def get_ref_index() -> RefIndex:
+    """Récupère ou crée l'index de refs global"""
+    global _ref_index
+
+    if _ref_index is None:
+        _ref_index = RefIndex()
+
+    return _ref_index
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Scanner de secrets intégré (fallback quand gitleaks n'est pas installé)
+
+Les règles sont combinées en expressions régulières compilées (alternance de
+groupes nommés) appliquées uniquement aux lignes ajoutées par le diff du
+working tree et aux fichiers untracked. Les règles des fournisseurs passent
+en premier; la règle générique (clé = valeur), filtrée par entropie pour
+écarter les placeholders, ne s'applique qu'au reste de la ligne.
+"""
+
+import math
+import os
+import re
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from gitautoflow.utils.logger import warning
+from .command_runner import run_command
+from .secret_scan import SecretFinding
+
+
+# (identifiant, description, motif, vérification d'entropie)
+# Le dernier groupe capturant non vide d'un motif est la valeur du secret
+PROVIDER_RULES = [
+    ('aws_access_key', "AWS Access Key", r'\b(?:A3T[A-Z0-9]|AKIA|ASIA|ABIA|ACCA)[A-Z0-9]{16}\b', False),
+    ('aws_secret_access_key', "AWS Secret Access Key",
+     r'(?i:aws[_\-.]?secret(?:[_\-.]?access)?[_\-.]?key)["\']?\s*[:=]\s*["\']?([A-Za-z0-9/+]{40})(?![A-Za-z0-9/+=])',
+     True),
+    ('google_api_key', "Google API Key (GCP / Gemini)", r'\bAIza[0-9A-Za-z_\-]{35}\b', False),
+    ('gcp_service_account', "GCP Service Account", r'"type"\s*:\s*"service_account"', False),
+    ('github_token', "GitHub Token", r'\b(?:gh[pousr]_[A-Za-z0-9]{36,255}|github_pat_[A-Za-z0-9_]{82})\b', False),
+    ('groq_api_key', "Groq API Key", r'\bgsk_[A-Za-z0-9]{52}\b', False),
+    ('private_key', "Private Key",
+     r'-----BEGIN (?:RSA |EC |DSA |OPENSSH |PGP |ENCRYPTED )?PRIVATE KEY(?: BLOCK)?-----', False),
+]
+
+GENERIC_RULES = [
+    ('generic_secret', "Generic Secret",
+     r'(?i:api[_\-]?key|secret|token|passw(?:or)?d)["\']?\s*[:=]\s*["\']?([A-Za-z0-9/+_\-=.]{16,})', True),
+]
+
+# Entropie de Shannon minimale (bits/caractère) pour les règles génériques
+MIN_ENTROPY = 3.5
+
+# Taille maximale lue d'un fichier untracked (au-delà, seul le début est scanné)
+MAX_UNTRACKED_SIZE = 1024 * 1024
+
+BUILTIN_RULES = PROVIDER_RULES + GENERIC_RULES
+
+_RULES_BY_ID = {rule_id: (description, needs_entropy) for rule_id, description, _, needs_entropy in BUILTIN_RULES}
+
+
+def _combine(rules: list) -> re.Pattern:
+    """Une seule expression compilée: le groupe nommé qui matche identifie la règle"""
+    return re.compile('|'.join(f"(?P<{rule_id}>{pattern})" for rule_id, _, pattern, _ in rules))
+
+
+_PROVIDERS = _combine(PROVIDER_RULES)
+_GENERIC = _combine(GENERIC_RULES)
+_COMBINED = _combine(BUILTIN_RULES)
+
+
+def shannon_entropy(value: str) -> float:
+    """Entropie de Shannon d'une chaîne en bits par caractère"""
+    if not value:
+        return 0.0
+    length = len(value)
+    return -sum(count / length * math.log2(count / length) for count in Counter(value).values())
+
+
+def _looks_random(value: str) -> bool:
+    """Écarte les placeholders (votre_cle_api, changeme...): lettres + chiffres et entropie élevée"""
+    has_digit = any(char.isdigit() for char in value)
+    has_alpha = any(char.isalpha() for char in value)
+    return has_digit and has_alpha and shannon_entropy(value) >= MIN_ENTROPY
+
+
+def _redact(secret: str) -> str:
+    return secret[:4] + '*' * max(len(secret) - 4, 0) if len(secret) > 8 else '*' * len(secret)
+
+
+def scan_line(file: str, line_number: int, line: str) -> List[SecretFinding]:
+    """
+    Applique toutes les règles à une ligne en une seule passe
+
+    Args:
+        file: Fichier d'origine
+        line_number: Numéro de ligne dans le fichier
+        line: Contenu de la ligne
+
+    Returns:
+        list: Les secrets trouvés dans la ligne
+    """
+    findings = []
+    claimed: List[Tuple[int, int]] = []
+    for match in _PROVIDERS.finditer(line):
+        claimed.append(match.span())
+        _append_finding(findings, file, line_number, match)
+    for match in _GENERIC.finditer(line):
+        # Valeur déjà attribuée à un fournisseur (token = ghp_..., GROQ_API_KEY=gsk_...)
+        start, end = match.span()
+        if any(start < claimed_end and claimed_start < end for claimed_start, claimed_end in claimed):
+            continue
+        _append_finding(findings, file, line_number, match)
+    return findings
+
+
+def _append_finding(findings: List[SecretFinding], file: str, line_number: int, match: re.Match) -> None:
+    rule_id = match.lastgroup
+    description, needs_entropy = _RULES_BY_ID[rule_id]
+    # La valeur est le dernier groupe capturant non vide (le groupe nommé s'il n'y en a pas)
+    secret = next((group for group in reversed(match.groups()) if group), match.group(rule_id))
+    if needs_entropy and not _looks_random(secret):
+        return
+    findings.append(SecretFinding(file, line_number, rule_id.replace('_', '-'), description, _redact(secret)))
+
+
+# Échappements C des chemins cités par git ("b/caf\303\251.txt")
+_C_ESCAPES = {'a': 7, 'b': 8, 't': 9, 'n': 10, 'v': 11, 'f': 12, 'r': 13, '"': 34, '\\': 92}
+
+
+def _unquote_path(value: str) -> str:
+    """Décode un chemin cité par git (caractères spéciaux, ou non-ASCII avec core.quotePath)"""
+    if len(value) < 2 or not (value.startswith('"') and value.endswith('"')):
+        return value
+    body = value[1:-1]
+    raw = bytearray()
+    index = 0
+    while index < len(body):
+        char = body[index]
+        if char == '\\' and index + 1 < len(body):
+            escaped = body[index + 1]
+            if escaped in '01234567':
+                raw.append(int(body[index + 1:index + 4], 8))
+                index += 4
+                continue
+            raw.append(_C_ESCAPES.get(escaped, ord(escaped)))
+            index += 2
+            continue
+        raw.extend(char.encode('utf-8'))
+        index += 1
+    return raw.decode('utf-8', errors='replace')
+
+
+def iter_added_lines(diff: str) -> Iterator[Tuple[str, int, str]]:
+    """
+    Parcourt les lignes ajoutées d'un diff unifié (-U0)
+
+    Args:
+        diff: Sortie de `git diff -U0`
+
+    Yields:
+        tuple: (fichier, numéro de ligne, contenu)
+    """
+    current_file: Optional[str] = None
+    in_header = False
+    line_number = 0
+    for line in diff.splitlines():
+        if line.startswith('diff --git '):
+            in_header = True
+            current_file = None
+        elif in_header:
+            # En-tête de fichier: seule la ligne "+++ b/<chemin>" nous intéresse
+            if line.startswith('+++ '):
+                target = _unquote_path(line[4:])
+                current_file = target[2:] if target.startswith('b/') else None
+            elif line.startswith('@@'):
+                in_header = False
+        if not in_header and line.startswith('@@'):
+            # @@ -a,b +c,d @@: numérotation des lignes ajoutées à partir de c
+            match = re.match(r'@@ -\S+ \+(\d+)', line)
+            line_number = int(match.group(1)) if match else 0
+        elif not in_header and line.startswith('+') and current_file is not None:
+            yield current_file, line_number, line[1:]
+            line_number += 1
+
+
+def _iter_untracked_lines(root: str) -> Iterator[Tuple[str, int, str]]:
+    result = run_command(['git', 'ls-files', '--others', '--exclude-standard', '-z'],
+                         description="fichiers untracked", capture_output=True, text=True, cwd=root)
+    if result.returncode != 0:
+        return
+
+    for path in filter(None, result.stdout.split('\0')):
+        full_path = os.path.join(root, path)
+        try:
+            truncated = os.path.getsize(full_path) > MAX_UNTRACKED_SIZE
+            with open(full_path, 'rb') as f:
+                content = f.read(MAX_UNTRACKED_SIZE)
+        except OSError:
+            continue
+        if b'\0' in content:
+            continue  # Fichier binaire
+        if truncated:
+            warning(f"{path}: fichier untracked de plus de {MAX_UNTRACKED_SIZE // (1024 * 1024)} Mo, "
+                    f"seul le début est scanné")
+        for line_number, line in enumerate(content.decode('utf-8', errors='replace').splitlines(), 1):
+            yield path, line_number, line
+
+
+def scan_working_tree_changes(root: str = '.') -> List[SecretFinding]:
+    """
+    Scanne les lignes ajoutées (stagées et non-stagées) et les fichiers untracked
+
+    Args:
+        root: Racine du repository
+
+    Returns:
+        list: Les secrets détectés
+    """
+    # Diff contre HEAD, ou contre l'arbre vide si le repository n'a pas encore de commit
+    base = 'HEAD'
+    if run_command(['git', 'rev-parse', '--verify', '--quiet', 'HEAD'], capture_output=True, cwd=root).returncode != 0:
+        base = run_command(['git', 'hash-object', '-t', 'tree', '/dev/null'],
+                           capture_output=True, text=True, cwd=root).stdout.strip()
+
+    diff = run_command(['git', '-c', 'core.quotePath=false', 'diff', base, '-U0', '--no-color', '--no-ext-diff', '--no-renames'],
+                       description="lignes ajoutées", capture_output=True, text=True, errors='replace', cwd=root)
+
+    lines_by_file: Dict[str, List[Tuple[int, str]]] = {}
+    for file, line_number, line in iter_added_lines(diff.stdout if diff.returncode == 0 else ''):
+        lines_by_file.setdefault(file, []).append((line_number, line))
+    for file, line_number, line in _iter_untracked_lines(root):
+        lines_by_file.setdefault(file, []).append((line_number, line))
+
+    findings = []
+    for file, lines in lines_by_file.items():
+        # Pré-filtre sur le bloc entier (une seule recherche en C), détail ligne à ligne si besoin
+        if not _COMBINED.search('\n'.join(line for _, line in lines)):
+            continue
+        for line_number, line in lines:
+            findings.extend(scan_line(file, line_number, line))
+    return findings
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Scan de secrets des fichiers modifiés avec gitleaks
+
+Au lieu de lancer un processus gitleaks par fichier, les candidats sont
+regroupés par lots dans un répertoire temporaire (hardlinks, copie en
+fallback) et chaque lot est scanné par un unique `gitleaks detect`. Le rapport
+JSON permet d'attribuer chaque finding à son fichier d'origine.
+
+Les fichiers déjà vérifiés sont mémorisés par SHA de blob git dans un cache
+persistant partagé entre projets; chaque entrée est préfixée par l'empreinte
+des règles (version de gitleaks, configuration et .gitleaksignore du projet).
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional
+
+from .cache import JsonCache
+from .command_runner import run_command
+
+
+# Nombre de fichiers par processus gitleaks: assez grand pour amortir le
+# démarrage, assez petit pour s'arrêter tôt au premier secret
+DEFAULT_BATCH_SIZE = 500
+
+# Règle ou allowlist portant sur le chemin dans une configuration gitleaks
+_PATH_RULE = re.compile(r'^\s*paths?\s*=', re.MULTILINE)
+
+
+class SecretFinding:
+    """Un secret détecté, rattaché au fichier du working tree"""
+
+    def __init__(self, file: str, line: int, rule: str, description: str = "", secret: str = ""):
+        self.file = file
+        self.line = line
+        self.rule = rule
+        self.description = description
+        self.secret = secret
+
+    def __str__(self) -> str:
+        label = self.description or self.rule
+        return f"{self.file}:{self.line} [{self.rule}] {label}"
+
+
+def find_gitleaks() -> Optional[str]:
+    """
+    Trouve l'exécutable gitleaks (bin/ du projet parent, puis PATH)
+
+    Returns:
+        str: Chemin ou nom de la commande gitleaks, None si introuvable
+    """
+    parent_project = Path(__file__).parent.parent.parent.parent.parent
+    local_gitleaks = parent_project / 'bin' / 'gitleaks'
+    if local_gitleaks.exists():
+        return str(local_gitleaks)
+
+    result = run_command(['which', 'gitleaks'], capture_output=True)
+    if result.returncode != 0:
+        return None
+    return 'gitleaks'
+
+
+def find_gitleaks_config(root: str = '.') -> Optional[str]:
+    """Retourne la configuration gitleaks du projet (GITLEAKS_CONFIG ou .gitleaks.toml à la racine)"""
+    explicit = os.getenv('GITLEAKS_CONFIG')
+    if explicit and os.path.isfile(explicit):
+        return explicit
+    local_config = os.path.join(root, '.gitleaks.toml')
+    return local_config if os.path.isfile(local_config) else None
+
+
+def blob_sha(path: str) -> str:
+    """
+    Calcule le SHA du blob git d'un fichier sans lancer git (sha1 de "blob <taille>\\0<contenu>")
+
+    Args:
+        path: Chemin du fichier
+
+    Returns:
+        str: SHA-1 hexadécimal identique à `git hash-object --no-filters`
+    """
+    digest = hashlib.sha1(f"blob {os.path.getsize(path)}\0".encode())
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ScanCache:
+    """Fichiers déjà scannés sans secret, indexés par empreinte des règles et SHA de blob"""
+
+    def __init__(self, gitleaks_cmd: str, config: Optional[str] = None, root: str = '.'):
+        """
+        Args:
+            gitleaks_cmd: Commande gitleaks (sa version fait partie de l'empreinte)
+            config: Fichier de configuration gitleaks (son contenu fait partie de l'empreinte)
+            root: Racine du repository (son .gitleaksignore fait partie de l'empreinte)
+        """
+        self._store = JsonCache('secret-scan', namespace="v2", shared=True)
+        self._shas = {}
+        config_content = b''
+        if config:
+            with open(config, 'rb') as f:
+                config_content = f.read()
+        ignore_path = os.path.join(root, '.gitleaksignore')
+        ignore_content = b''
+        if os.path.isfile(ignore_path):
+            with open(ignore_path, 'rb') as f:
+                ignore_content = f.read()
+        self._fingerprint = self._ruleset_fingerprint(gitleaks_cmd, config_content, ignore_content)
+        # Allowlists par chemin (config par défaut de gitleaks, `path`/`paths` dans la
+        # config, fingerprints du .gitleaksignore): le verdict dépend aussi du chemin
+        self._path_sensitive = (not config or bool(_PATH_RULE.search(config_content.decode('utf-8', 'replace')))
+                                or bool(ignore_content.strip()))
+
+    @staticmethod
+    def _ruleset_fingerprint(gitleaks_cmd: str, config_content: bytes, ignore_content: bytes) -> str:
+        version = run_command([gitleaks_cmd, 'version'], description="version gitleaks",
+                              capture_output=True, text=True)
+        digest = hashlib.sha1(version.stdout.strip().encode())
+        digest.update(b'\0config\0' + config_content)
+        digest.update(b'\0gitleaksignore\0' + ignore_content)
+        return digest.hexdigest()
+
+    def _key(self, path: str, sha: str) -> str:
+        if self._path_sensitive:
+            return f"{self._fingerprint}:{sha}:{path}"
+        return f"{self._fingerprint}:{sha}"
+
+    def pending(self, files: List[str], root: str = '.') -> List[str]:
+        """Retourne les fichiers dont le contenu n'a pas encore été vérifié"""
+        result = []
+        for path in files:
+            try:
+                sha = blob_sha(os.path.join(root, path))
+            except OSError:
+                result.append(path)
+                continue
+            self._shas[path] = sha
+            if not self._store.get(self._key(path, sha)):
+                result.append(path)
+        return result
+
+    def mark_clean(self, files: Iterable[str]) -> None:
+        """Mémorise les fichiers scannés sans secret"""
+        for path in files:
+            sha = self._shas.get(path)
+            if sha:
+                self._store.set(self._key(path, sha), True)
+
+    def save(self) -> None:
+        self._store.save()
+
+
+def get_repo_root() -> str:
+    """Retourne la racine du repository courant (répertoire courant en fallback)"""
+    result = run_command(['git', 'rev-parse', '--show-toplevel'], capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 else '.'
+
+
+def list_modified_files(root: str = '.') -> List[str]:
+    """
+    Liste tous les fichiers modifiés (stagés, non-stagés, untracked) en un seul appel git
+
+    Args:
+        root: Racine du repository
+
+    Returns:
+        list: Chemins relatifs à root des fichiers existants
+    """
+    result = run_command(['git', 'status', '--porcelain', '-z', '--untracked-files=all'],
+                         description="liste des fichiers modifiés", capture_output=True, text=True, cwd=root)
+    if result.returncode != 0:
+        return []
+
+    files = []
+    entries = result.stdout.split('\0')
+    index = 0
+    while index < len(entries):
+        entry = entries[index]
+        index += 1
+        if len(entry) < 4:
+            continue
+        status, path = entry[:2], entry[3:]
+        if 'R' in status or 'C' in status:
+            # Renommage/copie: l'entrée suivante est l'ancien chemin
+            index += 1
+        if 'D' in status:
+            continue
+        files.append(path)
+
+    return [path for path in dict.fromkeys(files) if os.path.isfile(os.path.join(root, path))]
+
+
+def _link_or_copy(source: str, destination: str) -> None:
+    """Hardlink si possible (même système de fichiers), sinon copie"""
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+def scan_batch(gitleaks_cmd: str, files: List[str], root: str = '.',
+               config: Optional[str] = None) -> List[SecretFinding]:
+    """
+    Scanne un lot de fichiers avec un seul processus gitleaks
+
+    Args:
+        gitleaks_cmd: Commande gitleaks
+        files: Chemins relatifs à root
+        root: Répertoire racine des chemins
+        config: Configuration gitleaks à utiliser (le répertoire scanné est temporaire)
+
+    gitleaks est lancé depuis le répertoire temporaire avec `--source .`: les
+    chemins et fingerprints rapportés sont relatifs à root, comme avec un scan
+    direct, et les entrées du .gitleaksignore du projet s'appliquent.
+
+    Returns:
+        list: Les secrets détectés, attribués à leur fichier d'origine
+
+    Raises:
+        RuntimeError: Si gitleaks échoue (code retour autre que 0 ou 1)
+    """
+    with tempfile.TemporaryDirectory(prefix='gitautoflow-scan-') as workdir:
+        source_dir = os.path.join(workdir, 'src')
+        report_path = os.path.join(workdir, 'report.json')
+        for path in files:
+            _link_or_copy(os.path.join(root, path), os.path.join(source_dir, path))
+
+        command = [
+            gitleaks_cmd, 'detect',
+            '--no-git',
+            '--source', '.',
+            '--report-format', 'json',
+            '--report-path', report_path,
+            '--redact',
+            '--no-banner',
+            '--exit-code', '1'
+        ]
+        if config:
+            command.extend(['--config', os.path.abspath(config)])
+        ignore_path = os.path.abspath(os.path.join(root, '.gitleaksignore'))
+        if os.path.isfile(ignore_path):
+            command.extend(['--gitleaks-ignore-path', ignore_path])
+
+        result = run_command(command, description=f"scan gitleaks de {len(files)} fichier(s)",
+                             capture_output=True, text=True, cwd=source_dir)
+
+        if result.returncode not in (0, 1):
+            raise RuntimeError(result.stderr.strip() or f"gitleaks a retourné {result.returncode}")
+        if result.returncode == 0:
+            return []
+
+        try:
+            with open(report_path, 'r', encoding='utf-8') as f:
+                report = json.load(f) or []
+        except (OSError, json.JSONDecodeError):
+            # Rapport illisible: on signale le lot entier plutôt que de laisser passer
+            return [SecretFinding(path, 0, 'gitleaks', result.stdout.strip()) for path in files]
+
+    findings = []
+    for item in report:
+        file = item.get('File', '')
+        relative = os.path.relpath(file, source_dir) if os.path.isabs(file) else os.path.normpath(file)
+        findings.append(SecretFinding(
+            relative.replace(os.sep, '/'),
+            item.get('StartLine', 0),
+            item.get('RuleID', ''),
+            item.get('Description', ''),
+            item.get('Secret', '')
+        ))
+    return findings
+
+
+def scan_files(gitleaks_cmd: str, files: List[str], root: str = '.',
+               batch_size: int = DEFAULT_BATCH_SIZE, config: Optional[str] = None,
+               on_clean: Optional[Callable[[List[str]], None]] = None) -> List[SecretFinding]:
+    """
+    Scanne les fichiers par lots et s'arrête au premier lot contenant un secret
+
+    Args:
+        gitleaks_cmd: Commande gitleaks
+        files: Chemins relatifs à root
+        root: Répertoire racine des chemins
+        batch_size: Nombre de fichiers par processus gitleaks
+        config: Configuration gitleaks à utiliser
+        on_clean: Appelée avec les fichiers de chaque lot scannés sans secret
+
+    Returns:
+        list: Les secrets du premier lot fautif (vide si aucun secret)
+    """
+    for start in range(0, len(files), batch_size):
+        batch = files[start:start + batch_size]
+        findings = scan_batch(gitleaks_cmd, batch, root, config)
+        if on_clean:
+            flagged = {finding.file for finding in findings}
+            on_clean([path for path in batch if path not in flagged])
+        if findings:
+            return findings
+    return []
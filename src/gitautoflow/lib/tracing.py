@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Traçage des exécutions (--profile): arbre de spans exporté au format Chrome trace
+(chrome://tracing, Perfetto, speedscope) avec un résumé texte en fin d'exécution
+"""
+
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import typer
+from rich.table import Table
+from rich.tree import Tree
+
+from gitautoflow.utils.logger import console, info, warning
+
+
+# Option --profile commune à toutes les commandes décorées par @profiled
+PROFILE_OPTION = typer.Option(
+    None, "--profile",
+    help="Écrit une trace Chrome (JSON) des étapes, commandes git/gh et appels IA/HTTP dans ce fichier"
+)
+
+
+class Span:
+    """Un intervalle de temps nommé, avec attributs et enfants"""
+
+    def __init__(self, name: str, category: str, parent: Optional['Span'], attrs: dict):
+        self.name = name
+        self.category = category
+        self.parent = parent
+        self.attrs = attrs
+        self.children: List['Span'] = []
+        self.thread = threading.current_thread()
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+
+    @property
+    def duration(self) -> float:
+        end = self.end if self.end is not None else time.perf_counter()
+        return end - self.start
+
+    def set(self, **attrs) -> None:
+        """Ajoute des attributs au span (ex: code retour, statut HTTP)"""
+        self.attrs.update(attrs)
+
+
+class _NullSpan:
+    """Span inactif utilisé quand le traçage est désactivé"""
+
+    def set(self, **attrs) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+# Span courant, propagé aux threads du pipeline via contextvars.copy_context()
+_current_span: contextvars.ContextVar = contextvars.ContextVar('gitautoflow_span', default=None)
+
+
+class Tracer:
+    """Collecte les spans d'une exécution"""
+
+    def __init__(self):
+        self.enabled = False
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    def enable(self) -> None:
+        """Active la collecte (réinitialise les spans existants)"""
+        with self._lock:
+            self.spans = []
+            self._origin = time.perf_counter()
+            self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    @contextmanager
+    def span(self, name: str, category: str = "step", **attrs):
+        """
+        Ouvre un span imbriqué dans le span courant
+
+        Args:
+            name: Nom du span (ex: "git fetch", "gemini.analyze_for_commit")
+            category: Catégorie (command, step, subprocess, ai, http)
+            attrs: Attributs libres exportés dans la trace
+        """
+        if not self.enabled:
+            yield _NULL_SPAN
+            return
+
+        parent = _current_span.get()
+        current = Span(name, category, parent, attrs)
+        with self._lock:
+            self.spans.append(current)
+            if parent is not None:
+                parent.children.append(current)
+
+        token = _current_span.set(current)
+        try:
+            yield current
+        except BaseException as e:
+            current.set(error=type(e).__name__)
+            raise
+        finally:
+            current.end = time.perf_counter()
+            _current_span.reset(token)
+
+    def to_chrome_trace(self) -> dict:
+        """Convertit les spans au format Chrome trace event (événements complets 'X')"""
+        pid = os.getpid()
+        thread_ids: Dict[int, int] = {}
+        events = []
+
+        for span in self.spans:
+            ident = span.thread.ident or 0
+            if ident not in thread_ids:
+                thread_ids[ident] = len(thread_ids) + 1
+                events.append({
+                    'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': thread_ids[ident],
+                    'args': {'name': span.thread.name}
+                })
+            events.append({
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': round((span.start - self._origin) * 1_000_000, 1),
+                'dur': round(span.duration * 1_000_000, 1),
+                'pid': pid,
+                'tid': thread_ids[ident],
+                'args': {key: _json_safe(value) for key, value in span.attrs.items()},
+            })
+
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path: str) -> None:
+        """Écrit la trace dans un fichier JSON"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False)
+
+    def summary_tree(self, max_depth: int = 3) -> Tree:
+        """Arbre texte des spans racines et de leurs enfants"""
+        tree = Tree("🔬 Profil d'exécution")
+        for span in self.spans:
+            if span.parent is None:
+                self._add_to_tree(tree, span, max_depth)
+        return tree
+
+    def _add_to_tree(self, node: Tree, span: Span, depth: int) -> None:
+        label = f"{span.name} [dim]({span.category})[/dim] [bold]{span.duration * 1000:.0f} ms[/bold]"
+        child_node = node.add(label)
+        if depth <= 1:
+            if span.children:
+                child_node.add(f"[dim]… {len(span.children)} span(s)[/dim]")
+            return
+        for child in span.children:
+            self._add_to_tree(child_node, child, depth - 1)
+
+    def summary_table(self, limit: int = 15) -> Table:
+        """Agrégat par (catégorie, nom): nombre d'appels, durée totale et maximale"""
+        totals: Dict[tuple, list] = {}
+        for span in self.spans:
+            key = (span.category, span.name)
+            entry = totals.setdefault(key, [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += span.duration
+            entry[2] = max(entry[2], span.duration)
+
+        table = Table(title="⏱️  Spans les plus coûteux")
+        table.add_column("Catégorie")
+        table.add_column("Span")
+        table.add_column("Appels", justify="right")
+        table.add_column("Total", justify="right")
+        table.add_column("Max", justify="right")
+
+        ranked = sorted(totals.items(), key=lambda item: item[1][1], reverse=True)
+        for (category, name), (count, total, longest) in ranked[:limit]:
+            table.add_row(category, name, str(count), f"{total * 1000:.0f} ms", f"{longest * 1000:.0f} ms")
+        return table
+
+
+def _json_safe(value):
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    return str(value)
+
+
+# Instance globale partagée
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Récupère le tracer global"""
+    return _tracer
+
+
+def span(name: str, category: str = "step", **attrs):
+    """Fonction helper pour ouvrir un span sur le tracer global"""
+    return _tracer.span(name, category, **attrs)
+
+
+@contextmanager
+def profile_session(path: Optional[str], command: str):
+    """
+    Active le traçage pour une commande si --profile est fourni, puis écrit
+    la trace Chrome et affiche le résumé à la fin (même en cas d'erreur)
+
+    Args:
+        path: Fichier de sortie de la trace (None = traçage désactivé)
+        command: Nom de la commande (span racine)
+    """
+    if not path:
+        yield
+        return
+
+    _tracer.enable()
+    try:
+        with _tracer.span(command, "command"):
+            yield
+    finally:
+        _tracer.disable()
+        try:
+            _tracer.write_chrome_trace(path)
+            console.print(_tracer.summary_tree())
+            console.print(_tracer.summary_table())
+            info(f"🔬 Trace écrite dans {path} (chrome://tracing, ui.perfetto.dev ou speedscope)")
+        except OSError as e:
+            warning(f"Impossible d'écrire la trace {path}: {e}")
+
+
+def profiled(command: str):
+    """
+    Décorateur pour les commandes Typer exposant une option `profile`: active le
+    traçage si --profile est fourni et affiche les commandes externes les plus
+    lentes en fin d'exécution (--debug ou --profile)
+
+    Args:
+        command: Nom de la commande utilisé pour le span racine
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Import local: command_runner dépend de ce module
+            from .command_runner import get_command_ledger
+
+            ledger = get_command_ledger()
+            ledger.reset()
+            try:
+                with profile_session(kwargs.get('profile'), command):
+                    return func(*args, **kwargs)
+            finally:
+                if ledger.records and (kwargs.get('debug') is True or kwargs.get('profile')):
+                    console.print(ledger.slowest_table())
+        return wrapper
+    return decorator
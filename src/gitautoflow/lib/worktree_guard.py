@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Garde-fou contre l'explosion du working tree (node_modules, builds, datasets non ignorés)
+
+Un snapshot des fichiers modifiés et untracked est pris une seule fois, en
+lisant `git ls-files --others` au fil de l'eau: dès qu'un budget (nombre de
+fichiers, taille totale, taille par fichier) est dépassé, le listing est
+interrompu et les répertoires responsables sont résumés, avant tout scan ou
+`git add`.
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+from .command_runner import run_command, stream_command
+
+
+# Budgets par défaut, surchargeables par variables d'environnement (0 = illimité)
+DEFAULT_MAX_FILES = 5000
+DEFAULT_MAX_TOTAL_BYTES = 200 * 1024 * 1024
+DEFAULT_MAX_FILE_BYTES = 50 * 1024 * 1024
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def _format_size(size: int) -> str:
+    for unit in ('o', 'Ko', 'Mo'):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} Go"
+
+
+class WorktreeBudget:
+    """Limites au-delà desquelles auto-commit refuse de scanner et stager"""
+
+    def __init__(self, max_files: Optional[int] = None, max_total_bytes: Optional[int] = None,
+                 max_file_bytes: Optional[int] = None):
+        """
+        Args:
+            max_files: Nombre maximum de fichiers modifiés/untracked (GITAUTOFLOW_MAX_FILES)
+            max_total_bytes: Taille totale maximale (GITAUTOFLOW_MAX_TOTAL_BYTES)
+            max_file_bytes: Taille maximale d'un fichier (GITAUTOFLOW_MAX_FILE_BYTES)
+        """
+        self.max_files = max_files if max_files is not None else \
+            _env_int('GITAUTOFLOW_MAX_FILES', DEFAULT_MAX_FILES)
+        self.max_total_bytes = max_total_bytes if max_total_bytes is not None else \
+            _env_int('GITAUTOFLOW_MAX_TOTAL_BYTES', DEFAULT_MAX_TOTAL_BYTES)
+        self.max_file_bytes = max_file_bytes if max_file_bytes is not None else \
+            _env_int('GITAUTOFLOW_MAX_FILE_BYTES', DEFAULT_MAX_FILE_BYTES)
+
+
+class WorktreeSnapshot:
+    """Fichiers modifiés (trackés) et untracked, avec tailles et agrégats par répertoire"""
+
+    def __init__(self, root: str):
+        self.root = root
+        self.files: List[str] = []
+        self.total_bytes = 0
+        self.oversized: List[Tuple[str, int]] = []
+        self.directories: Dict[str, List[int]] = {}
+        self.truncated = False
+        self.violations: List[str] = []
+
+    @property
+    def ok(self) -> bool:
+        return not self.violations
+
+    def add(self, path: str) -> Optional[int]:
+        try:
+            size = os.lstat(os.path.join(self.root, path)).st_size
+        except OSError:
+            return None  # Fichier supprimé entre-temps
+
+        self.files.append(path)
+        self.total_bytes += size
+
+        # Agrégat par répertoire de premier niveau (node_modules/, dist/, data/...)
+        directory = path.split('/', 1)[0] + '/' if '/' in path else './'
+        entry = self.directories.setdefault(directory, [0, 0])
+        entry[0] += 1
+        entry[1] += size
+
+        return size
+
+    def top_directories(self, limit: int = 5) -> List[Tuple[str, int, int]]:
+        """Répertoires qui pèsent le plus (nombre de fichiers, puis taille)"""
+        ranked = sorted(self.directories.items(), key=lambda item: (item[1][0], item[1][1]), reverse=True)
+        return [(directory, count, size) for directory, (count, size) in ranked[:limit]]
+
+    def summary_lines(self) -> List[str]:
+        """Résumé lisible des dépassements et des répertoires responsables"""
+        lines = list(self.violations)
+        for path, size in self.oversized[:5]:
+            lines.append(f"  📄 {path}: {_format_size(size)}")
+        for directory, count, size in self.top_directories():
+            more = "+" if self.truncated else ""
+            lines.append(f"  📁 {directory}: {count}{more} fichier(s), {_format_size(size)}{more}")
+        return lines
+
+
+def take_snapshot(root: str = '.', budget: Optional[WorktreeBudget] = None) -> WorktreeSnapshot:
+    """
+    Liste les fichiers à scanner/stager en vérifiant les budgets au fil de l'eau
+
+    Args:
+        root: Racine du repository
+        budget: Limites à appliquer (défaut: WorktreeBudget())
+
+    Returns:
+        WorktreeSnapshot: Le snapshot (snapshot.ok False si un budget est dépassé)
+    """
+    budget = budget or WorktreeBudget()
+    snapshot = WorktreeSnapshot(root)
+
+    def check(path: str) -> bool:
+        size = snapshot.add(path)
+        if size is None:
+            return True
+        if budget.max_file_bytes and size > budget.max_file_bytes:
+            snapshot.oversized.append((path, size))
+        if budget.max_files and len(snapshot.files) > budget.max_files:
+            snapshot.violations.append(f"Plus de {budget.max_files} fichiers modifiés ou untracked")
+            return False
+        if budget.max_total_bytes and snapshot.total_bytes > budget.max_total_bytes:
+            snapshot.violations.append(f"Plus de {_format_size(budget.max_total_bytes)} de fichiers modifiés ou untracked")
+            return False
+        return True
+
+    # 1. Fichiers trackés modifiés (stagés ou non), sans parcourir les untracked
+    status = run_command(['git', 'status', '--porcelain', '-z', '--untracked-files=no'],
+                         description="snapshot des fichiers modifiés", capture_output=True, text=True, cwd=root)
+    entries = status.stdout.split('\0') if status.returncode == 0 else []
+    index = 0
+    while index < len(entries):
+        entry = entries[index]
+        index += 1
+        if len(entry) < 4:
+            continue
+        state, path = entry[:2], entry[3:]
+        if 'R' in state or 'C' in state:
+            index += 1  # Ancien chemin du renommage
+        if 'D' in state:
+            continue
+        if not check(path):
+            snapshot.truncated = True
+            break
+
+    # 2. Untracked, lus au fil de l'eau: on coupe le listing au premier dépassement
+    if snapshot.ok:
+        with stream_command(['git', 'ls-files', '--others', '--exclude-standard', '-z'],
+                            description="snapshot des fichiers untracked", cwd=root) as process:
+            pending = b''
+            for chunk in iter(lambda: process.stdout.read(64 * 1024), b''):
+                *paths, pending = (pending + chunk).split(b'\0')
+                for raw_path in paths:
+                    if raw_path and not check(os.fsdecode(raw_path)):
+                        snapshot.truncated = True
+                        break
+                if snapshot.truncated:
+                    break
+
+    if snapshot.oversized:
+        snapshot.violations.append(
+            f"{len(snapshot.oversized)} fichier(s) de plus de {_format_size(budget.max_file_bytes)}"
+        )
+
+    return snapshot
@@ -0,0 +1,3 @@
+"""
+Outils de test et de benchmark de gitautoflow (sans réseau)
+"""
@@ -0,0 +1,811 @@
+#!/usr/bin/env python3
+"""
+Serveur local imitant le sous-ensemble de l'API GitHub utilisé par gitautoflow
+
+État en mémoire: utilisateur, repositories, labels, issues et dépendances
+(blocked_by), PRs et merges, tags annotés (API Git Data), releases, permissions
+des GitHub Actions, plus les mutations GraphQL `createIssue` et la requête
+`nodes`. Latence, quota primaire (X-RateLimit-*), limite secondaire (requêtes
+simultanées) et délais de propagation sont configurables; les GET renvoient un
+ETag et répondent 304.
+
+Avec `git_root`, chaque repository est un repository bare local
+(<git_root>/<owner>/<repo>.git): les merges de PR et les tags de release y sont
+réellement appliqués. Les shims `gh` et `ssh` permettent de lancer les commandes
+de gitautoflow contre le serveur sans réseau:
+
+    python -m gitautoflow.testing.github_standin serve --git-root /tmp/gh --shim-dir /tmp/gh/bin
+    eval "$(...)"   # exporte GITHUB_API_URL, GITHUB_TOKEN, PATH, GIT_SSH_COMMAND...
+    gitautoflow issue create notes.md --force
+"""
+
+import hashlib
+import json
+import os
+import re
+import shlex
+import shutil
+import stat
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+import typer
+
+
+DEFAULT_TOKEN = "standin-token"
+DEFAULT_LOGIN = "standin-user"
+
+# Quota primaire par défaut (requêtes par fenêtre d'une heure), comme un token GitHub
+DEFAULT_RATE_LIMIT = 5000
+
+# Identité des commits créés côté "GitHub" (merges)
+_GIT_IDENTITY = {
+    'GIT_AUTHOR_NAME': 'GitHub', 'GIT_AUTHOR_EMAIL': 'noreply@github.com',
+    'GIT_COMMITTER_NAME': 'GitHub', 'GIT_COMMITTER_EMAIL': 'noreply@github.com',
+}
+
+Response = Tuple[int, Any, Dict[str, str]]
+
+
+class StandInError(Exception):
+    """Réponse d'erreur de l'API simulée"""
+
+    def __init__(self, status: int, message: str, errors: Optional[list] = None, headers: Optional[dict] = None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.errors = errors
+        self.headers = headers or {}
+
+
+class GitHubStandIn:
+    """État en mémoire et logique des endpoints simulés"""
+
+    def __init__(self, login: str = DEFAULT_LOGIN, tokens: Optional[List[str]] = None,
+                 git_root: Optional[str] = None, latency: float = 0.0,
+                 rate_limit: int = DEFAULT_RATE_LIMIT, rate_window: float = 3600.0,
+                 max_concurrent: Optional[int] = None, mergeable_delay: float = 0.0,
+                 propagation_delay: float = 0.0):
+        """
+        Args:
+            login: Login de l'utilisateur authentifié
+            tokens: Tokens acceptés (défaut: [DEFAULT_TOKEN]), tout autre token reçoit 401
+            git_root: Répertoire des repositories bare (None: API seule, sans git)
+            latency: Latence ajoutée à chaque requête (secondes)
+            rate_limit: Quota primaire par fenêtre (X-RateLimit-Limit)
+            rate_window: Durée de la fenêtre du quota primaire (secondes)
+            max_concurrent: Requêtes simultanées au-delà desquelles une limite secondaire est renvoyée
+            mergeable_delay: Délai avant que `mergeable` d'une PR soit calculé
+            propagation_delay: Délai avant qu'un repository créé soit visible
+        """
+        self.login = login
+        self.tokens = set(tokens or [DEFAULT_TOKEN])
+        self.git_root = git_root
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.max_concurrent = max_concurrent
+        self.mergeable_delay = mergeable_delay
+        self.propagation_delay = propagation_delay
+
+        self.lock = threading.RLock()
+        self.stats: Counter = Counter()
+        self.repos: Dict[str, dict] = {}
+        self.workflow_permissions: Dict[str, str] = {}
+        self._next_id = 1000
+        self._in_flight = 0
+        self._window_start = time.time()
+        self._used = 0
+        self._routes: List[Tuple[str, str, re.Pattern, Callable[..., Response]]] = []
+        self._register_routes()
+
+    # --- Infrastructure --------------------------------------------------
+
+    def _new_id(self) -> int:
+        with self.lock:
+            self._next_id += 1
+            return self._next_id
+
+    def _route(self, method: str, pattern: str, handler: Callable[..., Response]) -> None:
+        regex = '^' + re.sub(r'\{(\w+)\}', r'(?P<\1>[^/]+)', pattern) + '$'
+        self._routes.append((method, pattern, re.compile(regex), handler))
+
+    def _register_routes(self) -> None:
+        repo = '/repos/{owner}/{repo}'
+        for method, pattern, handler in (
+            ('GET', '/user', self.get_user),
+            ('GET', '/user/emails', self.get_user_emails),
+            ('POST', '/user/repos', self.create_user_repo),
+            ('POST', '/orgs/{org}/repos', self.create_org_repo),
+            ('GET', repo, self.get_repo),
+            ('DELETE', repo, self.delete_repo),
+            ('PUT', repo + '/actions/permissions/workflow', self.set_workflow_permissions),
+            ('GET', repo + '/labels', self.list_labels),
+            ('POST', repo + '/labels', self.create_label),
+            ('GET', repo + '/labels/{name}', self.get_label),
+            ('POST', repo + '/issues', self.create_issue),
+            ('GET', repo + '/issues/{number}', self.get_issue),
+            ('POST', repo + '/issues/{number}/labels', self.add_issue_labels),
+            ('GET', repo + '/issues/{number}/dependencies/blocked_by', self.list_blocked_by),
+            ('POST', repo + '/issues/{number}/dependencies/blocked_by', self.add_blocked_by),
+            ('POST', repo + '/pulls', self.create_pull),
+            ('GET', repo + '/pulls/{number}', self.get_pull),
+            ('PUT', repo + '/pulls/{number}/merge', self.merge_pull),
+            ('POST', repo + '/git/tags', self.create_git_tag),
+            ('POST', repo + '/git/refs', self.create_git_ref),
+            ('POST', repo + '/releases', self.create_release),
+            ('GET', repo + '/releases/tags/{tag}', self.get_release_by_tag),
+            ('POST', '/graphql', self.graphql),
+            ('POST', '/api/graphql', self.graphql),
+            ('GET', '/_standin/stats', self.get_stats),
+        ):
+            self._route(method, pattern, handler)
+
+    def _rate_limit(self, headers: Dict[str, str], consume: bool) -> None:
+        """En-têtes X-RateLimit-*; refuse la requête si le quota est épuisé, sinon le consomme"""
+        with self.lock:
+            now = time.time()
+            if now - self._window_start >= self.rate_window:
+                self._window_start, self._used = now, 0
+            if not consume and self._used >= self.rate_limit:
+                raise StandInError(403, "API rate limit exceeded for user.", headers={
+                    'X-RateLimit-Limit': str(self.rate_limit), 'X-RateLimit-Remaining': '0',
+                    'X-RateLimit-Reset': str(int(self._window_start + self.rate_window))})
+            if consume:
+                self._used += 1
+            headers.update({'X-RateLimit-Limit': str(self.rate_limit), 'X-RateLimit-Used': str(self._used),
+                            'X-RateLimit-Remaining': str(self.rate_limit - self._used),
+                            'X-RateLimit-Reset': str(int(self._window_start + self.rate_window))})
+
+    def handle(self, method: str, raw_path: str, headers: Dict[str, str], body: bytes) -> Response:
+        """
+        Traite une requête HTTP
+
+        Returns:
+            tuple: (status, corps JSON, en-têtes de réponse)
+        """
+        url = urlparse(raw_path)
+        path = unquote(url.path).rstrip('/') or '/'
+        if path.startswith('/api/v3/'):
+            path = path[len('/api/v3'):]
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        with self.lock:
+            self._in_flight += 1
+            in_flight = self._in_flight
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            response_headers = {'X-OAuth-Scopes': 'repo, workflow, delete_repo'}
+            try:
+                token = re.sub(r'^(Bearer|token)\s+', '', headers.get('Authorization', ''), flags=re.I)
+                if path != '/_standin/stats' and token not in self.tokens:
+                    raise StandInError(401, "Bad credentials")
+                if self.max_concurrent and in_flight > self.max_concurrent:
+                    raise StandInError(403, "You have exceeded a secondary rate limit. Please wait a few minutes before you try again.",
+                                       headers={'Retry-After': '1'})
+
+                self._rate_limit(response_headers, consume=False)
+
+                for route_method, pattern, regex, handler in self._routes:
+                    match = regex.match(path)
+                    if route_method == method and match:
+                        break
+                else:
+                    raise StandInError(404, "Not Found")
+                self.stats[f"{method} {pattern}"] += 1
+
+                payload = json.loads(body) if body else {}
+                status, data, extra = handler(payload=payload, query=query, **match.groupdict())
+                response_headers.update(extra)
+
+                if method == 'GET' and status == 200:
+                    etag = 'W/"%s"' % hashlib.sha1(json.dumps(data, sort_keys=True).encode()).hexdigest()
+                    response_headers['ETag'] = etag
+                    if headers.get('If-None-Match') == etag:
+                        # Les 304 ne consomment pas de quota, comme sur GitHub
+                        return 304, None, response_headers
+                self._rate_limit(response_headers, consume=True)
+                return status, data, response_headers
+            except StandInError as e:
+                response_headers.update(e.headers)
+                data = {'message': e.message, 'documentation_url': 'https://docs.github.com/rest'}
+                if e.errors:
+                    data['errors'] = e.errors
+                return e.status, data, response_headers
+        finally:
+            with self.lock:
+                self._in_flight -= 1
+
+    # --- Git (repositories bare) -----------------------------------------
+
+    def _git_dir(self, full_name: str) -> Optional[str]:
+        return os.path.join(self.git_root, f"{full_name}.git") if self.git_root else None
+
+    def _git(self, full_name: str, *args: str, check: bool = True,
+             input: Optional[str] = None) -> subprocess.CompletedProcess:
+        # Commandes côté "serveur": hors command_runner pour ne pas polluer le ledger du client
+        env = dict(os.environ, **_GIT_IDENTITY)
+        result = subprocess.run(['git', '--git-dir', self._git_dir(full_name), *args],
+                                capture_output=True, text=True, env=env, input=input)
+        if check and result.returncode != 0:
+            raise StandInError(422, f"git {args[0]}: {result.stderr.strip()}")
+        return result
+
+    def _rev(self, full_name: str, ref: str) -> Optional[str]:
+        result = self._git(full_name, 'rev-parse', '--verify', '--quiet', f"{ref}^{{commit}}", check=False)
+        return result.stdout.strip() or None
+
+    # --- Utilisateur ------------------------------------------------------
+
+    def get_user(self, payload, query) -> Response:
+        return 200, {'login': self.login, 'id': 1, 'node_id': 'U_1', 'name': self.login.title(),
+                     'email': None, 'type': 'User'}, {}
+
+    def get_user_emails(self, payload, query) -> Response:
+        return 200, [{'email': f"{self.login}@example.com", 'primary': True, 'verified': True}], {}
+
+    # --- Repositories -----------------------------------------------------
+
+    def _repo(self, owner: str, repo: str) -> dict:
+        with self.lock:
+            entry = self.repos.get(f"{owner}/{repo}".lower())
+        if entry is None or entry['visible_at'] > time.time():
+            raise StandInError(404, "Not Found")
+        return entry
+
+    def _create_repo(self, owner: str, payload: dict) -> Response:
+        name = payload.get('name')
+        if not name:
+            raise StandInError(422, "Validation Failed", [{'field': 'name', 'code': 'missing_field'}])
+        full_name = f"{owner}/{name}"
+        with self.lock:
+            if full_name.lower() in self.repos:
+                raise StandInError(422, "Repository creation failed.",
+                                   [{'resource': 'Repository', 'field': 'name', 'message': 'name already exists on this account'}])
+            repo_id = self._new_id()
+            entry = {
+                'id': repo_id, 'node_id': f"R_{repo_id}", 'name': name, 'full_name': full_name,
+                'owner': {'login': owner}, 'private': payload.get('private', False),
+                'description': payload.get('description', ''), 'default_branch': 'main',
+                'html_url': f"https://github.com/{full_name}", 'visible_at': time.time() + self.propagation_delay,
+                'labels': {}, 'issues': {}, 'next_number': 1, 'releases': {},
+            }
+            self.repos[full_name.lower()] = entry
+        if self.git_root:
+            os.makedirs(os.path.dirname(self._git_dir(full_name)), exist_ok=True)
+            subprocess.run(['git', 'init', '--bare', '--quiet', '--initial-branch=main', self._git_dir(full_name)],
+                           check=True)
+        return 201, self._public_repo(entry), {}
+
+    def _public_repo(self, entry: dict) -> dict:
+        return {key: value for key, value in entry.items()
+                if key not in ('labels', 'issues', 'next_number', 'releases', 'visible_at')}
+
+    def create_user_repo(self, payload, query) -> Response:
+        return self._create_repo(self.login, payload)
+
+    def create_org_repo(self, payload, query, org) -> Response:
+        return self._create_repo(org, payload)
+
+    def get_repo(self, payload, query, owner, repo) -> Response:
+        return 200, self._public_repo(self._repo(owner, repo)), {}
+
+    def delete_repo(self, payload, query, owner, repo) -> Response:
+        entry = self._repo(owner, repo)
+        with self.lock:
+            del self.repos[entry['full_name'].lower()]
+        if self.git_root:
+            shutil.rmtree(self._git_dir(entry['full_name']), ignore_errors=True)
+        return 204, None, {}
+
+    def set_workflow_permissions(self, payload, query, owner, repo) -> Response:
+        entry = self._repo(owner, repo)
+        self.workflow_permissions[entry['full_name']] = payload.get('default_workflow_permissions', 'read')
+        return 204, None, {}
+
+    # --- Labels -----------------------------------------------------------
+
+    def list_labels(self, payload, query, owner, repo) -> Response:
+        labels = list(self._repo(owner, repo)['labels'].values())
+        per_page, page = int(query.get('per_page', 30)), int(query.get('page', 1))
+        return 200, labels[(page - 1) * per_page:page * per_page], {}
+
+    def create_label(self, payload, query, owner, repo) -> Response:
+        entry = self._repo(owner, repo)
+        name = payload.get('name', '')
+        with self.lock:
+            if name in entry['labels']:
+                raise StandInError(422, "Validation Failed",
+                                   [{'resource': 'Label', 'code': 'already_exists', 'field': 'name'}])
+            label_id = self._new_id()
+            entry['labels'][name] = {'id': label_id, 'node_id': f"LA_{label_id}", 'name': name,
+                                     'color': payload.get('color', 'ededed')}
+        return 201, entry['labels'][name], {}
+
+    def get_label(self, payload, query, owner, repo, name) -> Response:
+        label = self._repo(owner, repo)['labels'].get(name)
+        if label is None:
+            raise StandInError(404, "Not Found")
+        return 200, label, {}
+
+    # --- Issues -------------------------------------------------------------
+
+    def _new_issue(self, entry: dict, title: str, body: str, label_names: List[str], **extra) -> dict:
+        with self.lock:
+            number = entry['next_number']
+            entry['next_number'] += 1
+            issue_id = self._new_id()
+            issue = {
+                'id': issue_id, 'node_id': f"I_{issue_id}", 'number': number, 'title': title, 'body': body,
+                'state': 'open', 'labels': [entry['labels'][name] for name in label_names if name in entry['labels']],
+                'html_url': f"{entry['html_url']}/issues/{number}", 'blocked_by': [], **extra,
+            }
+            entry['issues'][number] = issue
+        return issue
+
+    def _issue(self, owner: str, repo: str, number: str) -> Tuple[dict, dict]:
+        entry = self._repo(owner, repo)
+        issue = entry['issues'].get(int(number))
+        if issue is None:
+            raise StandInError(404, "Not Found")
+        return entry, issue
+
+    def _public_issue(self, issue: dict) -> dict:
+        return {key: value for key, value in issue.items() if key not in ('blocked_by', 'pull')}
+
+    def create_issue(self, payload, query, owner, repo) -> Response:
+        entry = self._repo(owner, repo)
+        if not payload.get('title'):
+            raise StandInError(422, "Validation Failed", [{'field': 'title', 'code': 'missing_field'}])
+        for name in payload.get('labels') or []:
+            if name not in entry['labels']:
+                self.create_label({'name': name}, query, owner, repo)
+        issue = self._new_issue(entry, payload['title'], payload.get('body', ''), payload.get('labels') or [])
+        return 201, self._public_issue(issue), {}
+
+    def get_issue(self, payload, query, owner, repo, number) -> Response:
+        return 200, self._public_issue(self._issue(owner, repo, number)[1]), {}
+
+    def add_issue_labels(self, payload, query, owner, repo, number) -> Response:
+        entry, issue = self._issue(owner, repo, number)
+        for name in payload.get('labels') or []:
+            if name not in entry['labels']:
+                self.create_label({'name': name}, query, owner, repo)
+            if all(label['name'] != name for label in issue['labels']):
+                issue['labels'].append(entry['labels'][name])
+        return 200, issue['labels'], {}
+
+    def list_blocked_by(self, payload, query, owner, repo, number) -> Response:
+        entry, issue = self._issue(owner, repo, number)
+        blocking = [self._public_issue(other) for other in entry['issues'].values() if other['id'] in issue['blocked_by']]
+        return 200, blocking, {}
+
+    def add_blocked_by(self, payload, query, owner, repo, number) -> Response:
+        entry, issue = self._issue(owner, repo, number)
+        blocking = next((other for other in entry['issues'].values() if other['id'] == payload.get('issue_id')), None)
+        if blocking is None:
+            raise StandInError(404, "Blocking issue not found")
+        with self.lock:
+            if blocking['id'] not in issue['blocked_by']:
+                issue['blocked_by'].append(blocking['id'])
+        return 201, self._public_issue(blocking), {}
+
+    # --- Pull requests ------------------------------------------------------
+
+    def _public_pull(self, entry: dict, issue: dict) -> dict:
+        pull = issue['pull']
+        if pull['mergeable'] is None and time.time() >= pull['created_at'] + self.mergeable_delay:
+            pull['mergeable'] = self._compute_mergeable(entry['full_name'], pull) if pull['state'] == 'open' else False
+        return {
+            'id': issue['id'], 'node_id': f"PR_{issue['id']}", 'number': issue['number'], 'title': issue['title'],
+            'body': issue['body'], 'state': pull['state'], 'draft': pull['draft'], 'merged': pull['merged'],
+            'mergeable': pull['mergeable'], 'merge_commit_sha': pull['merge_commit_sha'],
+            'head': {'ref': pull['head']}, 'base': {'ref': pull['base']},
+            'html_url': f"{entry['html_url']}/pull/{issue['number']}",
+        }
+
+    def _compute_mergeable(self, full_name: str, pull: dict) -> bool:
+        if not self.git_root:
+            return True
+        result = self._git(full_name, 'merge-tree', '--write-tree', f"refs/heads/{pull['base']}",
+                           f"refs/heads/{pull['head']}", check=False)
+        return result.returncode == 0
+
+    def create_pull(self, payload, query, owner, repo) -> Response:
+        entry = self._repo(owner, repo)
+        head, base = payload.get('head', ''), payload.get('base', '')
+        head = head.split(':', 1)[-1]
+        if self.git_root:
+            for field, branch in (('head', head), ('base', base)):
+                if not self._rev(entry['full_name'], f"refs/heads/{branch}"):
+                    raise StandInError(422, "Validation Failed", [{'resource': 'PullRequest', 'field': field, 'code': 'invalid'}])
+            if self._git(entry['full_name'], 'rev-list', '--count', f"refs/heads/{base}..refs/heads/{head}").stdout.strip() == '0':
+                raise StandInError(422, "Validation Failed",
+                                   [{'resource': 'PullRequest', 'code': 'custom', 'message': f"No commits between {base} and {head}"}])
+        pull = {'head': head, 'base': base, 'draft': payload.get('draft', False), 'state': 'open',
+                'merged': False, 'mergeable': None, 'merge_commit_sha': None, 'created_at': time.time()}
+        issue = self._new_issue(entry, payload.get('title', ''), payload.get('body', ''), [], pull=pull)
+        return 201, self._public_pull(entry, issue), {}
+
+    def _pull(self, owner: str, repo: str, number: str) -> Tuple[dict, dict]:
+        entry, issue = self._issue(owner, repo, number)
+        if 'pull' not in issue:
+            raise StandInError(404, "Not Found")
+        return entry, issue
+
+    def get_pull(self, payload, query, owner, repo, number) -> Response:
+        entry, issue = self._pull(owner, repo, number)
+        return 200, self._public_pull(entry, issue), {}
+
+    def merge_pull(self, payload, query, owner, repo, number) -> Response:
+        entry, issue = self._pull(owner, repo, number)
+        pull = issue['pull']
+        with self.lock:
+            if pull['state'] != 'open':
+                raise StandInError(405, "Pull Request is not mergeable")
+            sha = self._merge_git(entry['full_name'], issue, payload.get('merge_method', 'merge'))
+            pull.update(state='closed', merged=True, merge_commit_sha=sha)
+        return 200, {'sha': sha, 'merged': True, 'message': "Pull Request successfully merged"}, {}
+
+    def _merge_git(self, full_name: str, issue: dict, method: str) -> str:
+        pull = issue['pull']
+        if not self.git_root:
+            return hashlib.sha1(f"{full_name}#{issue['number']}".encode()).hexdigest()
+        base_ref, head_ref = f"refs/heads/{pull['base']}", f"refs/heads/{pull['head']}"
+        base_sha, head_sha = self._rev(full_name, base_ref), self._rev(full_name, head_ref)
+        tree = self._git(full_name, 'merge-tree', '--write-tree', base_ref, head_ref, check=False)
+        if tree.returncode != 0:
+            raise StandInError(405, "Pull Request is not mergeable")
+        tree_sha = tree.stdout.split('\n', 1)[0].strip()
+        if method == 'merge':
+            message = f"Merge pull request #{issue['number']} from {pull['head']}\n\n{issue['title']}"
+            parents = ['-p', base_sha, '-p', head_sha]
+        else:
+            # squash et rebase: un seul commit sur la base (suffisant pour les scénarios testés)
+            message = f"{issue['title']} (#{issue['number']})"
+            parents = ['-p', base_sha]
+        sha = self._git(full_name, 'commit-tree', tree_sha, *parents, '-m', message).stdout.strip()
+        self._git(full_name, 'update-ref', base_ref, sha, base_sha)
+        return sha
+
+    # --- Git Data (tags annotés) ---------------------------------------------
+
+    def create_git_tag(self, payload, query, owner, repo) -> Response:
+        entry = self._repo(owner, repo)
+        tag, message, target = payload.get('tag'), payload.get('message', ''), payload.get('object')
+        if not tag or not target:
+            raise StandInError(422, "Validation Failed", [{'resource': 'Tag', 'code': 'missing_field'}])
+        content = (f"object {target}\ntype {payload.get('type', 'commit')}\ntag {tag}\n"
+                   f"tagger {self.login} <{self.login}@users.noreply.github.com> {int(time.time())} +0000\n\n{message}\n")
+        if self.git_root:
+            sha = self._git(entry['full_name'], 'mktag', input=content).stdout.strip()
+        else:
+            sha = hashlib.sha1(content.encode()).hexdigest()
+        return 201, {'sha': sha, 'node_id': f"TAG_{sha[:12]}", 'tag': tag, 'message': message,
+                     'object': {'sha': target, 'type': payload.get('type', 'commit')}}, {}
+
+    def create_git_ref(self, payload, query, owner, repo) -> Response:
+        entry = self._repo(owner, repo)
+        ref, sha = payload.get('ref', ''), payload.get('sha', '')
+        if not ref.startswith('refs/') or not sha:
+            raise StandInError(422, "Validation Failed", [{'resource': 'Reference', 'code': 'invalid'}])
+        if self.git_root:
+            with self.lock:
+                if self._git(entry['full_name'], 'rev-parse', '--verify', '--quiet', ref, check=False).stdout.strip():
+                    raise StandInError(422, "Reference already exists")
+                self._git(entry['full_name'], 'update-ref', ref, sha)
+        kind = 'tag' if ref.startswith('refs/tags/') else 'commit'
+        return 201, {'ref': ref, 'node_id': f"REF_{sha[:12]}", 'object': {'sha': sha, 'type': kind}}, {}
+
+    # --- Releases -------------------------------------------------------------
+
+    def create_release(self, payload, query, owner, repo) -> Response:
+        entry = self._repo(owner, repo)
+        tag = payload.get('tag_name', '')
+        with self.lock:
+            if tag in entry['releases']:
+                raise StandInError(422, "Validation Failed", [{'resource': 'Release', 'code': 'already_exists', 'field': 'tag_name'}])
+            if self.git_root and not self._rev(entry['full_name'], f"refs/tags/{tag}"):
+                # Comme GitHub: le tag absent est créé sur target_commitish (branche par défaut sinon)
+                target = payload.get('target_commitish') or entry['default_branch']
+                sha = self._rev(entry['full_name'], target) or self._rev(entry['full_name'], f"refs/heads/{target}")
+                if not sha:
+                    raise StandInError(422, "Validation Failed", [{'resource': 'Release', 'code': 'invalid', 'field': 'target_commitish'}])
+                self._git(entry['full_name'], 'update-ref', f"refs/tags/{tag}", sha)
+            release_id = self._new_id()
+            release = {'id': release_id, 'node_id': f"RE_{release_id}", 'tag_name': tag,
+                       'name': payload.get('name', tag), 'body': payload.get('body', ''),
+                       'target_commitish': payload.get('target_commitish') or entry['default_branch'],
+                       'draft': payload.get('draft', False), 'prerelease': payload.get('prerelease', False),
+                       'html_url': f"{entry['html_url']}/releases/tag/{tag}"}
+            entry['releases'][tag] = release
+        return 201, release, {}
+
+    def get_release_by_tag(self, payload, query, owner, repo, tag) -> Response:
+        release = self._repo(owner, repo)['releases'].get(tag)
+        if release is None:
+            raise StandInError(404, "Not Found")
+        return 200, release, {}
+
+    # --- GraphQL --------------------------------------------------------------
+
+    def _find_node(self, node_id: str) -> Optional[dict]:
+        with self.lock:
+            for entry in self.repos.values():
+                if entry['node_id'] == node_id:
+                    return {'id': node_id}
+                for issue in entry['issues'].values():
+                    if issue['node_id'] == node_id:
+                        return {'id': node_id}
+        return None
+
+    def graphql(self, payload, query) -> Response:
+        """Sous-ensemble GraphQL: mutations createIssue aliasées et requête nodes(ids)"""
+        document, variables = payload.get('query', ''), payload.get('variables') or {}
+        data: Dict[str, Any] = {}
+        errors = []
+
+        aliases = re.findall(r'(\w+)\s*:\s*createIssue\(input:\s*\$(\w+)\)', document)
+        for alias, variable in aliases:
+            issue_input = variables.get(variable) or {}
+            entry = next((repo for repo in self.repos.values() if repo['node_id'] == issue_input.get('repositoryId')), None)
+            if entry is None or not issue_input.get('title'):
+                data[alias] = None
+                errors.append({'type': 'NOT_FOUND' if entry is None else 'UNPROCESSABLE', 'path': [alias],
+                               'message': "Could not resolve to a node with the global id" if entry is None else "Title can't be blank"})
+                continue
+            label_names = [label['name'] for label in entry['labels'].values() if label['node_id'] in (issue_input.get('labelIds') or [])]
+            issue = self._new_issue(entry, issue_input['title'], issue_input.get('body', ''), label_names)
+            data[alias] = {'issue': {'id': issue['node_id'], 'number': issue['number'],
+                                     'url': issue['html_url'], 'databaseId': issue['id']}}
+
+        if re.search(r'\bnodes\(ids:', document):
+            ids = variables.get('ids') or []
+            data['nodes'] = [self._find_node(node_id) for node_id in ids]
+            errors.extend({'type': 'NOT_FOUND', 'path': ['nodes', index], 'message': f"Could not resolve to a node with the global id of '{node_id}'"}
+                          for index, (node_id, node) in enumerate(zip(ids, data['nodes'])) if node is None)
+
+        if not aliases and 'nodes' not in data:
+            return 200, {'errors': [{'message': "Opération GraphQL non supportée par le stand-in"}]}, {}
+        return 200, {'data': data, 'errors': errors} if errors else {'data': data}, {}
+
+    def get_stats(self, payload, query) -> Response:
+        return 200, dict(self.stats), {}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # En-têtes et corps sont écrits séparément: sans TCP_NODELAY, chaque réponse
+    # keep-alive attend l'ACK retardé du client (~40 ms)
+    disable_nagle_algorithm = True
+    server: 'StandInServer'
+
+    def _dispatch(self) -> None:
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        status, data, headers = self.server.standin.handle(self.command, self.path, dict(self.headers), body)
+        content = json.dumps(data).encode() if data is not None else b''
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        if content:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Serveur HTTP du stand-in, démarré dans un thread (utilisable en context manager)"""
+
+    daemon_threads = True
+
+    def __init__(self, standin: Optional[GitHubStandIn] = None, host: str = '127.0.0.1', port: int = 0):
+        super().__init__((host, port), _Handler)
+        self.standin = standin or GitHubStandIn()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'StandInServer':
+        # Arrêt réactif: serve_forever vérifie la demande d'arrêt toutes les 50 ms
+        self._thread = threading.Thread(target=self.serve_forever, kwargs={'poll_interval': 0.05},
+                                        name="github-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> 'StandInServer':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def env(self, shim_dir: Optional[str] = None, gh_only: bool = False) -> Dict[str, str]:
+        """
+        Variables d'environnement pour lancer gitautoflow contre le stand-in
+
+        Args:
+            shim_dir: Répertoire où écrire les shims gh (ajouté en tête du PATH)
+            gh_only: Sans GITHUB_TOKEN: les appels passent par le shim `gh api`
+
+        Returns:
+            dict: Variables à ajouter à l'environnement
+        """
+        token = sorted(self.standin.tokens)[0]
+        env = {'GITHUB_API_URL': self.url, 'GITHUB_STANDIN_URL': self.url, 'GITHUB_STANDIN_TOKEN': token}
+        if not gh_only:
+            env['GITHUB_TOKEN'] = token
+        else:
+            env['GITHUB_STANDIN_NO_TOKEN'] = '1'
+        if shim_dir:
+            write_shims(shim_dir)
+            env['PATH'] = f"{shim_dir}{os.pathsep}{os.environ.get('PATH', '')}"
+        if self.standin.git_root:
+            # git@github.com:owner/repo.git (et https://github.com/ réécrit) servis depuis git_root
+            env.update({
+                'GIT_SSH_COMMAND': f"{shlex.quote(sys.executable)} -m gitautoflow.testing.github_standin ssh",
+                'GIT_SSH_VARIANT': 'simple',
+                'GITHUB_STANDIN_GIT_ROOT': self.standin.git_root,
+                'GIT_CONFIG_COUNT': '1',
+                'GIT_CONFIG_KEY_0': 'url.git@github.com:.insteadOf',
+                'GIT_CONFIG_VALUE_0': 'https://github.com/',
+            })
+        return env
+
+
+def write_shims(directory: str) -> str:
+    """
+    Écrit le shim `gh` (redirigé vers le stand-in) dans un répertoire
+
+    Returns:
+        str: Chemin du shim
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, 'gh')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"#!/bin/sh\nexec {shlex.quote(sys.executable)} -m gitautoflow.testing.github_standin gh \"$@\"\n")
+    os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return path
+
+
+# --- Shims ------------------------------------------------------------------
+
+def _shim_request(method: str, endpoint: str, body: Optional[bytes]) -> Tuple[int, bytes]:
+    import urllib.error
+    import urllib.request
+
+    url = os.environ['GITHUB_STANDIN_URL'].rstrip('/') + '/' + endpoint.lstrip('/')
+    request = urllib.request.Request(url, data=body, method=method, headers={
+        'Authorization': f"Bearer {os.environ.get('GITHUB_STANDIN_TOKEN', DEFAULT_TOKEN)}",
+        'Content-Type': 'application/json',
+    })
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+def run_gh_shim(args: List[str]) -> int:
+    """Sous-ensemble de gh: --version, auth token|status, api"""
+    if args[:1] == ['--version']:
+        print("gh version 2.99.0 (github-standin)")
+        return 0
+    if args[:2] == ['auth', 'token']:
+        if os.environ.get('GITHUB_STANDIN_NO_TOKEN'):
+            print("no oauth token found", file=sys.stderr)
+            return 1
+        print(os.environ.get('GITHUB_STANDIN_TOKEN', DEFAULT_TOKEN))
+        return 0
+    if args[:2] == ['auth', 'status']:
+        status, _ = _shim_request('GET', '/user', None)
+        print("Logged in to github-standin" if status == 200 else "You are not logged into any GitHub hosts. To log in, run: gh auth login",
+              file=sys.stderr)
+        return 0 if status == 200 else 1
+    if args[:1] == ['api']:
+        method, endpoint, body, fields = 'GET', None, None, {}
+        rest = iter(args[1:])
+        for arg in rest:
+            if arg in ('--method', '-X'):
+                method = next(rest)
+            elif arg == '--input':
+                source = next(rest)
+                body = sys.stdin.buffer.read() if source == '-' else open(source, 'rb').read()
+            elif arg in ('-f', '-F', '--field', '--raw-field'):
+                key, _, value = next(rest).partition('=')
+                fields[key] = value
+            elif endpoint is None:
+                endpoint = arg
+        if fields and body is None:
+            body = json.dumps(fields).encode()
+            method = 'POST' if method == 'GET' else method
+        status, content = _shim_request(method, endpoint or '/', body)
+        if status >= 400:
+            try:
+                message = json.loads(content).get('message', '')
+            except ValueError:
+                message = content.decode(errors='replace')
+            sys.stdout.write(content.decode(errors='replace'))
+            print(f"gh: {message} (HTTP {status})", file=sys.stderr)
+            return 1
+        sys.stdout.write(content.decode(errors='replace'))
+        return 0
+    print(f"github-standin: commande gh non supportée: {' '.join(args)}", file=sys.stderr)
+    return 1
+
+
+def run_ssh_shim(args: List[str]) -> int:
+    """GIT_SSH_COMMAND: `<hôte> "git-upload-pack 'owner/repo.git'"` exécuté sur GITHUB_STANDIN_GIT_ROOT"""
+    command = shlex.split(args[-1])
+    program, repository = command[0], command[-1].lstrip('/')
+    if not repository.endswith('.git'):
+        repository += '.git'
+    path = os.path.join(os.environ['GITHUB_STANDIN_GIT_ROOT'], repository)
+    if not os.path.isdir(path):
+        print(f"ERROR: Repository not found: {repository}", file=sys.stderr)
+        return 128
+    os.execvp('git', ['git', program.replace('git-', '', 1), path])
+    return 0
+
+
+app = typer.Typer(help="Stand-in local de l'API GitHub (tests et benchmarks sans réseau)")
+
+
+@app.command()
+def serve(
+    port: int = typer.Option(0, "--port", help="Port d'écoute (0: port libre)"),
+    git_root: Optional[str] = typer.Option(None, "--git-root", help="Répertoire des repositories bare"),
+    shim_dir: Optional[str] = typer.Option(None, "--shim-dir", help="Répertoire où écrire le shim gh"),
+    latency: float = typer.Option(0.0, "--latency", help="Latence ajoutée à chaque requête (secondes)"),
+    rate_limit: int = typer.Option(DEFAULT_RATE_LIMIT, "--rate-limit", help="Quota primaire par heure"),
+    max_concurrent: Optional[int] = typer.Option(None, "--max-concurrent", help="Requêtes simultanées avant limite secondaire"),
+    mergeable_delay: float = typer.Option(0.0, "--mergeable-delay", help="Délai de calcul de mergeable (secondes)"),
+    propagation_delay: float = typer.Option(0.0, "--propagation-delay", help="Délai de visibilité d'un repo créé"),
+    gh_only: bool = typer.Option(False, "--gh-only", help="Sans GITHUB_TOKEN: appels via le shim gh"),
+):
+    """Démarre le stand-in et affiche les variables d'environnement à exporter"""
+    standin = GitHubStandIn(git_root=os.path.abspath(git_root) if git_root else None, latency=latency,
+                            rate_limit=rate_limit, max_concurrent=max_concurrent,
+                            mergeable_delay=mergeable_delay, propagation_delay=propagation_delay)
+    server = StandInServer(standin, port=port)
+    for key, value in server.env(os.path.abspath(shim_dir) if shim_dir else None, gh_only=gh_only).items():
+        print(f"export {key}={shlex.quote(value)}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+@app.command(context_settings={"allow_extra_args": True, "ignore_unknown_options": True})
+def gh(ctx: typer.Context):
+    """Shim gh (appelé par le script écrit par write_shims)"""
+    raise typer.Exit(run_gh_shim(ctx.args))
+
+
+@app.command(context_settings={"allow_extra_args": True, "ignore_unknown_options": True})
+def ssh(ctx: typer.Context):
+    """Shim ssh pour GIT_SSH_COMMAND"""
+    raise typer.Exit(run_ssh_shim(ctx.args))
+
+
+if __name__ == "__main__":
+    app()
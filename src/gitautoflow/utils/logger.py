@@ -3,12 +3,49 @@
 Git Auto-Flow - Système de logging centralisé
 """
 
+import contextvars
 import logging
+import threading
+from contextlib import contextmanager
 from rich.console import Console
 from rich.logging import RichHandler
 
+# Messages retenus pour le contexte courant (étape de pipeline), None: affichage direct
+_output_buffer: contextvars.ContextVar = contextvars.ContextVar('gitautoflow_output_buffer', default=None)
+_flush_lock = threading.Lock()
+
+
+class BufferedConsole(Console):
+    """Console dont les print peuvent être retenus le temps d'une étape (voir buffered_output)"""
+
+    def print(self, *args, **kwargs):
+        buffer = _output_buffer.get()
+        if buffer is not None:
+            buffer.append((args, kwargs))
+            return
+        super().print(*args, **kwargs)
+
+
 # Console globale pour les messages
-console = Console()
+console = BufferedConsole()
+
+
+@contextmanager
+def buffered_output():
+    """
+    Retient les messages (info, warning, console.print...) du contexte courant et
+    les affiche d'un seul bloc à la sortie: les étapes exécutées en parallèle ne
+    mélangent pas leurs lignes
+    """
+    buffer = []
+    token = _output_buffer.set(buffer)
+    try:
+        yield
+    finally:
+        _output_buffer.reset(token)
+        with _flush_lock:
+            for args, kwargs in buffer:
+                console.print(*args, **kwargs)
 
 def setup_logger(name="gitautoflow", level=logging.INFO):
     """Configure le logger avec Rich"""
@@ -0,0 +1,219 @@
+"""
+Fixtures communes: environnement isolé (HOME, cache, identité git), singletons
+réinitialisés entre les tests et repository git de travail cloné d'un remote local
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from gitautoflow.core import github as github_module
+from gitautoflow.lib import command_runner, fetch_coordinator, ref_index
+from gitautoflow.testing.github_standin import GitHubStandIn, StandInServer
+
+
+@pytest.fixture(autouse=True)
+def isolated_env(tmp_path, monkeypatch):
+    """HOME, cache et configuration git propres à chaque test"""
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv('HOME', str(home))
+    monkeypatch.setenv('GITAUTOFLOW_CACHE_DIR', str(tmp_path / "cache"))
+    monkeypatch.setenv('GIT_CONFIG_NOSYSTEM', '1')
+    for role in ('AUTHOR', 'COMMITTER'):
+        monkeypatch.setenv(f'GIT_{role}_NAME', 'Test')
+        monkeypatch.setenv(f'GIT_{role}_EMAIL', 'test@example.com')
+    for name in ('GITHUB_TOKEN', 'GH_TOKEN', 'GEMINI_API_KEY', 'GROQ_API_KEY', 'GITAUTOFLOW_FETCH_FRESHNESS'):
+        monkeypatch.delenv(name, raising=False)
+
+    # Singletons de l'exécution courante
+    monkeypatch.setattr(ref_index, '_ref_index', None)
+    monkeypatch.setattr(fetch_coordinator, '_fetch_coordinator', None)
+    monkeypatch.setattr(github_module, '_github_client', None)
+    monkeypatch.setattr(github_module, '_current_repo', None)
+    command_runner.get_command_ledger().reset()
+    return home
+
+
+@pytest.fixture
+def git():
+    """Lance une commande git et retourne sa sortie standard"""
+    def run(*args, cwd=None):
+        result = subprocess.run(['git', *args], cwd=cwd, capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+    return run
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch, git):
+    """
+    Clone de travail (répertoire courant) d'un remote bare local, avec un commit
+    initial poussé sur main
+    """
+    origin = tmp_path / "origin.git"
+    work = tmp_path / "work"
+    git('init', '--bare', '-q', '-b', 'main', str(origin))
+    git('clone', '-q', str(origin), str(work))
+    git('checkout', '-q', '-b', 'main', cwd=work)
+    (work / "README.md").write_text("# demo\n")
+    git('add', 'README.md', cwd=work)
+    git('commit', '-q', '-m', 'chore: initial commit', cwd=work)
+    git('push', '-q', 'origin', 'main', cwd=work)
+    monkeypatch.chdir(work)
+    return work
+
+
+@pytest.fixture
+def push_from_other_clone(tmp_path, git):
+    """Pousse un nouveau commit sur origin/<branche> depuis un second clone"""
+    def push(branch='main', filename='other.txt'):
+        other = tmp_path / "other"
+        if not other.exists():
+            git('clone', '-q', str(tmp_path / "origin.git"), str(other))
+        git('checkout', '-q', branch, cwd=other)
+        git('pull', '-q', '--ff-only', cwd=other)
+        (other / filename).write_text(f"{filename}\n")
+        git('add', filename, cwd=other)
+        git('commit', '-q', '-m', f'feat: add {filename}', cwd=other)
+        git('push', '-q', 'origin', branch, cwd=other)
+        return git('rev-parse', 'HEAD', cwd=other)
+    return push
+
+
+def ledger_commands(*prefix):
+    """Commandes du ledger qui commencent par prefix (ex: 'git', 'fetch')"""
+    return [record.argv for record in command_runner.get_command_ledger().records
+            if tuple(record.argv[:len(prefix)]) == prefix]
+
+
+# Remplaçant de gitleaks pour les tests: signale les lignes contenant FAKE_SECRET
+# et journalise chaque appel (un argv JSON par ligne) dans $FAKE_GITLEAKS_LOG
+_FAKE_GITLEAKS = '''#!{python}
+import json, os, sys
+
+with open(os.environ['FAKE_GITLEAKS_LOG'], 'a') as log:
+    log.write(json.dumps(sys.argv[1:]) + '\\n')
+if sys.argv[1] == 'version':
+    print('8.0.0-fake')
+    sys.exit(0)
+if os.environ.get('FAKE_GITLEAKS_FAIL'):
+    sys.stderr.write('fatal: config invalide')
+    sys.exit(2)
+args = sys.argv[1:]
+source, report = args[args.index('--source') + 1], args[args.index('--report-path') + 1]
+findings = []
+for directory, _, names in os.walk(source):
+    for name in sorted(names):
+        path = os.path.join(directory, name)
+        with open(path, errors='replace') as f:
+            for number, line in enumerate(f, 1):
+                if 'FAKE_SECRET' in line:
+                    findings.append({{'File': os.path.relpath(path, source), 'StartLine': number,
+                                     'RuleID': 'fake-rule', 'Description': 'Fake secret', 'Secret': 'REDACTED'}})
+with open(report, 'w') as f:
+    json.dump(findings, f)
+sys.exit(1 if findings else 0)
+'''
+
+
+@pytest.fixture
+def fake_gitleaks(tmp_path, monkeypatch):
+    """
+    Exécutable gitleaks factice en tête du PATH
+
+    Returns:
+        Fonction retournant la liste des argv reçus par gitleaks
+    """
+    bin_dir = tmp_path / "fake-bin"
+    bin_dir.mkdir()
+    executable = bin_dir / "gitleaks"
+    executable.write_text(_FAKE_GITLEAKS.format(python=sys.executable))
+    executable.chmod(0o755)
+    log = tmp_path / "gitleaks.log"
+    log.touch()
+    monkeypatch.setenv('FAKE_GITLEAKS_LOG', str(log))
+    monkeypatch.setenv('PATH', f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    def calls():
+        return [json.loads(line) for line in log.read_text().splitlines()]
+    return calls
+
+
+SRC = str(Path(__file__).resolve().parent.parent / "src")
+
+
+@pytest.fixture
+def start_github(tmp_path, monkeypatch):
+    """
+    Démarre le stand-in de l'API GitHub (repositories bare dans tmp_path/github)
+    et exporte son environnement: GITHUB_API_URL, token, shims gh et ssh
+
+    Returns:
+        Fonction (gh_only=False, **options du GitHubStandIn) -> StandInServer
+    """
+    servers = []
+
+    def start(gh_only=False, **options):
+        options.setdefault('git_root', str(tmp_path / "github"))
+        server = StandInServer(GitHubStandIn(**options)).start()
+        servers.append(server)
+        # Les shims relancent python -m gitautoflow.testing.github_standin
+        monkeypatch.setenv('PYTHONPATH', os.pathsep.join(filter(None, [SRC, os.getenv('PYTHONPATH')])))
+        for key, value in server.env(str(tmp_path / "github-bin"), gh_only=gh_only).items():
+            monkeypatch.setenv(key, value)
+        if gh_only:
+            monkeypatch.delenv('GITHUB_TOKEN', raising=False)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+@pytest.fixture
+def github(start_github):
+    """Stand-in GitHub démarré avec les options par défaut (appels HTTP avec token)"""
+    return start_github()
+
+
+@pytest.fixture
+def fake_ai(monkeypatch):
+    """
+    Réponses IA fixées par le test (aucune requête Gemini/Groq)
+
+    Retourne le dict {méthode d'AIProvider: réponse} à remplir par le test.
+    """
+    from gitautoflow.lib.ai_provider import AIProvider
+
+    monkeypatch.setenv('GEMINI_API_KEY', 'test-key')
+    responses = {}
+    for name in ('analyze_for_commit', 'analyze_for_pr', 'analyze_for_release', 'generate_tickets'):
+        monkeypatch.setattr(AIProvider, name, lambda self, *args, _name=name, **kwargs: responses[_name])
+    return responses
+
+
+@pytest.fixture
+def github_repo(github, tmp_path, monkeypatch, git):
+    """
+    Repository standin-user/demo créé sur le stand-in et cloné dans tmp_path/demo
+    (répertoire courant): un commit initial poussé sur main et sur develop,
+    branches locales main et develop suivant origin
+
+    Returns:
+        Path: Le clone de travail
+    """
+    github_module.get_github_client().create_repo('standin-user', 'demo')
+    clone = tmp_path / "demo"
+    git('clone', '--quiet', 'https://github.com/standin-user/demo.git', str(clone))
+    (clone / "README.md").write_text("# demo\n")
+    git('add', 'README.md', cwd=clone)
+    git('commit', '--quiet', '-m', 'chore: initial commit', cwd=clone)
+    git('checkout', '--quiet', '-B', 'main', cwd=clone)
+    git('push', '--quiet', '-u', 'origin', 'main', 'main:develop', cwd=clone)
+    git('branch', '--quiet', '--track', 'develop', 'origin/develop', cwd=clone)
+    monkeypatch.chdir(clone)
+    return clone
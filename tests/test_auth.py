@@ -0,0 +1,88 @@
+"""Tests de la validation de l'authentification GitHub et de son cache (TTL, changement de token, 401)"""
+
+import pytest
+
+from conftest import ledger_commands
+from gitautoflow.core import auth, github as github_module
+from gitautoflow.core.auth import _parse_expiration, ensure_github_auth, validate_github_auth
+from gitautoflow.core.github import GitHubError, get_github_client
+
+
+def user_requests(server):
+    return server.standin.stats['GET /user']
+
+
+def test_validation_is_cached_between_runs(github):
+    status = validate_github_auth()
+
+    assert status['login'] == 'standin-user'
+    assert status['scopes'] == ['repo', 'workflow', 'delete_repo']
+
+    github_module._github_client = None
+    assert ensure_github_auth()
+    assert user_requests(github) == 1
+
+
+def test_gh_validation_is_cached(start_github):
+    start_github(gh_only=True)
+
+    assert ensure_github_auth()
+    spawned = len(ledger_commands('gh'))
+    assert ensure_github_auth()
+    assert len(ledger_commands('gh')) == spawned
+
+
+def test_expired_ttl_revalidates(github, monkeypatch):
+    monkeypatch.setenv('GITAUTOFLOW_AUTH_TTL', '0')
+
+    assert ensure_github_auth()
+    assert ensure_github_auth()
+    assert user_requests(github) == 2
+
+
+def test_token_change_revalidates(start_github, monkeypatch):
+    server = start_github(tokens=['token-a', 'token-b'])
+    for token in ('token-a', 'token-b'):
+        monkeypatch.setenv('GITHUB_TOKEN', token)
+        github_module._github_client = None
+        assert ensure_github_auth()
+
+    assert user_requests(server) == 2
+
+
+def test_invalid_token_is_rejected(github, monkeypatch):
+    monkeypatch.setenv('GITHUB_TOKEN', 'revoked')
+
+    assert not ensure_github_auth()
+
+
+def test_unauthorized_call_forgets_the_cached_validation(github):
+    assert ensure_github_auth()
+    github.standin.tokens.clear()
+
+    with pytest.raises(GitHubError):
+        get_github_client().get_repo('standin-user/demo')
+
+    assert validate_github_auth() is None
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2026-11-01 12:00:00 UTC', 1793534400.0),
+    ('2026-11-01 12:00:00 +0100', 1793530800.0),
+    ('demain', None),
+    (None, None),
+])
+def test_token_expiration_header(value, expected):
+    assert _parse_expiration(value) == expected
+
+
+def test_expired_token_is_revalidated(github, monkeypatch):
+    status = validate_github_auth()
+    assert status['expires_at'] is None
+
+    store = auth._store()
+    store.set(auth.token_fingerprint(), dict(status, expires_at=status['validated_at'] - 1))
+    store.save()
+
+    assert validate_github_auth()['expires_at'] is None
+    assert user_requests(github) == 2
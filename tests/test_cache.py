@@ -0,0 +1,167 @@
+"""Tests du cache JSON persistant et du cache des résultats de scan"""
+
+import itertools
+
+import pytest
+
+from gitautoflow.cli.commits import run_gitleaks_scan_all_modified
+from gitautoflow.lib import cache as cache_module
+from gitautoflow.lib.cache import JsonCache, get_cache_dir
+from gitautoflow.lib.secret_scan import ScanCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Horloge strictement croissante: l'ordre LRU ne dépend pas de la résolution de time.time"""
+    ticks = itertools.count(1000)
+    monkeypatch.setattr(cache_module.time, 'time', lambda: float(next(ticks)))
+
+
+def test_values_survive_a_new_instance():
+    cache = JsonCache('demo', namespace='v1')
+    cache.set('key', {'etag': 'abc'})
+    cache.save()
+
+    assert JsonCache('demo', namespace='v1').get('key') == {'etag': 'abc'}
+
+
+def test_cache_dir_from_environment(tmp_path, monkeypatch):
+    assert get_cache_dir() == str(tmp_path / "cache")
+
+    monkeypatch.delenv('GITAUTOFLOW_CACHE_DIR')
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / "xdg"))
+    assert get_cache_dir() == str(tmp_path / "xdg" / "gitautoflow")
+
+
+def test_other_namespace_starts_empty():
+    cache = JsonCache('demo', namespace='v1')
+    cache.set('key', 1)
+    cache.save()
+
+    other = JsonCache('demo', namespace='v2')
+    assert other.get('key') is None
+    other.save()
+    assert JsonCache('demo', namespace='v1').get('key') is None
+
+
+def test_corrupt_file_is_an_empty_cache(tmp_path):
+    (tmp_path / "cache").mkdir()
+    (tmp_path / "cache" / "demo.json").write_text("{not json")
+
+    cache = JsonCache('demo')
+    assert cache.get('key', 'default') == 'default'
+    cache.set('key', 1)
+    cache.save()
+    assert JsonCache('demo').get('key') == 1
+
+
+def test_disabled_cache_neither_reads_nor_writes(tmp_path, monkeypatch):
+    JsonCache('demo').set('key', 1)
+    monkeypatch.setenv('GITAUTOFLOW_NO_CACHE', '1')
+
+    cache = JsonCache('demo')
+    cache.set('key', 2)
+    cache.save()
+
+    assert not (tmp_path / "cache" / "demo.json").exists()
+
+
+def test_least_recently_used_entries_are_evicted(clock):
+    cache = JsonCache('demo', max_entries=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+    cache.save()
+
+    reloaded = JsonCache('demo')
+    assert 'a' in reloaded and 'c' in reloaded and 'b' not in reloaded
+
+
+def test_eviction_by_size(clock):
+    cache = JsonCache('demo', max_bytes=120)
+    for key in 'abcdef':
+        cache.set(key, 'x' * 20)
+    cache.save()
+
+    reloaded = JsonCache('demo')
+    assert 'f' in reloaded and 'a' not in reloaded
+
+
+def test_shared_cache_merges_concurrent_writers():
+    first = JsonCache('shared', shared=True)
+    second = JsonCache('shared', shared=True)
+    first.set('a', 1)
+    second.set('b', 2)
+
+    first.save()
+    second.save()
+
+    reloaded = JsonCache('shared')
+    assert reloaded.get('a') == 1 and reloaded.get('b') == 2
+
+
+def test_unshared_cache_keeps_its_own_view():
+    first = JsonCache('private')
+    second = JsonCache('private')
+    first.set('a', 1)
+    second.set('b', 2)
+
+    first.save()
+    second.save()
+
+    assert 'a' not in JsonCache('private')
+
+
+def test_scan_cache_skips_unchanged_files(tmp_path, fake_gitleaks):
+    (tmp_path / "a.py").write_text("a = 1\n")
+    (tmp_path / "b.py").write_text("b = 1\n")
+    files = ['a.py', 'b.py']
+
+    cache = ScanCache('gitleaks', root=str(tmp_path))
+    assert cache.pending(files, str(tmp_path)) == files
+    cache.mark_clean(['a.py'])
+    cache.save()
+
+    (tmp_path / "b.py").write_text("b = 2\n")
+    cache = ScanCache('gitleaks', root=str(tmp_path))
+    assert cache.pending(files, str(tmp_path)) == ['b.py']
+
+    (tmp_path / "a.py").write_text("a = 2\n")
+    assert cache.pending(files, str(tmp_path)) == files
+
+
+def test_scan_cache_depends_on_the_rules(tmp_path, fake_gitleaks):
+    (tmp_path / "a.py").write_text("a = 1\n")
+    config = tmp_path / ".gitleaks.toml"
+    config.write_text("[extend]\nuseDefault = true\n")
+
+    cache = ScanCache('gitleaks', str(config), str(tmp_path))
+    cache.pending(['a.py'], str(tmp_path))
+    cache.mark_clean(['a.py'])
+    cache.save()
+    assert ScanCache('gitleaks', str(config), str(tmp_path)).pending(['a.py'], str(tmp_path)) == []
+
+    config.write_text("[extend]\nuseDefault = false\n")
+    assert ScanCache('gitleaks', str(config), str(tmp_path)).pending(['a.py'], str(tmp_path)) == ['a.py']
+
+
+def test_scan_cache_is_shared_across_paths_without_path_rules(tmp_path, fake_gitleaks):
+    config = tmp_path / ".gitleaks.toml"
+    config.write_text("[extend]\nuseDefault = true\n")
+    for name in ('a.py', 'copy.py'):
+        (tmp_path / name).write_text("same = 1\n")
+
+    cache = ScanCache('gitleaks', str(config), str(tmp_path))
+    cache.pending(['a.py'], str(tmp_path))
+    cache.mark_clean(['a.py'])
+
+    assert cache.pending(['copy.py'], str(tmp_path)) == []
+
+
+def test_second_scan_of_the_same_content_runs_no_gitleaks(repo, fake_gitleaks):
+    (repo / "module.py").write_text("value = 1\n")
+    assert run_gitleaks_scan_all_modified() is True
+    assert run_gitleaks_scan_all_modified() is True
+
+    assert len([argv for argv in fake_gitleaks() if argv[0] == 'detect']) == 1
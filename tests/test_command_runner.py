@@ -0,0 +1,105 @@
+"""Tests du runner de commandes (ledger, timeouts, lecture en flux)"""
+
+import subprocess
+import sys
+
+import pytest
+
+from gitautoflow.lib.command_runner import (
+    TIMEOUT_RETURNCODE, CommandTimeoutError, get_command_ledger, get_default_timeout, is_read_only,
+    run_command, stream_command
+)
+
+SLEEP = [sys.executable, '-c', 'import time; time.sleep(5)']
+
+
+@pytest.mark.parametrize('command, expected', [
+    (['git', 'status', '--porcelain'], True),
+    (['git', '-C', 'repo', '-c', 'core.pager=cat', 'log'], True),
+    (['git', 'fetch', 'origin', 'main'], True),
+    (['git', 'commit', '-m', 'x'], False),
+    (['git', '-C', 'log', 'push'], False),
+    (['git', 'rebase', '--autostash', 'origin/main'], False),
+    (['gh', 'api', 'repos/o/r'], True),
+    (['gh', 'api', '-X', 'POST', 'repos/o/r/issues'], False),
+    (['gh', 'api', 'repos/o/r/issues', '-f', 'title=x'], False),
+    (['gh', 'auth', 'status'], True),
+    (['gh', 'pr', 'create', '--fill'], False),
+    (['gitleaks', 'detect'], True),
+])
+def test_read_only_classification(command, expected):
+    assert is_read_only(command) is expected
+
+
+def test_default_timeouts(monkeypatch):
+    assert get_default_timeout(['git', 'status']) == 300.0
+    assert get_default_timeout(['git', 'push']) is None
+
+    monkeypatch.setenv('GITAUTOFLOW_TIMEOUT_GIT', '12')
+    assert get_default_timeout(['git', 'status']) == 12.0
+    monkeypatch.setenv('GITAUTOFLOW_TIMEOUT_GIT', '0')
+    assert get_default_timeout(['git', 'status']) is None
+    monkeypatch.setenv('GITAUTOFLOW_TIMEOUT_GIT', 'abc')
+    assert get_default_timeout(['git', 'status']) == 300.0
+
+
+def test_commands_are_recorded_in_the_ledger(tmp_path):
+    result = run_command(['git', '--version'], capture_output=True, text=True, cwd=tmp_path)
+
+    (record,) = get_command_ledger().records
+    assert record.argv == ['git', '--version'] and record.tool == 'git'
+    assert record.cwd == str(tmp_path)
+    assert record.returncode == 0 and record.stdout_bytes == len(result.stdout)
+    assert record.duration > 0
+
+
+def test_failed_command_is_recorded_before_raising(tmp_path):
+    with pytest.raises(subprocess.CalledProcessError):
+        run_command(['git', 'rev-parse', 'HEAD'], capture_output=True, check=True, cwd=tmp_path)
+
+    assert get_command_ledger().records[0].returncode == 128
+
+
+def test_timeout_without_check_returns_a_result():
+    result = run_command(SLEEP, timeout=0.2, capture_output=True, text=True)
+
+    assert result.returncode == TIMEOUT_RETURNCODE
+    assert "interrompue après 0.2s" in result.stderr
+    assert get_command_ledger().records[0].timed_out
+
+
+def test_timeout_with_check_raises():
+    with pytest.raises(CommandTimeoutError) as excinfo:
+        run_command(SLEEP, timeout=0.2, capture_output=True, check=True)
+
+    assert isinstance(excinfo.value, subprocess.CalledProcessError)
+    assert excinfo.value.returncode == TIMEOUT_RETURNCODE
+
+
+def test_stream_can_stop_early_without_error():
+    command = [sys.executable, '-c', 'import time\nwhile True:\n    print("line", flush=True)\n    time.sleep(0.01)']
+
+    with stream_command(command, check=True, timeout=5) as process:
+        first = process.stdout.readline()
+
+    assert first.strip() == b'line'
+    assert get_command_ledger().records[0].returncode != 0
+
+
+def test_stream_failure_keeps_stderr():
+    command = [sys.executable, '-c', 'import sys; sys.stderr.write("bad revision"); sys.exit(3)']
+
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        with stream_command(command, check=True) as process:
+            process.stdout.read()
+
+    assert excinfo.value.returncode == 3
+    assert excinfo.value.stderr == b'bad revision'
+
+
+def test_stream_timeout_raises():
+    with pytest.raises(CommandTimeoutError):
+        with stream_command(SLEEP, timeout=0.2) as process:
+            process.stdout.read()
+
+    assert get_command_ledger().records[0].timed_out
@@ -0,0 +1,108 @@
+"""Tests du parcours en streaming des commits et du digest de release"""
+
+import pytest
+
+from gitautoflow.lib.commit_walker import walk_commits
+from gitautoflow.lib.conventional_commits import build_commit_digest
+
+
+def commit(repo, git, message, files=('changes.txt',)):
+    for name in files:
+        path = repo / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        previous = path.read_text() if path.exists() else ""
+        path.write_text(f"{previous}{message.splitlines()[0]}\n")
+        git('add', name)
+    git('commit', '-q', '-m', message)
+    return git('rev-parse', 'HEAD')
+
+
+@pytest.fixture
+def develop(repo, git):
+    git('checkout', '-q', '-b', 'develop')
+    return repo
+
+
+def test_records_are_structured(develop, git):
+    sha = commit(develop, git, "feat(api): add endpoint\n\nLonger explanation.\n\n"
+                               "Closes: #12\nCo-authored-by: Alice <alice@example.com>",
+                 files=('api/routes.py', 'docs/api.md'))
+
+    (record,) = walk_commits('main')
+
+    assert record.sha == sha
+    assert record.author == 'Test <test@example.com>'
+    assert record.subject == 'feat(api): add endpoint'
+    assert record.body.startswith('Longer explanation.')
+    assert record.trailers == {'Closes': ['#12'], 'Co-authored-by': ['Alice <alice@example.com>']}
+    assert record.files == ['api/routes.py', 'docs/api.md']
+    assert record.message.startswith('feat(api): add endpoint\n\nLonger explanation.')
+
+
+def test_messages_with_separators_and_newlines(develop, git):
+    commit(develop, git, "fix: subject only")
+    commit(develop, git, "docs: body with a colon\n\nkey: value in the body is not a trailer\n\nmore text")
+
+    records = list(walk_commits('main', with_files=False))
+
+    assert [r.subject for r in records] == ['docs: body with a colon', 'fix: subject only']
+    assert records[0].trailers == {} and records[0].files == []
+    assert records[1].body == ''
+
+
+def test_walk_is_not_limited_in_size(develop, git):
+    for index in range(300):
+        git('commit', '-q', '--allow-empty', '-m', f"chore: step {index}")
+
+    records = list(walk_commits('main'))
+
+    assert len(records) == 300
+    assert records[0].subject == 'chore: step 299' and records[-1].subject == 'chore: step 0'
+
+
+def test_merges_are_skipped_by_default(develop, git):
+    commit(develop, git, "feat: on develop")
+    git('checkout', '-q', '-b', 'side', 'main')
+    commit(develop, git, "fix: on side", files=('side.txt',))
+    git('checkout', '-q', 'develop')
+    git('merge', '-q', '--no-ff', '-m', "Merge branch 'side' into develop", 'side')
+
+    assert len(list(walk_commits('main'))) == 2
+    assert len(list(walk_commits('main', no_merges=False))) == 3
+
+
+def test_stopping_early_is_not_an_error(develop, git):
+    for index in range(50):
+        commit(develop, git, f"chore: step {index}")
+
+    walker = walk_commits('main')
+    first = next(walker)
+    walker.close()
+
+    assert first.subject == 'chore: step 49'
+
+
+def test_unknown_range_raises_with_git_error(develop):
+    with pytest.raises(RuntimeError, match="missing-ref"):
+        list(walk_commits('missing-ref'))
+
+
+def test_digest_groups_the_whole_range(develop, git):
+    commit(develop, git, "feat(ui): dark mode", files=('ui/theme.css',))
+    commit(develop, git, "feat: export csv\n\nFixes: #7", files=('core/export.py',))
+    commit(develop, git, "fix: crash on start\n\nCloses: #7", files=('core/app.py',))
+    commit(develop, git, "refactor!: new config format", files=('core/config.py',))
+    commit(develop, git, "update readme", files=('README.md',))
+    commit(develop, git, "Release v1.0.0")
+
+    digest = build_commit_digest('main', samples_per_group=1)
+
+    assert digest.total == 5
+    assert digest.counts == {'feat': 2, 'fix': 1, 'breaking': 1, 'other': 1}
+    lines = digest.lines()
+    assert lines[0] == "5 commits, 1 author(s)"
+    assert lines[1] == "BREAKING CHANGES (1): new config format"
+    assert lines[2] == "Features (2): export csv (+1 more)"
+    assert "Other (non-conventional) (1): update readme" in lines
+    assert "Most touched areas: core/ (3), README.md (1), ui/ (1)" in lines
+    assert lines[-1] == "Referenced issues: #7"
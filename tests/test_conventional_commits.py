@@ -0,0 +1,111 @@
+"""Tests du calcul local de version (conventional commits, semver)"""
+
+import pytest
+from typer.testing import CliRunner
+
+from gitautoflow.cli.releases import app as releases_app
+from gitautoflow.lib.conventional_commits import bump_version, is_ignored_subject, parse_commit, plan_next_version
+
+
+@pytest.mark.parametrize('message, expected', [
+    ("feat: add login", ('feat', None, 'add login', False)),
+    ("fix(api): handle 404", ('fix', 'api', 'handle 404', False)),
+    ("refactor(core)!: drop python 3.7", ('refactor', 'core', 'drop python 3.7', True)),
+    ("Feat: capitalised type", ('feat', None, 'capitalised type', False)),
+    ("chore: bump deps\n\nBREAKING CHANGE: node 20 required", ('chore', None, 'bump deps', True)),
+    ("fix: x\n\nBREAKING-CHANGE: api", ('fix', None, 'x', True)),
+    ("docs: mention BREAKING CHANGE: in the guide", ('docs', None, 'mention BREAKING CHANGE: in the guide', False)),
+])
+def test_parse_conventional_commit(message, expected):
+    commit = parse_commit('abc123', message)
+
+    assert (commit.type, commit.scope, commit.description, commit.breaking) == expected
+
+
+@pytest.mark.parametrize('message', [
+    "update stuff",
+    "feature: not a known type",
+    "feat:missing space",
+    "feat(scope: unbalanced",
+])
+def test_unconventional_messages(message):
+    assert parse_commit('abc123', message) is None
+
+
+@pytest.mark.parametrize('tag, bump, expected', [
+    ('v1.4.2', 'major', 'v2.0.0'),
+    ('v1.4.2', 'minor', 'v1.5.0'),
+    ('v1.4.2', 'patch', 'v1.4.3'),
+    ('vv0.9.9', 'patch', 'v0.9.10'),
+    ('1.0.0-rc1', 'minor', 'v1.1.0'),
+    ('not-a-version', 'minor', 'v0.1.0'),
+])
+def test_bump_version(tag, bump, expected):
+    assert bump_version(tag, bump) == expected
+
+
+def test_technical_commits_are_ignored():
+    assert is_ignored_subject("Merge pull request #12 from org/feature")
+    assert is_ignored_subject("Merge branch 'develop' into main")
+    assert is_ignored_subject("Release v1.2.0")
+    assert not is_ignored_subject("feat: merge branch selector")
+
+
+def commit(repo, git, subject, body=None):
+    path = repo / "changes.txt"
+    previous = path.read_text() if path.exists() else ""
+    path.write_text(f"{previous}{subject}\n")
+    git('add', 'changes.txt')
+    args = ['commit', '-q', '-m', subject] + (['-m', body] if body else [])
+    git(*args)
+
+
+@pytest.fixture
+def develop(repo, git):
+    git('tag', 'v1.2.3')
+    git('push', '-q', 'origin', 'v1.2.3')
+    git('checkout', '-q', '-b', 'develop')
+    return repo
+
+
+def test_highest_bump_wins(develop, git):
+    commit(develop, git, "fix: typo")
+    commit(develop, git, "feat(ui): dark mode")
+    commit(develop, git, "Release v9.9.9")
+
+    plan = plan_next_version('v1.2.3', 'main')
+
+    assert plan.is_conventional
+    assert [c.type for c in plan.commits] == ['feat', 'fix']
+    assert (plan.bump, plan.version) == ('minor', 'v1.3.0')
+
+
+def test_breaking_trailer_bumps_major(develop, git):
+    commit(develop, git, "feat: new api", "BREAKING CHANGE: the old endpoints are gone")
+
+    assert plan_next_version('v1.2.3', 'main').version == 'v2.0.0'
+
+
+def test_unconventional_commits_need_the_ai(develop, git):
+    commit(develop, git, "feat: ok")
+    commit(develop, git, "wip")
+
+    plan = plan_next_version('v1.2.3', 'main')
+
+    assert not plan.is_conventional
+    assert [subject for _, subject in plan.unconventional] == ['wip']
+
+
+def test_empty_range_has_no_version(develop):
+    plan = plan_next_version('v1.2.3', 'main')
+
+    assert not plan.is_conventional and plan.bump is None and plan.version is None
+
+
+def test_next_version_command_without_ai(develop, git):
+    commit(develop, git, "fix: patch only")
+
+    result = CliRunner().invoke(releases_app, ['next-version'])
+
+    assert result.exit_code == 0, result.output
+    assert result.output.strip().splitlines()[-1] == 'v1.2.4'
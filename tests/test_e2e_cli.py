@@ -0,0 +1,100 @@
+"""
+Tests de bout en bout des commandes CLI contre le stand-in GitHub et ses shims
+gh et ssh: aucune requête réseau, l'état du serveur et des repositories bare est vérifié
+"""
+
+import subprocess
+
+import pytest
+from typer.testing import CliRunner
+
+from gitautoflow.cli.main import app
+from gitautoflow.core.github import get_github_client
+
+REPO = 'standin-user/demo'
+
+TICKETS = {'tickets': [
+    {'title': 'Modèle de données', 'description': 'Tables', 'priority': 'high', 'estimate': 2,
+     'labels': ['enhancement', 'priority-high'], 'position': 1, 'dependencies': []},
+    {'title': 'API export', 'description': 'Endpoint CSV', 'priority': 'medium', 'estimate': 1,
+     'labels': ['enhancement'], 'position': 2, 'dependencies': [1]},
+    {'title': 'Documentation', 'description': 'Guide', 'priority': 'low', 'estimate': 1,
+     'labels': ['documentation'], 'position': 3, 'dependencies': [1, 2]},
+]}
+
+
+def invoke(*args):
+    result = CliRunner().invoke(app, list(args))
+    assert result.exit_code == 0, result.output
+    return result
+
+
+def bare(github, *args, repo=REPO):
+    git_dir = f"{github.standin.git_root}/{repo}.git"
+    return subprocess.run(['git', '--git-dir', git_dir, *args], capture_output=True, text=True).stdout.strip()
+
+
+@pytest.mark.parametrize('gh_only', [False, True], ids=['http', 'gh'])
+def test_issue_create(start_github, fake_ai, tmp_path, gh_only):
+    server = start_github(gh_only=gh_only)
+    get_github_client().create_repo('standin-user', 'demo')
+    notes = tmp_path / "notes.md"
+    notes.write_text("# Réunion\n- modèle, export, doc\n")
+    fake_ai['generate_tickets'] = TICKETS
+
+    invoke('issue', 'create', str(notes), '--repo', REPO, '--force')
+
+    issues = server.standin.repos[REPO]['issues']
+    assert [issues[number]['title'] for number in sorted(issues)] == ['Modèle de données', 'API export', 'Documentation']
+    assert [label['name'] for label in issues[1]['labels']] == ['enhancement', 'priority-high']
+    assert issues[2]['blocked_by'] == [issues[1]['id']]
+    assert sorted(issues[3]['blocked_by']) == sorted([issues[1]['id'], issues[2]['id']])
+
+
+def test_feature_pr_merge_then_release(github, github_repo, git, fake_ai):
+    git('checkout', '--quiet', '-b', 'feature/export', cwd=github_repo)
+    (github_repo / "export.py").write_text("def export():\n    return 'csv'\n")
+    git('add', 'export.py', cwd=github_repo)
+    git('commit', '--quiet', '-m', 'feat: export CSV', cwd=github_repo)
+    fake_ai['analyze_for_pr'] = {'title': 'feat: export CSV', 'body': 'Ajoute l\'export', 'labels': ['enhancement', 'inconnu']}
+
+    invoke('pr', '--merge', '--force')
+
+    pull = github.standin.repos[REPO]['issues'][1]
+    assert pull['pull']['merged'] and pull['pull']['base'] == 'develop'
+    assert [label['name'] for label in pull['labels']] == ['enhancement']
+    assert 'return' in bare(github, 'show', 'develop:export.py')
+    # Retour sur develop, à jour avec le merge
+    assert git('branch', '--show-current', cwd=github_repo) == 'develop'
+    assert git('rev-parse', 'HEAD', cwd=github_repo) == bare(github, 'rev-parse', 'refs/heads/develop')
+
+    fake_ai['analyze_for_release'] = {
+        'release': {'version': 'v0.1.0', 'version_type': 'minor', 'minor_changes': ['Export CSV']},
+        'pr': {'title': 'Release v0.1.0', 'body': 'Release', 'labels': []},
+    }
+
+    invoke('release', 'auto', '--force')
+
+    release = github.standin.repos[REPO]['releases']['v0.1.0']
+    assert '- Export CSV' in release['body']
+    assert bare(github, 'cat-file', '-t', 'refs/tags/v0.1.0') == 'tag'
+    assert bare(github, 'rev-parse', 'v0.1.0^{commit}') == bare(github, 'rev-parse', 'refs/heads/main')
+    assert 'return' in bare(github, 'show', 'main:export.py')
+
+
+def test_repo_create(github, tmp_path, monkeypatch, git):
+    monkeypatch.setenv('GIT_WORKING_DIR', str(tmp_path / "workspace"))
+
+    invoke('repo', 'create', 'standin-user/newproj', '--public', '--force')
+
+    entry = github.standin.repos['standin-user/newproj']
+    assert entry['private'] is False
+    assert github.standin.workflow_permissions['standin-user/newproj'] == 'write'
+    main = bare(github, 'rev-parse', 'refs/heads/main', repo='standin-user/newproj')
+    assert bare(github, 'rev-parse', 'refs/heads/develop', repo='standin-user/newproj') == main
+    assert bare(github, 'rev-parse', 'v0.1.0^{commit}', repo='standin-user/newproj') == main
+    clone = tmp_path / "workspace" / "newproj"
+    assert (clone / "README.md").exists()
+    assert git('branch', '--show-current', cwd=clone) == 'develop'
+    # Identité git configurée depuis l'utilisateur GitHub (HOME isolé sans configuration)
+    assert git('config', '--global', 'user.email') == 'standin-user@example.com'
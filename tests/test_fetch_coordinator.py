@@ -0,0 +1,132 @@
+"""Tests du coordinateur de fetch (déduplication, fraîcheur de FETCH_HEAD)"""
+
+import subprocess
+
+import pytest
+
+from conftest import ledger_commands
+from gitautoflow.lib.fetch_coordinator import FetchCoordinator
+
+
+def test_requests_are_grouped_into_one_fetch(repo, git):
+    git('push', '-q', 'origin', 'main:develop')
+    coordinator = FetchCoordinator(freshness=0)
+
+    coordinator.request('main')
+    coordinator.request('develop', 'main')
+    assert coordinator.flush() is True
+
+    assert ledger_commands('git', 'fetch') == [['git', 'fetch', 'origin', 'main', 'develop']]
+    assert coordinator.is_fetched('main') and coordinator.is_fetched('develop')
+
+
+def test_branch_is_fetched_once_per_run(repo):
+    coordinator = FetchCoordinator(freshness=0)
+
+    coordinator.fetch('main')
+    coordinator.fetch('main')
+
+    assert len(ledger_commands('git', 'fetch')) == 1
+
+
+def test_force_fetches_again(repo):
+    coordinator = FetchCoordinator(freshness=0)
+
+    coordinator.fetch('main')
+    coordinator.fetch('main', force=True)
+
+    assert len(ledger_commands('git', 'fetch')) == 2
+
+
+def test_recent_fetch_head_skips_the_fetch(repo, git):
+    git('fetch', '-q', 'origin', 'main')
+    coordinator = FetchCoordinator(freshness=60)
+
+    assert coordinator.fetch('main') is True
+
+    assert ledger_commands('git', 'fetch') == []
+    assert coordinator.is_fetched('main')
+
+
+def test_fetch_head_must_cover_every_branch(repo, git):
+    git('push', '-q', 'origin', 'main:develop')
+    git('fetch', '-q', 'origin', 'main')
+    coordinator = FetchCoordinator(freshness=60)
+
+    coordinator.fetch('main', 'develop')
+
+    assert ledger_commands('git', 'fetch') == [['git', 'fetch', 'origin', 'main', 'develop']]
+
+
+def test_stale_fetch_head_is_ignored(repo, git):
+    git('fetch', '-q', 'origin', 'main')
+    coordinator = FetchCoordinator(freshness=0)
+
+    coordinator.fetch('main')
+
+    assert len(ledger_commands('git', 'fetch')) == 1
+
+
+def test_freshness_read_from_environment(monkeypatch):
+    monkeypatch.setenv('GITAUTOFLOW_FETCH_FRESHNESS', '42')
+    assert FetchCoordinator().freshness == 42.0
+
+    monkeypatch.setenv('GITAUTOFLOW_FETCH_FRESHNESS', 'abc')
+    assert FetchCoordinator().freshness == 15.0
+
+
+def test_failed_fetch(repo):
+    coordinator = FetchCoordinator(freshness=0)
+
+    with pytest.raises(subprocess.CalledProcessError):
+        coordinator.fetch('missing-branch')
+    assert coordinator.fetch('missing-branch', check=False) is False
+    assert not coordinator.is_fetched('missing-branch')
+
+
+def test_invalidate_forgets_fetched_branches(repo):
+    coordinator = FetchCoordinator(freshness=0)
+    coordinator.fetch('main')
+
+    coordinator.invalidate()
+    coordinator.fetch('main')
+
+    assert len(ledger_commands('git', 'fetch')) == 2
+
+
+def test_preflight_skips_fetch_when_remote_unchanged(repo):
+    coordinator = FetchCoordinator(freshness=0)
+
+    assert coordinator.fetch('main', preflight=True) is True
+
+    assert len(ledger_commands('git', 'ls-remote')) == 1
+    assert ledger_commands('git', 'fetch') == []
+    assert coordinator.is_fetched('main')
+
+
+def test_preflight_fetches_branches_that_moved(repo, git, push_from_other_clone):
+    git('push', '-q', 'origin', 'main:develop')
+    git('fetch', '-q', 'origin')
+    new_sha = push_from_other_clone('develop')
+    coordinator = FetchCoordinator(freshness=0)
+
+    coordinator.fetch('main', 'develop', preflight=True)
+
+    assert ledger_commands('git', 'fetch') == [['git', 'fetch', 'origin', 'develop']]
+    assert git('rev-parse', 'origin/develop') == new_sha
+
+
+def test_preflight_falls_back_to_fetch_when_remote_unreachable(repo, git):
+    git('remote', 'set-url', 'origin', str(repo.parent / "missing.git"))
+    coordinator = FetchCoordinator(freshness=0)
+
+    assert coordinator.fetch('main', preflight=True, check=False) is False
+    assert len(ledger_commands('git', 'fetch')) == 1
+
+
+def test_unchanged_branches_compares_remote_shas(repo, push_from_other_clone):
+    coordinator = FetchCoordinator(freshness=0)
+    assert coordinator.unchanged_branches(['main']) == ['main']
+
+    push_from_other_clone('main')
+    assert coordinator.unchanged_branches(['main']) == []
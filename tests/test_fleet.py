@@ -0,0 +1,140 @@
+"""Tests du mode fleet (liste des repositories, quota IA partagé, exécution en parallèle)"""
+
+import os
+
+import pytest
+from typer.testing import CliRunner
+
+from conftest import SRC
+from gitautoflow.cli import fleet
+from gitautoflow.cli.fleet import resolve_repositories
+from gitautoflow.lib import rate_limit
+from gitautoflow.lib.rate_limit import AI_RATE_ENV, AI_RATE_FILE_ENV, SharedTokenBucket, acquire_ai_slot
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Horloge contrôlée par le test (time.time et time.sleep du module rate_limit)"""
+    class Clock:
+        now = 1000.0
+        slept = []
+
+        def sleep(self, seconds):
+            self.slept.append(seconds)
+            self.now += seconds
+
+    current = Clock()
+    monkeypatch.setattr(rate_limit.time, 'time', lambda: current.now)
+    monkeypatch.setattr(rate_limit.time, 'sleep', current.sleep)
+    return current
+
+
+def test_bucket_allows_a_burst_then_waits(tmp_path, clock):
+    bucket = SharedTokenBucket(str(tmp_path / "quota.json"), rate_per_minute=60, burst=2)
+
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == pytest.approx(1.0)
+
+    clock.now += 0.5
+    assert bucket.try_acquire() == pytest.approx(0.5)
+
+
+def test_bucket_refills_up_to_the_burst(tmp_path, clock):
+    bucket = SharedTokenBucket(str(tmp_path / "quota.json"), rate_per_minute=60, burst=2)
+    for _ in range(2):
+        bucket.try_acquire()
+
+    clock.now += 3600
+    assert [bucket.try_acquire() for _ in range(2)] == [0, 0]
+    assert bucket.try_acquire() > 0
+
+
+def test_bucket_is_shared_through_its_file(tmp_path, clock):
+    path = str(tmp_path / "quota.json")
+    first = SharedTokenBucket(path, rate_per_minute=30, burst=1)
+    second = SharedTokenBucket(path, rate_per_minute=30, burst=1)
+
+    assert first.try_acquire() == 0
+    assert second.try_acquire() == pytest.approx(2.0)
+
+
+def test_acquire_sleeps_until_a_token_is_available(tmp_path, clock):
+    bucket = SharedTokenBucket(str(tmp_path / "quota.json"), rate_per_minute=120, burst=1)
+
+    bucket.acquire()
+    bucket.acquire()
+
+    assert clock.slept == [pytest.approx(0.5)]
+
+
+def test_ai_slot_only_limits_in_fleet_mode(tmp_path, monkeypatch, clock):
+    path = tmp_path / "quota.json"
+    acquire_ai_slot()
+    assert not path.exists()
+
+    monkeypatch.setenv(AI_RATE_ENV, '60')
+    monkeypatch.setenv(AI_RATE_FILE_ENV, str(path))
+    acquire_ai_slot()
+    assert path.exists()
+
+
+def make_repository(root, git, name, subject):
+    """Repository sur develop avec un commit d'avance sur main"""
+    path = root / name
+    git('init', '-q', '-b', 'main', str(path))
+    (path / "README.md").write_text(f"# {name}\n")
+    git('add', 'README.md', cwd=path)
+    git('commit', '-q', '-m', 'chore: initial commit', cwd=path)
+    git('tag', 'v1.2.3', cwd=path)
+    git('checkout', '-q', '-b', 'develop', cwd=path)
+    (path / "change.txt").write_text("change\n")
+    git('add', 'change.txt', cwd=path)
+    git('commit', '-q', '-m', subject, cwd=path)
+    return path
+
+
+def test_repositories_from_manifest_and_globs(tmp_path, git):
+    services = tmp_path / "services"
+    for name in ('api', 'web'):
+        git('init', '-q', str(services / name))
+    (services / "not-a-repo").mkdir()
+    manifest = tmp_path / "fleet.txt"
+    manifest.write_text("# services\nservices/api  # principal\n\n")
+
+    repositories = resolve_repositories(str(manifest), [str(services / "*")])
+
+    assert repositories == [str(services / "api"), str(services / "web")]
+
+
+def test_fleet_runs_the_command_in_every_repository(tmp_path, monkeypatch, git):
+    make_repository(tmp_path / "fleet", git, 'api', 'feat: add endpoint')
+    make_repository(tmp_path / "fleet", git, 'web', 'fix: typo')
+    monkeypatch.setenv('PYTHONPATH', os.pathsep.join(filter(None, [SRC, os.getenv('PYTHONPATH')])))
+    monkeypatch.setenv('GITHUB_TOKEN', 'test-token')
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(fleet.app, ['next-version', str(tmp_path / "fleet" / "*"), '--jobs', '2'])
+
+    assert result.exit_code == 0, result.output
+    assert "2 repositories traités avec succès" in result.output
+    assert "v1.3.0" in result.output and "v1.2.4" in result.output
+
+
+def test_fleet_reports_failures(tmp_path, monkeypatch, git):
+    # Commit non conventionnel: calcul par IA, impossible sans clé API
+    make_repository(tmp_path / "fleet", git, 'legacy', 'update stuff')
+    monkeypatch.setenv('PYTHONPATH', os.pathsep.join(filter(None, [SRC, os.getenv('PYTHONPATH')])))
+    monkeypatch.setenv('GITHUB_TOKEN', 'test-token')
+
+    result = CliRunner().invoke(fleet.app, ['next-version', str(tmp_path / "fleet" / "legacy"), '--ai-rate', '0'])
+
+    assert result.exit_code == 1
+    assert "1/1 repositories en échec" in result.output
+
+
+def test_unknown_fleet_command(tmp_path):
+    result = CliRunner().invoke(fleet.app, ['deploy', str(tmp_path)])
+
+    assert result.exit_code == 1
+    assert "Commande non supportée: deploy" in result.output
@@ -0,0 +1,98 @@
+"""Tests du client GitHub (session HTTP keep-alive et fallback `gh api`) contre le stand-in"""
+
+import pytest
+
+from conftest import ledger_commands
+from gitautoflow.core.github import GitHubClient, GitHubError, get_github_client, map_bounded, resolve_github_token
+
+
+@pytest.fixture
+def http_client(github):
+    return GitHubClient(github.standin.tokens.copy().pop())
+
+
+@pytest.fixture
+def gh_client(start_github):
+    start_github(gh_only=True)
+    return GitHubClient(None)
+
+
+@pytest.mark.parametrize('client_fixture', ['http_client', 'gh_client'])
+def test_rest_calls(client_fixture, request):
+    client = request.getfixturevalue(client_fixture)
+
+    assert client.get_user()['login'] == 'standin-user'
+    repo = client.create_repo('standin-user', 'demo')
+    issue = client.create_issue(repo['full_name'], 'Bug', 'Details', labels=['bug'])
+
+    assert issue['number'] == 1
+    assert [label['name'] for label in client.get_issue('standin-user/demo', 1)['labels']] == ['bug']
+
+
+@pytest.mark.parametrize('client_fixture', ['http_client', 'gh_client'])
+def test_errors_carry_the_http_status(client_fixture, request):
+    client = request.getfixturevalue(client_fixture)
+
+    with pytest.raises(GitHubError) as excinfo:
+        client.get_repo('standin-user/missing')
+
+    assert excinfo.value.status == 404
+
+
+def test_http_client_does_not_spawn_gh(http_client):
+    http_client.create_repo('standin-user', 'demo')
+    http_client.get_repo('standin-user/demo')
+
+    assert not http_client.uses_gh
+    assert ledger_commands('gh') == []
+
+
+def test_gh_fallback_encodes_query_parameters(gh_client):
+    gh_client.create_repo('standin-user', 'demo')
+    gh_client.request('GET', '/repos/standin-user/demo/labels', params={'per_page': 5, 'q': 'a b&c'})
+
+    (argv,) = [argv for argv in ledger_commands('gh', 'api') if 'labels' in argv[-1]]
+    assert argv[-1] == 'repos/standin-user/demo/labels?per_page=5&q=a+b%26c'
+
+
+def test_pagination(http_client):
+    http_client.create_repo('standin-user', 'demo')
+    for index in range(130):
+        http_client.create_label('standin-user/demo', f"label-{index}")
+
+    labels = http_client.list_labels('standin-user/demo')
+
+    assert len(labels) == 130 and labels[-1] == 'label-129'
+
+
+def test_existing_label_is_returned(http_client):
+    http_client.create_repo('standin-user', 'demo')
+    created = http_client.create_label('standin-user/demo', 'bug')
+
+    assert http_client.create_label('standin-user/demo', 'bug')['id'] == created['id']
+
+
+def test_graphql_errors_are_raised(http_client):
+    with pytest.raises(GitHubError, match="GraphQL"):
+        http_client.graphql("query { viewer { login } }")
+
+
+def test_token_is_resolved_once_for_the_run(start_github):
+    start_github()
+    token = resolve_github_token()
+
+    client = get_github_client()
+
+    assert client.token == token and get_github_client() is client
+
+
+def test_token_from_gh_when_no_environment_token(start_github, monkeypatch):
+    server = start_github()
+    monkeypatch.delenv('GITHUB_TOKEN')
+
+    assert resolve_github_token() == server.standin.tokens.copy().pop()
+    assert ledger_commands('gh', 'auth', 'token')
+
+
+def test_map_bounded_keeps_order():
+    assert map_bounded(lambda value: value * 2, range(10), max_workers=4) == list(range(0, 20, 2))
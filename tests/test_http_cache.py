@@ -0,0 +1,65 @@
+"""Tests des GET conditionnels (ETag / If-None-Match) et du cache HTTP persistant du client GitHub"""
+
+import pytest
+
+from gitautoflow.core.github import GitHubClient
+
+TOKENS = ['token-a', 'token-b']
+
+
+@pytest.fixture
+def server(start_github):
+    server = start_github(tokens=TOKENS)
+    GitHubClient(TOKENS[0]).create_repo('standin-user', 'demo')
+    return server
+
+
+def quota_used(client):
+    return int(client.last_response_headers['X-RateLimit-Used'])
+
+
+def test_unchanged_resource_is_served_from_the_cache(server):
+    client = GitHubClient(TOKENS[0])
+
+    first = client.get_repo('standin-user/demo')
+    used = quota_used(client)
+    second = client.get_repo('standin-user/demo')
+
+    assert second == first
+    # Réponse 304: le corps vient du cache et le quota n'est pas consommé
+    assert quota_used(client) == used
+    assert server.standin.stats['GET /repos/{owner}/{repo}'] == 2
+
+
+def test_changed_resource_is_read_again(server):
+    client = GitHubClient(TOKENS[0])
+
+    assert client.list_labels('standin-user/demo') == []
+    used = quota_used(client)
+    client.create_label('standin-user/demo', 'bug')
+
+    assert client.list_labels('standin-user/demo') == ['bug']
+    assert quota_used(client) == used + 2
+
+
+def test_cache_is_shared_between_runs(server):
+    client = GitHubClient(TOKENS[0])
+    client.get_repo('standin-user/demo')
+    used = quota_used(client)
+    client.save_cache()
+
+    next_run = GitHubClient(TOKENS[0])
+    assert next_run.get_repo('standin-user/demo')['full_name'] == 'standin-user/demo'
+    assert quota_used(next_run) == used
+
+
+def test_cache_entries_are_not_shared_between_tokens(server):
+    client = GitHubClient(TOKENS[0])
+    client.get_repo('standin-user/demo')
+    used = quota_used(client)
+    client.save_cache()
+
+    other = GitHubClient(TOKENS[1])
+    other.get_repo('standin-user/demo')
+    assert quota_used(other) == used + 1
+
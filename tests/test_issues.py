@@ -0,0 +1,89 @@
+"""Tests de la création d'issues groupée (mutations GraphQL aliasées, fallback REST) contre le stand-in"""
+
+import pytest
+
+from gitautoflow.cli.issues import GitCreateTickets
+from gitautoflow.core.github import ISSUE_BATCH_SIZE, get_github_client
+
+REPO = 'standin-user/demo'
+
+
+def ticket(position, title=None, labels=('enhancement',), dependencies=()):
+    return {'title': title if title is not None else f"Ticket {position}", 'description': f"Description {position}",
+            'priority': 'medium', 'estimate': 1, 'labels': list(labels), 'position': position,
+            'dependencies': list(dependencies)}
+
+
+@pytest.fixture
+def tickets_creator(github, fake_ai):
+    get_github_client().create_repo('standin-user', 'demo')
+    github.standin.stats.clear()
+    return GitCreateTickets(repo_full_name=REPO)
+
+
+def test_issues_are_created_in_graphql_batches(github, tickets_creator):
+    tickets = [ticket(position) for position in range(1, ISSUE_BATCH_SIZE + 6)]
+
+    created = tickets_creator.create_github_issues(tickets, 'notes.md')
+
+    issues = github.standin.repos[REPO]['issues']
+    assert [issue['title'] for issue in created] == [t['title'] for t in tickets]
+    assert sorted(issue['title'] for issue in issues.values()) == sorted(t['title'] for t in tickets)
+    # Deux lots (20 + 5), aucune création REST une par une
+    assert github.standin.stats['POST /graphql'] == 2
+    assert github.standin.stats['POST /repos/{owner}/{repo}/issues'] == 0
+
+
+def test_labels_are_created_once_and_attached(github, tickets_creator):
+    tickets = [ticket(1, labels=['bug', 'priority-high']), ticket(2, labels=['bug'])]
+
+    tickets_creator.create_github_issues(tickets, 'notes.md')
+
+    issues = github.standin.repos[REPO]['issues']
+    assert [label['name'] for label in issues[1]['labels']] == ['bug', 'priority-high']
+    assert [label['name'] for label in issues[2]['labels']] == ['bug']
+    assert github.standin.repos[REPO]['labels']['priority-high']['color'] == 'd73a4a'
+    assert github.standin.stats['POST /repos/{owner}/{repo}/labels'] == 2
+
+
+def test_a_failed_mutation_does_not_drop_the_rest_of_the_batch(github, tickets_creator):
+    tickets = [ticket(1), ticket(2, title=''), ticket(3)]
+
+    created = tickets_creator.create_github_issues(tickets, 'notes.md')
+
+    assert [issue['title'] for issue in created] == ['Ticket 1', 'Ticket 3']
+    assert len(github.standin.repos[REPO]['issues']) == 2
+
+
+def test_rest_fallback_without_repository_id(github, tickets_creator, monkeypatch):
+    monkeypatch.setattr(tickets_creator, '_get_repository_id', lambda: None)
+    tickets = [ticket(1, labels=['bug']), ticket(2)]
+
+    created = tickets_creator.create_github_issues(tickets, 'notes.md')
+
+    assert [issue['github_number'] for issue in created] == [1, 2]
+    assert [label['name'] for label in github.standin.repos[REPO]['issues'][1]['labels']] == ['bug']
+    assert github.standin.stats['POST /repos/{owner}/{repo}/issues'] == 2
+    assert github.standin.stats['POST /graphql'] == 0
+
+
+def test_dependencies_reuse_the_ids_known_from_creation(github, tickets_creator):
+    tickets = [ticket(1), ticket(2, dependencies=[1]), ticket(3, dependencies=[1, 2]), ticket(4, dependencies=[9])]
+
+    tickets_creator.create_github_issues(tickets, 'notes.md')
+
+    issues = github.standin.repos[REPO]['issues']
+    assert issues[2]['blocked_by'] == [issues[1]['id']]
+    assert sorted(issues[3]['blocked_by']) == sorted([issues[1]['id'], issues[2]['id']])
+    assert issues[4]['blocked_by'] == []
+    # Une requête par dépendance, aucune relecture des issues bloquantes
+    assert github.standin.stats['POST /repos/{owner}/{repo}/issues/{number}/dependencies/blocked_by'] == 3
+    assert github.standin.stats['GET /repos/{owner}/{repo}/issues/{number}'] == 0
+
+
+def test_dependency_without_known_id_is_read_from_the_api(github, tickets_creator):
+    created = tickets_creator.create_github_issues([ticket(1), ticket(2)], 'notes.md')
+
+    assert tickets_creator._add_dependency_api(created[1]['github_number'], created[0]['github_number'])
+    assert github.standin.repos[REPO]['issues'][2]['blocked_by'] == [created[0]['github_id']]
+    assert github.standin.stats['GET /repos/{owner}/{repo}/issues/{number}'] == 1
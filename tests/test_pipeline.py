@@ -0,0 +1,132 @@
+"""Tests de l'exécuteur de pipeline (ordre, parallélisme, erreurs, sorties groupées)"""
+
+import threading
+import time
+
+import pytest
+
+from gitautoflow.lib.pipeline import Pipeline, Step
+from gitautoflow.utils.logger import console
+
+
+def test_steps_run_after_their_dependencies():
+    order = []
+
+    def record(name, result=None):
+        def func(**kwargs):
+            order.append(name)
+            return result
+        return func
+
+    pipeline = Pipeline([
+        Step('stage', record('stage'), after=('rebase',)),
+        Step('rebase', record('rebase'), inputs=('branch',)),
+        Step('branches', record('branches', {'branch': 'main'}), outputs=('branch',)),
+    ])
+    context = pipeline.run()
+
+    assert order == ['branches', 'rebase', 'stage']
+    assert context == {'branch': 'main'}
+
+
+def test_inputs_come_from_outputs_and_initial_values():
+    pipeline = Pipeline([
+        Step('double', lambda value: {'doubled': value * 2}, inputs=('value',), outputs=('doubled',)),
+        Step('add', lambda doubled, offset: {'total': doubled + offset},
+             inputs=('doubled', 'offset'), outputs=('total',)),
+    ])
+
+    assert pipeline.run(value=3, offset=1)['total'] == 7
+
+
+def test_independent_steps_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def wait_for_other():
+        # Lève BrokenBarrierError si les étapes tournaient l'une après l'autre
+        barrier.wait()
+
+    pipeline = Pipeline([Step('a', wait_for_other), Step('b', wait_for_other)])
+
+    pipeline.run()
+
+    assert {timing.thread for timing in pipeline.timings} == {'step_0', 'step_1'}
+
+
+def test_first_error_stops_the_pipeline():
+    ran = []
+
+    def fail():
+        raise RuntimeError("boom")
+
+    pipeline = Pipeline([
+        Step('fail', fail),
+        Step('next', lambda: ran.append('next'), after=('fail',)),
+    ])
+
+    with pytest.raises(RuntimeError, match="boom"):
+        pipeline.run()
+    assert ran == []
+    assert [(t.name, t.ok) for t in pipeline.timings] == [('fail', False)]
+
+
+def test_running_steps_finish_after_an_error():
+    finished = []
+
+    def slow():
+        time.sleep(0.1)
+        finished.append('slow')
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        Pipeline([Step('slow', slow), Step('fail', fail)]).run()
+    assert finished == ['slow']
+
+
+@pytest.mark.parametrize('steps, message', [
+    ([Step('a', dict), Step('a', dict)], "dupliqués"),
+    ([Step('a', dict, outputs=('x',)), Step('b', dict, outputs=('x',))], "plusieurs étapes"),
+    ([Step('a', dict, after=('missing',))], "inconnue"),
+])
+def test_invalid_definitions_are_rejected(steps, message):
+    with pytest.raises(ValueError, match=message):
+        Pipeline(steps)
+
+
+def test_missing_input_is_reported():
+    with pytest.raises(ValueError, match="Entrées manquantes pour 'a': x"):
+        Pipeline([Step('a', lambda x: None, inputs=('x',))]).run()
+
+
+def test_outputs_must_match_declaration():
+    with pytest.raises(ValueError, match="Sorties non déclarées"):
+        Pipeline([Step('a', lambda: {'x': 1})]).run()
+    with pytest.raises(ValueError, match="Sorties manquantes"):
+        Pipeline([Step('a', lambda: {}, outputs=('x',))]).run()
+
+
+def test_cycles_are_reported():
+    pipeline = Pipeline([Step('a', dict, after=('b',)), Step('b', dict, after=('a',))])
+
+    with pytest.raises(ValueError, match="circulaires"):
+        pipeline.run()
+
+
+def test_step_output_is_printed_as_one_block(capsys):
+    def a():
+        console.print("a1")
+        time.sleep(0.1)
+        console.print("a2")
+
+    def b():
+        time.sleep(0.05)
+        console.print("b1")
+        time.sleep(0.1)
+        console.print("b2")
+
+    Pipeline([Step('a', a), Step('b', b)]).run()
+
+    # Sans regroupement: a1 b1 a2 b2
+    assert capsys.readouterr().out.split() == ['a1', 'a2', 'b1', 'b2']
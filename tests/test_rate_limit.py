@@ -0,0 +1,109 @@
+"""Tests des limites de débit GitHub (GitHubRateLimiter) et de leur prise en compte par le client"""
+
+import pytest
+
+from gitautoflow.core.github import GitHubClient, map_bounded
+from gitautoflow.lib import rate_limit
+from gitautoflow.lib.rate_limit import LOW_REMAINING, MAX_RATE_LIMIT_WAIT, GitHubRateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Horloge contrôlée par le test (time.time et time.sleep du module rate_limit)"""
+    class Clock:
+        now = 1000.0
+
+        def __init__(self):
+            self.slept = []
+
+        def sleep(self, seconds):
+            self.slept.append(seconds)
+            self.now += seconds
+
+    current = Clock()
+    monkeypatch.setattr(rate_limit.time, 'time', lambda: current.now)
+    monkeypatch.setattr(rate_limit.time, 'sleep', current.sleep)
+    return current
+
+
+def wait_slot(limiter):
+    with limiter.slot():
+        pass
+
+
+def test_retry_after_header_pauses_every_worker(clock):
+    limiter = GitHubRateLimiter()
+
+    delay = limiter.on_error(403, {'Retry-After': '30'}, "You have exceeded a secondary rate limit")
+    wait_slot(limiter)
+
+    assert delay == 30
+    assert clock.slept == [30]
+    assert limiter.serialized
+
+
+def test_exhausted_primary_quota_waits_for_the_reset(clock):
+    limiter = GitHubRateLimiter()
+    headers = {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(clock.now + 120)}
+
+    assert limiter.on_error(403, headers, "API rate limit exceeded") == 121
+    # Limite primaire: pas de passage en mode sérialisé
+    assert not limiter.serialized
+
+
+def test_secondary_limit_without_retry_after_doubles_the_backoff(clock):
+    limiter = GitHubRateLimiter(backoff=10)
+
+    delays = [limiter.on_error(None, None, "secondary rate limit") for _ in range(3)]
+
+    assert delays == [10, 20, 40]
+    assert limiter.on_error(429, {}, "Too Many Requests") == 80
+
+
+@pytest.mark.parametrize('status, message', [(403, "Resource not accessible by integration"),
+                                             (404, "Not Found"), (422, "Validation Failed")])
+def test_other_errors_are_not_retried(clock, status, message):
+    limiter = GitHubRateLimiter()
+
+    assert limiter.on_error(status, {'X-RateLimit-Remaining': '4000'}, message) is None
+    wait_slot(limiter)
+    assert clock.slept == []
+
+
+def test_waits_longer_than_the_maximum_are_not_retried(clock):
+    limiter = GitHubRateLimiter()
+
+    assert limiter.on_error(403, {'Retry-After': str(MAX_RATE_LIMIT_WAIT + 1)}, "secondary rate limit") is None
+
+
+def test_low_remaining_quota_spreads_the_next_requests(clock):
+    limiter = GitHubRateLimiter()
+
+    limiter.observe({'X-RateLimit-Remaining': str(LOW_REMAINING), 'X-RateLimit-Reset': str(clock.now + 100)})
+    wait_slot(limiter)
+    assert clock.slept == []
+
+    limiter.observe({'X-RateLimit-Remaining': '10', 'X-RateLimit-Reset': str(clock.now + 100)})
+    wait_slot(limiter)
+    assert clock.slept == [pytest.approx(10)]
+
+
+def test_client_retries_after_a_secondary_limit(start_github):
+    server = start_github(latency=0.05, max_concurrent=1)
+    client = GitHubClient(server.standin.tokens.copy().pop())
+    client.create_repo('standin-user', 'demo')
+
+    repos = map_bounded(lambda _: client.get_repo('standin-user/demo'), range(4), max_workers=4)
+
+    assert [repo['full_name'] for repo in repos] == ['standin-user/demo'] * 4
+    # Limite secondaire détectée: la suite de l'exécution est sérialisée
+    assert client.rate_limiter.serialized
+
+
+def test_client_waits_for_the_primary_quota_reset(start_github):
+    server = start_github(rate_limit=3, rate_window=1)
+    client = GitHubClient(server.standin.tokens.copy().pop())
+
+    logins = [client.get_user()['login'] for _ in range(5)]
+
+    assert logins == ['standin-user'] * 5
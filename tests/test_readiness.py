@@ -0,0 +1,94 @@
+"""Tests de l'attente d'un état distant (backoff exponentiel borné par une échéance)"""
+
+import pytest
+
+from gitautoflow.core.github import GitHubClient
+from gitautoflow.lib import readiness
+from gitautoflow.lib.readiness import DEFAULT_READY_TIMEOUT, MAX_POLL_INTERVAL, wait_until
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Horloge contrôlée par le test (time.monotonic et time.sleep du module readiness)"""
+    class Clock:
+        now = 0.0
+
+        def __init__(self):
+            self.slept = []
+
+        def sleep(self, seconds):
+            self.slept.append(seconds)
+            self.now += seconds
+
+    current = Clock()
+    monkeypatch.setattr(readiness.time, 'monotonic', lambda: current.now)
+    monkeypatch.setattr(readiness.time, 'sleep', current.sleep)
+    return current
+
+
+def ready_after(attempts, value='ready'):
+    calls = []
+
+    def check():
+        calls.append(1)
+        return value if len(calls) >= attempts else None
+    return check
+
+
+def test_ready_state_returns_without_waiting(clock):
+    result = wait_until(ready_after(1), "état")
+
+    assert result and result.value == 'ready'
+    assert (result.attempts, result.waited) == (1, 0)
+    assert clock.slept == []
+
+
+def test_interval_doubles_up_to_the_maximum(clock):
+    result = wait_until(ready_after(8), "état", timeout=60)
+
+    assert result.ready
+    assert result.attempts == 8
+    assert clock.slept == [0.25, 0.5, 1.0, 2.0, MAX_POLL_INTERVAL, MAX_POLL_INTERVAL, MAX_POLL_INTERVAL]
+    assert result.waited == sum(clock.slept)
+
+
+def test_deadline_stops_the_wait(clock):
+    result = wait_until(ready_after(100), "état", timeout=2)
+
+    assert not result
+    assert result.value is None
+    # Le dernier sommeil est tronqué à l'échéance
+    assert clock.slept == [0.25, 0.5, 1.0, 0.25]
+    assert result.waited == 2
+
+
+@pytest.mark.parametrize('value, expected', [('5', 5.0), ('invalide', DEFAULT_READY_TIMEOUT)])
+def test_default_timeout_comes_from_the_environment(clock, monkeypatch, value, expected):
+    monkeypatch.setenv('GITAUTOFLOW_READY_TIMEOUT', value)
+
+    result = wait_until(ready_after(1000), "état")
+
+    assert result.waited == expected
+
+
+def test_repository_becomes_ready_after_propagation(start_github):
+    server = start_github(propagation_delay=0.3)
+    client = GitHubClient(server.standin.tokens.copy().pop())
+    client.create_repo('standin-user', 'demo')
+
+    result = client.wait_repo_ready('standin-user/demo', timeout=5)
+
+    assert result and result.value['full_name'] == 'standin-user/demo'
+    assert 0.3 <= result.waited < 2
+    assert result.attempts > 1
+
+
+def test_repository_wait_gives_up_at_the_deadline(start_github):
+    server = start_github(propagation_delay=30)
+    client = GitHubClient(server.standin.tokens.copy().pop())
+    client.create_repo('standin-user', 'demo')
+
+    result = client.wait_repo_ready('standin-user/demo', timeout=0.5)
+
+    assert not result
+    assert result.waited < 2
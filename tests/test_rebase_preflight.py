@@ -0,0 +1,79 @@
+"""Tests du preflight de conflits (merge-tree) et du rebase avec --autostash"""
+
+import pytest
+
+from gitautoflow.lib.git_utils import GitUtils
+
+
+@pytest.fixture
+def feature_branch(repo, git):
+    """Branche feature avec un commit local, main avancé sur le remote"""
+    (repo / "shared.txt").write_text("base\n")
+    git('add', 'shared.txt')
+    git('commit', '-q', '-m', 'chore: shared file')
+    git('push', '-q', 'origin', 'main')
+    git('checkout', '-q', '-b', 'feature')
+    (repo / "feature.txt").write_text("feature\n")
+    git('add', 'feature.txt')
+    git('commit', '-q', '-m', 'feat: feature')
+    return repo
+
+
+def test_clean_merge_predicts_no_conflict(feature_branch, git, push_from_other_clone):
+    push_from_other_clone('main', 'other.txt')
+    git('fetch', '-q', 'origin')
+
+    assert GitUtils.predict_rebase_conflicts('main') == []
+
+
+def test_conflicting_files_are_predicted(feature_branch, git, tmp_path):
+    other = tmp_path / "other"
+    git('clone', '-q', str(tmp_path / "origin.git"), str(other))
+    (other / "shared.txt").write_text("theirs\n")
+    git('commit', '-q', '-am', 'fix: theirs', cwd=other)
+    git('push', '-q', 'origin', 'main', cwd=other)
+    (feature_branch / "shared.txt").write_text("ours\n")
+    git('commit', '-q', '-am', 'fix: ours')
+    git('fetch', '-q', 'origin')
+
+    conflicts = GitUtils.predict_rebase_conflicts('main')
+
+    if conflicts is None:
+        pytest.skip("git merge-tree --write-tree indisponible (git < 2.38)")
+    assert conflicts == ['shared.txt']
+    assert git('status', '--porcelain') == ''
+
+
+def test_unknown_branch_cannot_be_predicted(feature_branch):
+    assert GitUtils.predict_rebase_conflicts('missing') is None
+
+
+def test_rebase_keeps_uncommitted_changes(feature_branch, git, push_from_other_clone):
+    remote_sha = push_from_other_clone('main', 'other.txt')
+    (feature_branch / "feature.txt").write_text("work in progress\n")
+    (feature_branch / "untracked.txt").write_text("new\n")
+
+    assert GitUtils.rebase_on_target('main', autostash=True) is True
+
+    assert git('merge-base', '--is-ancestor', remote_sha, 'HEAD') == ''
+    assert (feature_branch / "feature.txt").read_text() == "work in progress\n"
+    assert (feature_branch / "untracked.txt").exists()
+
+
+def test_conflicting_rebase_is_aborted(feature_branch, git, tmp_path):
+    other = tmp_path / "other"
+    git('clone', '-q', str(tmp_path / "origin.git"), str(other))
+    (other / "shared.txt").write_text("theirs\n")
+    git('commit', '-q', '-am', 'fix: theirs', cwd=other)
+    git('push', '-q', 'origin', 'main', cwd=other)
+    (feature_branch / "shared.txt").write_text("ours\n")
+    git('commit', '-q', '-am', 'fix: ours')
+    head = git('rev-parse', 'HEAD')
+    (feature_branch / "feature.txt").write_text("dirty\n")
+
+    with pytest.raises(RuntimeError, match="Conflit lors du rebase sur main"):
+        GitUtils.rebase_on_target('main', autostash=True)
+
+    assert git('rev-parse', 'HEAD') == head
+    assert (feature_branch / "feature.txt").read_text() == "dirty\n"
+    assert not (feature_branch / ".git" / "rebase-merge").exists()
@@ -0,0 +1,102 @@
+"""Tests de l'index des refs (un seul for-each-ref, tri semver, suivi, push)"""
+
+from conftest import ledger_commands
+from gitautoflow.lib.ref_index import RefIndex, _semver_key
+
+
+def test_semver_ordering():
+    tags = ['v1.2.0', 'v1.10.0', 'v1.2.0-rc1', 'vv1.9.9', 'release-2', 'v0.9.0', '2.0.0']
+
+    ordered = sorted((tag for tag in tags if _semver_key(tag)), key=_semver_key, reverse=True)
+
+    assert ordered == ['2.0.0', 'v1.10.0', 'vv1.9.9', 'v1.2.0', 'v1.2.0-rc1', 'v0.9.0']
+    assert _semver_key('release-2') is None
+
+
+def test_everything_is_resolved_from_one_for_each_ref(repo, git):
+    git('checkout', '-q', '-b', 'feature')
+    git('tag', 'v1.0.0')
+    git('tag', 'v1.1.0')
+    index = RefIndex()
+
+    assert index.current_branch == 'feature'
+    assert index.has_branch('main') and index.has_branch('feature')
+    assert index.has_remote_branch('main') and not index.has_remote_branch('feature')
+    assert index.branch_sha('main', remote=True) == git('rev-parse', 'origin/main')
+    assert index.semver_tags() == ['v1.1.0', 'v1.0.0']
+    assert index.latest_tag() == 'v1.1.0'
+
+    assert len(ledger_commands('git', 'for-each-ref')) == 1
+
+
+def test_detached_head_has_no_current_branch(repo, git):
+    git('checkout', '-q', '--detach')
+
+    assert RefIndex().current_branch == ''
+
+
+def test_tracking_state(repo, git):
+    git('checkout', '-q', '-b', 'feature')
+    git('push', '-q', '-u', 'origin', 'feature')
+    (repo / "new.txt").write_text("x\n")
+    git('add', 'new.txt')
+    git('commit', '-q', '-m', 'feat: new')
+    git('branch', 'local-only')
+
+    index = RefIndex()
+
+    assert index.tracking('feature') == ('origin/feature', 'ahead 1')
+    assert index.tracking('main') == ('origin/main', '')
+    assert index.tracking('local-only') is None
+
+
+def test_invalidate_reloads_the_refs(repo, git):
+    index = RefIndex()
+    assert index.semver_tags() == []
+
+    git('tag', 'v2.0.0')
+    assert index.semver_tags() == []
+    index.invalidate()
+    assert index.semver_tags() == ['v2.0.0']
+
+
+def test_latest_tag_reachable_from_a_branch(repo, git):
+    git('tag', 'v1.0.0')
+    git('checkout', '-q', '-b', 'experiment')
+    git('commit', '-q', '--allow-empty', '-m', 'feat: experiment')
+    git('tag', 'v3.0.0')
+    git('checkout', '-q', 'main')
+    index = RefIndex()
+
+    assert index.latest_tag() == 'v3.0.0'
+    assert index.latest_tag(reachable_from='main') == 'v1.0.0'
+    assert index.latest_tag(reachable_from='experiment') == 'v3.0.0'
+    assert index.latest_tag(reachable_from='missing') is None
+
+
+def test_latest_tag_is_cached_per_ref(repo, git):
+    git('tag', 'v1.0.0')
+    index = RefIndex()
+
+    index.latest_tag(reachable_from='main')
+    index.latest_tag(reachable_from='main')
+
+    assert len(ledger_commands('git', 'merge-base')) == 1
+
+
+def test_is_pushed_reads_the_remote(repo, git):
+    git('checkout', '-q', '-b', 'feature')
+    index = RefIndex()
+    assert not index.is_pushed('feature')
+
+    git('push', '-q', 'origin', 'feature')
+    assert index.is_pushed('feature')
+
+    # Ref de suivi encore présente mais branche supprimée sur le remote
+    git('push', '-q', 'origin', '--delete', 'feature')
+    git('update-ref', 'refs/remotes/origin/feature', 'HEAD')
+    assert not RefIndex().is_pushed('feature')
+
+
+def test_unknown_branch_is_not_pushed(repo):
+    assert not RefIndex().is_pushed('missing')
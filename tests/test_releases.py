@@ -0,0 +1,119 @@
+"""Tests de la création de release: tag annoté créé par l'API sur le commit de merge"""
+
+import subprocess
+
+import pytest
+from typer.testing import CliRunner
+
+from conftest import ledger_commands
+from gitautoflow.cli.releases import (app as releases_app, create_github_release, merge_pr_immediately,
+                                      tag_signing_required)
+from gitautoflow.core.github import get_github_client
+
+REPO = 'standin-user/demo'
+RELEASE = {'version': 'vv1.1.0', 'minor_changes': ['Export CSV'], 'patch_changes': ['Correction du tri']}
+
+
+def bare(github, *args):
+    git_dir = f"{github.standin.git_root}/{REPO}.git"
+    return subprocess.run(['git', '--git-dir', git_dir, *args], capture_output=True, text=True).stdout.strip()
+
+
+def push_to_develop(git, clone, filename, content):
+    (clone / filename).write_text(content)
+    git('add', filename, cwd=clone)
+    git('commit', '--quiet', '-m', f"feat: {filename}", cwd=clone)
+    git('push', '--quiet', 'origin', 'HEAD:develop', cwd=clone)
+
+
+def make_conflict(git, clone):
+    """develop et main modifient le même fichier: la PR de release n'est pas mergeable"""
+    push_to_develop(git, clone, 'README.md', '# develop\n')
+    git('reset', '--quiet', '--hard', 'HEAD~1', cwd=clone)
+    (clone / "README.md").write_text("# main\n")
+    git('commit', '--quiet', '-am', 'docs: main', cwd=clone)
+    git('push', '--quiet', 'origin', 'HEAD:main', cwd=clone)
+
+
+@pytest.fixture
+def release_pull(github_repo, git):
+    push_to_develop(git, github_repo, 'export.py', 'export = True\n')
+    return get_github_client().create_pull(REPO, head='develop', base='main', title='Release v1.1.0', body='')
+
+
+def test_release_tags_the_merge_commit(github, release_pull):
+    merge_sha = merge_pr_immediately(release_pull['html_url'], 'merge')
+
+    assert merge_sha == bare(github, 'rev-parse', 'refs/heads/main')
+    assert create_github_release(RELEASE, merge_sha, previous_tag='v1.0.0')
+
+    # Tag annoté (objet tag) sur le commit de merge, pas sur la pointe de develop
+    assert bare(github, 'cat-file', '-t', 'refs/tags/v1.1.0') == 'tag'
+    assert bare(github, 'rev-parse', 'v1.1.0^{commit}') == merge_sha
+    assert bare(github, 'tag', '-l', '--format=%(contents:subject)', 'v1.1.0') == 'Release v1.1.0'
+    release = github.standin.repos[REPO]['releases']['v1.1.0']
+    assert '- Export CSV' in release['body'] and '- Correction du tri' in release['body']
+    assert 'compare/v1.0.0...v1.1.0' in release['body']
+    # Aucun tag local, aucun push, aucun fetch
+    assert ledger_commands('git', 'tag') == [] and ledger_commands('git', 'push') == []
+    assert ledger_commands('git', 'fetch') == []
+
+
+def test_release_without_merge_sha_creates_nothing(github, github_repo):
+    assert not create_github_release(RELEASE, None, previous_tag='v1.0.0')
+
+    assert github.standin.repos[REPO]['releases'] == {}
+    assert bare(github, 'tag', '-l') == ''
+    assert github.standin.stats['POST /repos/{owner}/{repo}/git/tags'] == 0
+
+
+def test_failed_merge_returns_no_sha(github, github_repo, git):
+    make_conflict(git, github_repo)
+    pull = get_github_client().create_pull(REPO, head='develop', base='main', title='Release', body='')
+
+    assert merge_pr_immediately(pull['html_url'], 'merge') is None
+    assert github.standin.repos[REPO]['issues'][pull['number']]['pull']['merged'] is False
+
+
+def test_release_auto_stops_when_the_merge_fails(github, github_repo, git, fake_ai):
+    make_conflict(git, github_repo)
+    fake_ai['analyze_for_release'] = {
+        'release': {'version': 'v0.1.0', 'version_type': 'minor', 'minor_changes': ['Export']},
+        'pr': {'title': 'Release v0.1.0', 'body': 'Release', 'labels': []},
+    }
+
+    result = CliRunner().invoke(releases_app, ['auto', '--force'])
+
+    assert result.exit_code == 1, result.output
+    assert 'non créée' in result.output
+    assert github.standin.repos[REPO]['releases'] == {}
+    assert bare(github, 'tag', '-l') == ''
+
+
+def test_signed_tag_is_required_by_option_or_git_config(github_repo, git):
+    assert not tag_signing_required()
+    assert tag_signing_required(sign_tag=True)
+
+    git('config', 'tag.gpgSign', 'true')
+    assert tag_signing_required()
+
+
+def test_release_auto_leaves_the_working_tree_untouched(github, github_repo, git, fake_ai):
+    push_to_develop(git, github_repo, 'export.py', 'export = True\n')
+    git('checkout', '--quiet', '-b', 'feature/wip', 'main', cwd=github_repo)
+    (github_repo / "README.md").write_text("# travail en cours\n")
+    fake_ai['analyze_for_release'] = {
+        'release': {'version': 'v9.0.0', 'version_type': 'major', 'minor_changes': ['Export']},
+        'pr': {'title': 'Release v0.1.0', 'body': 'Release', 'labels': []},
+    }
+
+    result = CliRunner().invoke(releases_app, ['auto', '--force'])
+
+    assert result.exit_code == 0, result.output
+    # Conventional commits (feat) depuis v0.0.0: la version calculée localement prime sur l'IA
+    assert list(github.standin.repos[REPO]['releases']) == ['v0.1.0']
+    assert bare(github, 'rev-parse', 'v0.1.0^{commit}') == bare(github, 'rev-parse', 'refs/heads/main')
+    # Branche courante et modifications locales intactes, aucun checkout
+    assert git('branch', '--show-current', cwd=github_repo) == 'feature/wip'
+    assert (github_repo / "README.md").read_text() == "# travail en cours\n"
+    assert not [cmd for cmd in ledger_commands('git') if cmd[1] in ('checkout', 'switch', 'pull', 'stash')]
@@ -0,0 +1,57 @@
+"""Tests du bootstrap d'un repository vide (commits locaux et un seul push atomique)"""
+
+import subprocess
+
+import pytest
+
+from conftest import ledger_commands
+from gitautoflow.cli.repos import bootstrap_repository, setup_local_repo
+from gitautoflow.core.github import get_github_client
+
+REPO = 'standin-user/demo'
+
+
+def bare(github, *args):
+    git_dir = f"{github.standin.git_root}/{REPO}.git"
+    return subprocess.run(['git', '--git-dir', git_dir, *args], capture_output=True, text=True).stdout.strip()
+
+
+@pytest.fixture
+def empty_clone(github, tmp_path):
+    get_github_client().create_repo('standin-user', 'demo')
+    return setup_local_repo('demo', f"https://github.com/{REPO}.git", str(tmp_path / "workspace"))
+
+
+def test_bootstrap_pushes_branches_and_tag_at_once(github, empty_clone, git):
+    assert bootstrap_repository(empty_clone, 'demo')
+
+    main = bare(github, 'rev-parse', 'refs/heads/main')
+    assert bare(github, 'rev-parse', 'refs/heads/develop') == main
+    assert bare(github, 'rev-parse', 'v0.1.0^{commit}') == main
+    assert bare(github, 'log', '--format=%s', 'main').splitlines() == ['feat: Add README.md', 'Initial commit']
+    assert '# demo' in bare(github, 'show', 'main:README.md')
+    # Un seul push, aucune PR
+    assert len(ledger_commands('git', 'push')) == 1
+    assert github.standin.stats['POST /repos/{owner}/{repo}/pulls'] == 0
+    assert git('branch', '--show-current', cwd=empty_clone) == 'develop'
+    assert git('rev-parse', '--abbrev-ref', 'develop@{upstream}', cwd=empty_clone) == 'origin/develop'
+
+
+def test_rejected_ref_leaves_the_remote_untouched(github, empty_clone):
+    hook = f"{github.standin.git_root}/{REPO}.git/hooks/update"
+    with open(hook, 'w') as f:
+        f.write('#!/bin/sh\n[ "$1" != "refs/heads/develop" ]\n')
+    subprocess.run(['chmod', '+x', hook], check=True)
+
+    assert not bootstrap_repository(empty_clone, 'demo')
+
+    # Push atomique: main et le tag ne sont pas publiés sans develop
+    assert bare(github, 'for-each-ref') == ''
+
+
+def test_existing_clone_is_reused(github, empty_clone, tmp_path):
+    (tmp_path / "workspace" / "demo" / "notes.txt").write_text("local\n")
+
+    assert setup_local_repo('demo', f"https://github.com/{REPO}.git", str(tmp_path / "workspace")) == empty_clone
+    assert (tmp_path / "workspace" / "demo" / "notes.txt").exists()
+    assert len(ledger_commands('git', 'clone')) == 1
@@ -0,0 +1,99 @@
+"""Tests du scan gitleaks groupé (un processus par lot, attribution des findings)"""
+
+import pytest
+
+from conftest import ledger_commands
+from gitautoflow.cli.commits import run_gitleaks_scan_all_modified
+from gitautoflow.lib.secret_scan import blob_sha, list_modified_files, scan_files
+
+
+def detect_calls(calls):
+    return [argv for argv in calls() if argv[0] == 'detect']
+
+
+def write_files(root, count, secret_index=None):
+    files = []
+    for index in range(count):
+        path = root / "pkg" / f"module_{index}.py"
+        path.parent.mkdir(exist_ok=True)
+        content = "TOKEN = 'FAKE_SECRET'\n" if index == secret_index else "VALUE = 1\n"
+        path.write_text(f"import os\n{content}")
+        files.append(f"pkg/module_{index}.py")
+    return files
+
+
+def test_list_modified_files_in_one_status_call(repo, git):
+    for name in ('old.txt', 'gone.txt'):
+        (repo / name).write_text(f"{name}\n")
+    git('add', 'old.txt', 'gone.txt')
+    git('commit', '-q', '-m', 'add files')
+
+    (repo / "README.md").write_text("changed\n")
+    (repo / "staged.txt").write_text("staged\n")
+    git('add', 'staged.txt')
+    git('mv', 'old.txt', 'renamed.txt')
+    git('rm', '-q', 'gone.txt')
+    (repo / "new" / "deep").mkdir(parents=True)
+    (repo / "new" / "deep" / "file.txt").write_text("untracked\n")
+
+    assert sorted(list_modified_files(str(repo))) == [
+        'README.md', 'new/deep/file.txt', 'renamed.txt', 'staged.txt'
+    ]
+    assert len(ledger_commands('git', 'status')) == 1
+
+
+def test_one_gitleaks_process_per_batch(tmp_path, fake_gitleaks):
+    files = write_files(tmp_path, 5)
+
+    assert scan_files('gitleaks', files, str(tmp_path), batch_size=2) == []
+    assert len(detect_calls(fake_gitleaks)) == 3
+
+
+def test_findings_are_attributed_to_their_file(tmp_path, fake_gitleaks):
+    files = write_files(tmp_path, 3, secret_index=1)
+
+    (finding,) = scan_files('gitleaks', files, str(tmp_path))
+
+    assert (finding.file, finding.line, finding.rule) == ('pkg/module_1.py', 2, 'fake-rule')
+    assert str(finding) == "pkg/module_1.py:2 [fake-rule] Fake secret"
+
+
+def test_scan_stops_at_the_first_batch_with_a_secret(tmp_path, fake_gitleaks):
+    files = write_files(tmp_path, 6, secret_index=0)
+    clean_batches = []
+
+    findings = scan_files('gitleaks', files, str(tmp_path), batch_size=2, on_clean=clean_batches.append)
+
+    assert [finding.file for finding in findings] == ['pkg/module_0.py']
+    assert len(detect_calls(fake_gitleaks)) == 1
+    assert clean_batches == [['pkg/module_1.py']]
+
+
+def test_gitleaks_failure_is_an_error(tmp_path, fake_gitleaks, monkeypatch):
+    files = write_files(tmp_path, 1)
+    monkeypatch.setenv('FAKE_GITLEAKS_FAIL', '1')
+
+    with pytest.raises(RuntimeError, match="config invalide"):
+        scan_files('gitleaks', files, str(tmp_path))
+
+
+def test_blob_sha_matches_git(tmp_path, git):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"\x00binary\ncontent")
+
+    assert blob_sha(str(path)) == git('hash-object', '--no-filters', str(path))
+
+
+def test_all_modified_files_are_scanned_together(repo, fake_gitleaks):
+    write_files(repo, 4)
+    (repo / "README.md").write_text("# demo\nchanged\n")
+
+    assert run_gitleaks_scan_all_modified() is True
+    (detect,) = detect_calls(fake_gitleaks)
+    assert '--no-git' in detect
+
+
+def test_secret_blocks_the_commit(repo, fake_gitleaks):
+    write_files(repo, 3, secret_index=2)
+
+    assert run_gitleaks_scan_all_modified() is False
@@ -0,0 +1,109 @@
+"""Tests du traçage --profile (spans imbriqués, export Chrome trace)"""
+
+import json
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from gitautoflow.lib.pipeline import Pipeline, Step
+from gitautoflow.lib.tracing import PROFILE_OPTION, Tracer, get_tracer, profile_session, profiled, span
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer()
+
+    with tracer.span("noop") as current:
+        current.set(ignored=True)
+
+    assert tracer.spans == []
+
+
+def test_spans_are_nested_and_keep_attributes():
+    tracer = Tracer()
+    tracer.enable()
+
+    with tracer.span("command", "command"):
+        with tracer.span("git status", "subprocess", returncode=0) as child:
+            child.set(stdout_bytes=12)
+
+    root, child = tracer.spans
+    assert child.parent is root and root.children == [child]
+    assert child.attrs == {'returncode': 0, 'stdout_bytes': 12}
+    assert root.end is not None and root.duration >= child.duration
+
+
+def test_failing_span_records_the_error():
+    tracer = Tracer()
+    tracer.enable()
+
+    with pytest.raises(KeyError):
+        with tracer.span("lookup"):
+            raise KeyError("x")
+
+    assert tracer.spans[0].attrs == {'error': 'KeyError'}
+
+
+def test_chrome_trace_export(tmp_path):
+    tracer = Tracer()
+    tracer.enable()
+    with tracer.span("command", "command", path=tmp_path, args=('a', 1)):
+        pass
+
+    path = tmp_path / "trace.json"
+    tracer.write_chrome_trace(str(path))
+    trace = json.loads(path.read_text())
+
+    metadata, event = trace['traceEvents']
+    assert metadata['ph'] == 'M'
+    assert event['name'] == 'command' and event['cat'] == 'command' and event['ph'] == 'X'
+    assert event['args'] == {'path': str(tmp_path), 'args': ['a', 1]}
+    assert event['dur'] >= 0
+
+
+def test_profile_session_traces_pipeline_threads(tmp_path):
+    path = tmp_path / "trace.json"
+
+    def step():
+        with span("git status", "subprocess"):
+            pass
+
+    with profile_session(str(path), "auto-commit"):
+        Pipeline([Step('a', step), Step('b', step)]).run()
+
+    tracer = get_tracer()
+    assert not tracer.enabled
+    (root,) = [s for s in tracer.spans if s.parent is None]
+    assert root.name == 'auto-commit'
+    assert sorted(child.name for child in root.children) == ['a', 'b']
+    assert all(step_span.children[0].name == 'git status' for step_span in root.children)
+
+    events = [e for e in json.loads(path.read_text())['traceEvents'] if e['ph'] == 'X']
+    assert len(events) == 5
+
+
+def test_profile_option_on_a_command(tmp_path):
+    app = typer.Typer()
+
+    @app.command()
+    @profiled("demo")
+    def demo(profile: str = PROFILE_OPTION):
+        with span("work"):
+            pass
+
+    path = tmp_path / "trace.json"
+    result = CliRunner().invoke(app, ['--profile', str(path)])
+
+    assert result.exit_code == 0, result.output
+    names = [e['name'] for e in json.loads(path.read_text())['traceEvents'] if e['ph'] == 'X']
+    assert names == ['demo', 'work']
+
+
+def test_without_profile_nothing_is_traced():
+    recorded = list(get_tracer().spans)
+
+    with profile_session(None, "demo"):
+        with span("work"):
+            pass
+
+    assert get_tracer().spans == recorded
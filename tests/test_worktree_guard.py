@@ -0,0 +1,73 @@
+"""Tests du garde-fou de taille du working tree"""
+
+from gitautoflow.lib.worktree_guard import WorktreeBudget, take_snapshot
+
+
+def make_files(directory, count, size=10):
+    directory.mkdir(parents=True, exist_ok=True)
+    for index in range(count):
+        (directory / f"file_{index}.js").write_bytes(b"x" * size)
+
+
+def test_snapshot_lists_modified_and_untracked_files(repo):
+    (repo / "README.md").write_text("changed\n")
+    make_files(repo / "src", 2)
+    make_files(repo / "build", 3)
+    (repo / ".gitignore").write_text("build/\n")
+
+    snapshot = take_snapshot(str(repo), WorktreeBudget(10, 10_000, 1_000))
+
+    assert snapshot.ok and not snapshot.truncated
+    assert sorted(snapshot.files) == ['.gitignore', 'README.md', 'src/file_0.js', 'src/file_1.js']
+    assert snapshot.total_bytes == sum((repo / path).stat().st_size for path in snapshot.files)
+
+
+def test_too_many_files_stops_the_listing(repo):
+    make_files(repo / "node_modules" / "pkg", 200)
+    make_files(repo / "src", 1)
+
+    snapshot = take_snapshot(str(repo), WorktreeBudget(max_files=20, max_total_bytes=0, max_file_bytes=0))
+
+    assert not snapshot.ok and snapshot.truncated
+    assert len(snapshot.files) == 21
+    assert snapshot.violations == ["Plus de 20 fichiers modifiés ou untracked"]
+    assert any(line.startswith("  📁 node_modules/: ") and "+ fichier(s)" in line
+               for line in snapshot.summary_lines())
+
+
+def test_total_size_budget(repo):
+    make_files(repo / "data", 5, size=1024)
+
+    snapshot = take_snapshot(str(repo), WorktreeBudget(max_files=0, max_total_bytes=3000, max_file_bytes=0))
+
+    assert snapshot.violations == ["Plus de 3 Ko de fichiers modifiés ou untracked"]
+    assert snapshot.total_bytes > 3000 and len(snapshot.files) < 5
+
+
+def test_oversized_files_are_reported(repo):
+    (repo / "dump.sql").write_bytes(b"x" * 4096)
+    make_files(repo / "src", 2)
+
+    snapshot = take_snapshot(str(repo), WorktreeBudget(max_files=0, max_total_bytes=0, max_file_bytes=2048))
+
+    assert not snapshot.ok and not snapshot.truncated
+    assert snapshot.oversized == [('dump.sql', 4096)]
+    assert snapshot.violations == ["1 fichier(s) de plus de 2 Ko"]
+    assert "  📄 dump.sql: 4 Ko" in snapshot.summary_lines()
+
+
+def test_budgets_from_environment(monkeypatch):
+    monkeypatch.setenv('GITAUTOFLOW_MAX_FILES', '7')
+    monkeypatch.setenv('GITAUTOFLOW_MAX_TOTAL_BYTES', 'abc')
+
+    budget = WorktreeBudget()
+
+    assert budget.max_files == 7
+    assert budget.max_total_bytes == 200 * 1024 * 1024
+    assert WorktreeBudget(max_files=0).max_files == 0
+
+
+def test_zero_means_unlimited(repo):
+    make_files(repo / "many", 50, size=100)
+
+    assert take_snapshot(str(repo), WorktreeBudget(0, 0, 0)).ok